@@ -0,0 +1,260 @@
+import os
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.responses import FileResponse
+
+from backend.app.api import metrics
+from backend.app.api.uploads import max_upload_bytes_from_env, save_upload
+
+from backend.app.converters.pdf_to_word import (
+    ocr_available,
+    parse_ocr_mode,
+    pdf_to_word_no_ocr,
+    pdf_to_word_ocr,
+)
+from backend.app.core.extraction import DEFAULT_EXTRACTION_PROFILE, EXTRACTION_PROFILES
+from backend.app.utils.pages import parse_pages
+
+
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_QUEUE_DEPTH = 16
+JOB_TTL_SECONDS = 60 * 60
+
+
+@dataclass
+class Job:
+    id: str
+    filename: str
+    ocr_mode: str
+    pages: object
+    in_path: str
+    out_path: str
+    extraction: str = DEFAULT_EXTRACTION_PROFILE
+
+    status: str = "queued"      # queued -> running -> done | failed
+    pages_done: int = 0
+    pages_total: int = 0
+    error: str = ""
+    created: float = field(default_factory=time.time)
+    finished: float = 0.0
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "error": self.error or None,
+        }
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class JobManager:
+    """
+    Runs conversions on a bounded thread pool.
+
+    At most `workers` jobs run at once and at most `queue_depth` more may
+    wait; submit() raises QueueFullError beyond that so the API can answer
+    429 instead of letting latency grow without bound.
+
+    Finished jobs and their output files are dropped JOB_TTL_SECONDS
+    after they finish: a timer per job covers idle servers, and submit()
+    and get() sweep as well.
+    """
+
+    def __init__(self, workers=DEFAULT_JOB_WORKERS, queue_depth=DEFAULT_JOB_QUEUE_DEPTH):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.jobs = {}
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="convert-job"
+        )
+
+    def submit(self, job):
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError()
+
+        self._expire_finished()
+        with self._lock:
+            self.jobs[job.id] = job
+        metrics.jobs_in_queue.inc(state="queued")
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        self._expire_finished()
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def _run(self, job):
+        def progress(done, total):
+            job.pages_done = done
+            job.pages_total = total
+
+        job.status = "running"
+        metrics.jobs_in_queue.dec(state="queued")
+        metrics.jobs_in_queue.inc(state="running")
+        started = time.perf_counter()
+        try:
+            if job.ocr_mode == "off":
+                decision_log = pdf_to_word_no_ocr(
+                    job.in_path, job.out_path, pages=job.pages, progress=progress,
+                    extraction=job.extraction
+                )
+            else:
+                decision_log = pdf_to_word_ocr(
+                    job.in_path, job.out_path, pages=job.pages, progress=progress,
+                    auto=job.ocr_mode == "auto", extraction=job.extraction
+                )
+        except Exception as e:
+            print(f"\n=== JOB {job.id} FAILED ===")
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = "failed"
+            metrics.record_conversion("jobs", job.ocr_mode, started, status="error")
+        else:
+            job.status = "done"
+            metrics.record_conversion("jobs", job.ocr_mode, started, decision_log)
+            metrics.temp_files.add(job.out_path)
+        finally:
+            job.finished = time.time()
+            _remove(job.in_path)
+            metrics.jobs_in_queue.dec(state="running")
+            self._slots.release()
+            sweep = threading.Timer(JOB_TTL_SECONDS, self._expire_finished)
+            sweep.daemon = True
+            sweep.start()
+
+    def _expire_finished(self):
+        cutoff = time.time() - JOB_TTL_SECONDS
+        with self._lock:
+            expired = [
+                j for j in self.jobs.values()
+                if j.finished and j.finished <= cutoff
+            ]
+            for j in expired:
+                del self.jobs[j.id]
+        for j in expired:
+            _remove(j.out_path)
+
+
+def _remove(path):
+    metrics.temp_files.discard(path)
+    if os.path.exists(path):
+        try:
+            os.remove(path)
+        except Exception:
+            pass
+
+
+def manager_from_env():
+    return JobManager(
+        workers=int(os.environ.get("PDF_CONVERTER_JOB_WORKERS", DEFAULT_JOB_WORKERS)),
+        queue_depth=int(
+            os.environ.get("PDF_CONVERTER_JOB_QUEUE_DEPTH", DEFAULT_JOB_QUEUE_DEPTH)
+        ),
+    )
+
+
+job_manager = manager_from_env()
+router = APIRouter()
+
+
+@router.post("/jobs", status_code=202)
+async def create_job(
+    file: UploadFile = File(...),
+    use_ocr: str = Form("false"),
+    pages: str = Form("all"),
+    extraction: str = Form(DEFAULT_EXTRACTION_PROFILE),
+):
+    if not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+
+    try:
+        ocr_mode = parse_ocr_mode(use_ocr)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="use_ocr must be true, false or auto.")
+
+    if ocr_mode == "on" and not ocr_available():
+        raise HTTPException(status_code=500, detail="OCR is requested but pytesseract is not installed.")
+
+    try:
+        page_selection = parse_pages(pages)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid page selection: {pages}")
+
+    if extraction not in EXTRACTION_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown extraction profile: {extraction}")
+
+    fd_in, in_path = tempfile.mkstemp(suffix=".pdf")
+    fd_out, out_path = tempfile.mkstemp(suffix=".docx")
+    os.close(fd_in)
+    os.close(fd_out)
+
+    try:
+        size, _ = await save_upload(file, in_path, max_upload_bytes_from_env())
+    except Exception:
+        _remove(in_path)
+        _remove(out_path)
+        raise
+    metrics.upload_bytes.observe(size)
+    metrics.temp_files.add(in_path)
+
+    job = Job(
+        id=uuid.uuid4().hex,
+        filename=file.filename.rsplit(".", 1)[0] + ".docx",
+        ocr_mode=ocr_mode,
+        pages=page_selection,
+        in_path=in_path,
+        out_path=out_path,
+        extraction=extraction,
+    )
+
+    try:
+        job_manager.submit(job)
+    except QueueFullError:
+        _remove(in_path)
+        _remove(out_path)
+        raise HTTPException(
+            status_code=429,
+            detail="Conversion queue is full, retry later.",
+            headers={"Retry-After": "5"},
+        )
+
+    return job.to_dict()
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job.")
+    return job.to_dict()
+
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job.")
+
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"Conversion failed: {job.error}")
+
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}.")
+
+    return FileResponse(job.out_path, filename=job.filename)
@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from collections import Counter as _Tally
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.app.utils.metrics import MetricsRegistry
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+registry = MetricsRegistry()
+
+conversions_total = registry.counter(
+    "pdf_converter_conversions_total",
+    "Conversions by entry point, OCR mode and outcome (ok, error, cached).",
+    ("endpoint", "ocr_mode", "status"),
+)
+conversion_seconds = registry.histogram(
+    "pdf_converter_conversion_seconds",
+    "Wall time of one conversion.",
+    (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+    ("ocr_mode",),
+)
+conversion_pages_per_second = registry.histogram(
+    "pdf_converter_conversion_pages_per_second",
+    "Throughput of one conversion in pages per second.",
+    (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 200),
+    ("ocr_mode",),
+)
+pages_total = registry.counter(
+    "pdf_converter_pages_total",
+    "Converted pages by detected mode and text engine.",
+    ("mode", "engine"),
+)
+upload_bytes = registry.histogram(
+    "pdf_converter_upload_bytes",
+    "Size of uploaded PDFs.",
+    [2 ** p for p in range(16, 30, 2)],    # 64 KiB .. 256 MiB
+)
+tempfile_bytes = registry.gauge(
+    "pdf_converter_tempfile_bytes_in_flight",
+    "Bytes held in request/job temp files that have not been removed yet.",
+)
+jobs_in_queue = registry.gauge(
+    "pdf_converter_jobs",
+    "Background jobs currently queued or running.",
+    ("state",),
+)
+http_responses_total = registry.counter(
+    "pdf_converter_http_responses_total",
+    "HTTP responses by status class; unhandled exceptions count as 5xx.",
+    ("status",),
+)
+
+
+class TempFileBytes:
+    """
+    Tracks the temp-file gauge per path, so removing a file subtracts
+    exactly what was added for it even if it changed size in between.
+    """
+
+    def __init__(self, gauge):
+        self.gauge = gauge
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def add(self, path):
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        with self._lock:
+            delta = size - self._sizes.get(path, 0)
+            self._sizes[path] = size
+        self.gauge.inc(delta)
+
+    def discard(self, path):
+        with self._lock:
+            size = self._sizes.pop(path, 0)
+        self.gauge.dec(size)
+
+
+temp_files = TempFileBytes(tempfile_bytes)
+
+
+def record_conversion(endpoint, ocr_mode, started, decision_log=None, status="ok"):
+    """Record one finished conversion; started is a time.perf_counter() value."""
+    conversions_total.inc(endpoint=endpoint, ocr_mode=ocr_mode, status=status)
+    if status == "cached":
+        return
+
+    elapsed = time.perf_counter() - started
+    conversion_seconds.observe(elapsed, ocr_mode=ocr_mode)
+
+    if not decision_log:
+        return
+
+    modes = _Tally((e["mode"], e.get("engine", "text-layer")) for e in decision_log)
+    for (mode, engine), count in modes.items():
+        pages_total.inc(count, mode=mode, engine=engine)
+
+    if elapsed > 0:
+        conversion_pages_per_second.observe(
+            len(decision_log) / elapsed, ocr_mode=ocr_mode
+        )
+
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
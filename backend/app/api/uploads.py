@@ -0,0 +1,87 @@
+import hashlib
+import os
+
+from fastapi import HTTPException
+
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_UPLOAD_BYTES = 256 * 1024 * 1024
+
+# Room for the multipart boundaries and form fields around the file.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def max_upload_bytes_from_env():
+    """PDF_CONVERTER_MAX_UPLOAD_BYTES; 0 disables the limit."""
+    return int(os.environ.get("PDF_CONVERTER_MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES))
+
+
+def _too_large(max_bytes):
+    return HTTPException(
+        status_code=413,
+        detail=f"Upload exceeds the {max_bytes} byte limit.",
+    )
+
+
+async def save_upload(upload, path, max_bytes=None, chunk_size=UPLOAD_CHUNK_SIZE):
+    """
+    Copy an UploadFile to `path` chunk by chunk, hashing as it goes.
+
+    Returns (size, sha256 hexdigest). Raises 413 as soon as more than
+    max_bytes have been read; the partial file is left for the caller's
+    usual cleanup.
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    with open(path, "wb") as f:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            f.write(chunk)
+
+    return size, digest.hexdigest()
+
+
+class UploadLimitMiddleware:
+    """
+    Rejects oversized request bodies before they are spooled.
+
+    A Content-Length above the limit is refused on the first body read;
+    bodies without one are counted as they stream in and refused as soon
+    as they cross it. Either way the 413 surfaces as an HTTPException from
+    the request's receive channel, which FastAPI turns into a response.
+    """
+
+    def __init__(self, app, max_bytes=None):
+        self.app = app
+        self.max_bytes = max_upload_bytes_from_env() if max_bytes is None else max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.max_bytes:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.max_bytes + MULTIPART_OVERHEAD_BYTES
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        declared = int(length) if length.isdigit() else None
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            if declared is not None and declared > limit:
+                raise _too_large(self.max_bytes)
+
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise _too_large(self.max_bytes)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,263 @@
+"""
+Batch conversion: many PDFs in one process tree.
+
+Inputs come from a directory glob or a manifest file. Documents are
+converted in parallel worker processes that import the converter once,
+outputs that are already newer than their PDF are skipped (so a restarted
+batch resumes where it stopped), failures are appended to a JSONL error
+log without stopping the batch (a worker process that dies outright
+only fails the document that killed it), and a summary with throughput figures is
+returned (and optionally written as JSON).
+"""
+import glob
+import json
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+from backend.app.converters.pdf_to_word import pdf_to_word_no_ocr, pdf_to_word_ocr
+from backend.app.core.extraction import DEFAULT_EXTRACTION_PROFILE
+
+
+PARTIAL_SUFFIX = ".part"
+
+
+def inputs_from_dir(input_dir, pattern="**/*.pdf"):
+    """PDFs under input_dir matching a (recursive) glob, in sorted order."""
+    paths = glob.glob(os.path.join(input_dir, pattern), recursive=True)
+    return sorted(p for p in paths if os.path.isfile(p))
+
+
+def read_manifest(path):
+    """
+    Manifest lines are `input.pdf` or `input.pdf<TAB>output.docx`; blank
+    lines and lines starting with # are ignored. Relative paths are taken
+    relative to the manifest's directory.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            parts = line.split("\t")
+            src = os.path.join(base, parts[0].strip())
+            dst = os.path.join(base, parts[1].strip()) if len(parts) > 1 and parts[1].strip() else None
+            entries.append((src, dst))
+    return entries
+
+
+def output_path_for(input_path, output_dir, input_root=None):
+    """Mirror input_root's layout under output_dir, with a .docx suffix."""
+    if input_root:
+        rel = os.path.relpath(input_path, input_root)
+    else:
+        rel = os.path.basename(input_path)
+    return os.path.join(output_dir, os.path.splitext(rel)[0] + ".docx")
+
+
+def is_up_to_date(input_path, output_path):
+    return (
+        os.path.exists(output_path)
+        and os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+    )
+
+
+def convert_document(task):
+    """
+    Convert one PDF (runs in a worker process). Never raises: returns a
+    result dict with status "converted" or "failed".
+
+    The .docx is written to a .part file and renamed into place, so an
+    interrupted batch never leaves a truncated output that looks done.
+    """
+    input_path = task["input"]
+    output_path = task["output"]
+    partial = output_path + PARTIAL_SUFFIX
+    started = time.perf_counter()
+
+    try:
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        if task["ocr_mode"] == "off":
+            log = pdf_to_word_no_ocr(
+                input_path, partial, pages=task["pages"],
+                image_options=task["image_options"],
+                extraction=task["extraction"]
+            )
+        else:
+            log = pdf_to_word_ocr(
+                input_path, partial, pages=task["pages"], workers=1,
+                auto=task["ocr_mode"] == "auto",
+                image_options=task["image_options"],
+                extraction=task["extraction"]
+            )
+        os.replace(partial, output_path)
+    except Exception as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+        return {
+            "input": input_path,
+            "output": output_path,
+            "status": "failed",
+            "seconds": time.perf_counter() - started,
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc(),
+        }
+
+    return {
+        "input": input_path,
+        "output": output_path,
+        "status": "converted",
+        "pages": len(log or []),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def _log_error(error_log, result):
+    with open(error_log, "a", encoding="utf-8") as f:
+        f.write(json.dumps({
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "input": result["input"],
+            "error": result["error"],
+            "traceback": result["traceback"],
+        }) + "\n")
+
+
+def _worker_died(task, started):
+    return {
+        "input": task["input"],
+        "output": task["output"],
+        "status": "failed",
+        "seconds": time.perf_counter() - started,
+        "error": "BrokenProcessPool: the worker process died converting this document",
+        "traceback": "",
+    }
+
+
+def _convert_alone(task):
+    """convert_document in a worker of its own; a dead worker fails only `task`."""
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(convert_document, task).result()
+        except BrokenProcessPool:
+            return _worker_died(task, started)
+
+
+def _convert_in_pool(tasks, jobs):
+    """
+    Yield convert_document results, converting `jobs` tasks at a time in
+    worker processes, in completion order.
+
+    A worker that dies (a crash in native code, the OOM killer) breaks the
+    whole pool and every document in flight with it. Those documents are
+    retried one by one in a worker of their own, so only the one that
+    kills its worker again is reported as failed, and the rest of the
+    batch carries on in a new pool.
+    """
+    queue = deque(tasks)
+    while queue:
+        in_flight = []
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while (queue or running) and not in_flight:
+                while queue and len(running) < jobs:
+                    task = queue.popleft()
+                    running[pool.submit(convert_document, task)] = task
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        in_flight.append(task)
+                        continue
+                    yield result
+            for future, task in running.items():
+                if future.done() and future.exception() is None:
+                    yield future.result()
+                else:
+                    in_flight.append(task)
+
+        for task in in_flight:
+            yield _convert_alone(task)
+
+
+def run_batch(
+    entries,
+    jobs=1,
+    ocr_mode="off",
+    pages=None,
+    image_options=None,
+    extraction=DEFAULT_EXTRACTION_PROFILE,
+    resume=True,
+    error_log=None,
+    on_result=None
+):
+    """
+    Convert (input, output) pairs and return a summary dict.
+
+    jobs > 1 converts that many documents at once in worker processes.
+    With resume, pairs whose output is newer than the input are skipped.
+    on_result(result) is called in the parent as each document finishes
+    (in completion order when jobs > 1).
+    """
+    started = time.perf_counter()
+    start_time = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    counts = {"total": len(entries), "converted": 0, "skipped": 0, "failed": 0}
+    pages_done = 0
+    convert_seconds = 0.0
+
+    tasks = []
+    for input_path, output_path in entries:
+        if resume and is_up_to_date(input_path, output_path):
+            counts["skipped"] += 1
+            if on_result:
+                on_result({"input": input_path, "output": output_path, "status": "skipped"})
+            continue
+        tasks.append({
+            "input": input_path,
+            "output": output_path,
+            "ocr_mode": ocr_mode,
+            "pages": pages,
+            "image_options": image_options,
+            "extraction": extraction,
+        })
+
+    if jobs > 1 and len(tasks) > 1:
+        results = _convert_in_pool(tasks, jobs)
+    else:
+        results = map(convert_document, tasks)
+
+    for result in results:
+        counts[result["status"]] += 1
+        if result["status"] == "converted":
+            pages_done += result["pages"]
+            convert_seconds += result["seconds"]
+        elif error_log:
+            _log_error(error_log, result)
+        if on_result:
+            on_result(result)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "started": start_time,
+        "seconds": elapsed,
+        "jobs": jobs,
+        "documents": counts,
+        "pages": pages_done,
+        "documents_per_second": counts["converted"] / elapsed if elapsed else 0.0,
+        "pages_per_second": pages_done / elapsed if elapsed else 0.0,
+        "mean_seconds_per_document": (
+            convert_seconds / counts["converted"] if counts["converted"] else 0.0
+        ),
+        "error_log": error_log,
+    }
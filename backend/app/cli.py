@@ -1,33 +1,136 @@
 import argparse
+import json
 import os
 
-from backend.app.converters.pdf_to_word.no_ocr import pdf_to_word_no_ocr
+from backend.app.batch import inputs_from_dir, output_path_for, read_manifest, run_batch
+from backend.app.converters.pdf_to_word import (
+    DOCX_WRITERS,
+    EMBED_DPI,
+    IMAGE_FORMATS,
+    OCR_MODES,
+    ImageOptions,
+    pdf_to_word_no_ocr,
+    pdf_to_word_ocr,
+)
+from backend.app.core.extraction import (
+    DEFAULT_EXTRACTION_PROFILE,
+    EXTRACTION_PROFILES,
+)
+from backend.app.core.instrumentation import INSTRUMENT_MODES
+from backend.app.core.page_cache import DEFAULT_PAGE_CACHE_PATH, PageCache
+from backend.app.utils.pages import parse_pages
 
 
-def parse_pages(pages_str):
-    if pages_str == "all":
-        return None
+def run_page_cache_command(args):
+    from backend.app.converters.pdf_to_word.no_ocr import page_cache_params
 
-    pages = set()
+    cache = PageCache(args.page_cache or DEFAULT_PAGE_CACHE_PATH)
+    try:
+        if args.page_cache_prune is not None:
+            # Pages built with any current extraction profile stay.
+            removed = cache.prune(
+                max_age_days=args.page_cache_prune,
+                keep_params=[page_cache_params(name) for name in EXTRACTION_PROFILES]
+            )
+            print(f"🧹 Removed {removed} cached page(s)")
 
-    for part in pages_str.split(","):
-        part = part.strip()
-        if "-" in part:
-            start, end = part.split("-")
-            pages.update(range(int(start), int(end) + 1))
-        else:
-            pages.add(int(part))
+        if args.page_cache_info:
+            print(json.dumps(cache.stats(), indent=2))
+    finally:
+        cache.close()
+
+
+def run_batch_command(args, pages, image_options):
+    if not args.output_dir:
+        raise SystemExit("--output-dir is required with --input-dir / --manifest")
+
+    if args.manifest:
+        entries = [
+            (src, dst or output_path_for(src, args.output_dir))
+            for src, dst in read_manifest(args.manifest)
+        ]
+    else:
+        entries = [
+            (src, output_path_for(src, args.output_dir, args.input_dir))
+            for src in inputs_from_dir(args.input_dir, args.glob)
+        ]
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    error_log = args.error_log or os.path.join(args.output_dir, "batch_errors.jsonl")
+
+    def report(result):
+        name = os.path.basename(result["input"])
+        if result["status"] == "converted":
+            print(f"✅ {name} ({result['pages']} pages, {result['seconds']:.1f}s)")
+        elif result["status"] == "failed":
+            print(f"❌ {name}: {result['error']}")
+
+    print(f"📚 Batch: {len(entries)} document(s), {args.jobs} job(s)")
+    summary = run_batch(
+        entries,
+        jobs=args.jobs,
+        ocr_mode=args.ocr,
+        pages=pages,
+        image_options=image_options,
+        extraction=args.extraction,
+        resume=not args.force,
+        error_log=error_log,
+        on_result=report
+    )
+
+    counts = summary["documents"]
+    print(
+        f"🏁 {counts['converted']} converted, {counts['skipped']} up to date, "
+        f"{counts['failed']} failed in {summary['seconds']:.1f}s "
+        f"({summary['pages_per_second']:.1f} pages/s)"
+    )
+    if counts["failed"]:
+        print(f"🧾 Errors logged to: {error_log}")
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"📝 Summary saved to: {args.summary}")
 
-    return pages
+    return summary
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="PDF to Word Converter (No OCR)"
+        description="PDF to Word Converter"
     )
 
-    parser.add_argument("--input", required=True)
-    parser.add_argument("--output", required=True)
+    parser.add_argument("--input")
+    parser.add_argument("--output")
+
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument("--input-dir", help="Convert every PDF under this directory")
+    batch.add_argument(
+        "--glob",
+        default="**/*.pdf",
+        help="Pattern for --input-dir, relative to it (default: **/*.pdf)"
+    )
+    batch.add_argument(
+        "--manifest",
+        help="File listing one input PDF per line, optionally TAB + output path"
+    )
+    batch.add_argument("--output-dir", help="Where batch outputs are written")
+    batch.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Documents converted in parallel (default: 1)"
+    )
+    batch.add_argument(
+        "--force",
+        action="store_true",
+        help="Reconvert even if the output is newer than the input"
+    )
+    batch.add_argument(
+        "--error-log",
+        help="JSONL log of failed documents (default: OUTPUT_DIR/batch_errors.jsonl)"
+    )
+    batch.add_argument("--summary", help="Write a JSON batch summary here")
 
     parser.add_argument(
         "--report",
@@ -40,8 +143,141 @@ def main():
         help="Pages to process (e.g. 1-3, 2,5,7, all)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for page analysis (default: 1, serial)"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Render each page right after analysing it (bounded memory)"
+    )
+
+    parser.add_argument(
+        "--writer",
+        choices=DOCX_WRITERS,
+        default="python-docx",
+        help="streaming: write the .docx incrementally instead of building "
+             "it in memory (pair with --stream for very long documents)"
+    )
+
+    parser.add_argument(
+        "--ocr",
+        choices=OCR_MODES,
+        default="off",
+        help="off: text layer only (default), on: OCR every page, "
+             "auto: OCR only pages without a usable text layer"
+    )
+
+    parser.add_argument(
+        "--extraction",
+        choices=sorted(EXTRACTION_PROFILES),
+        default=DEFAULT_EXTRACTION_PROFILE,
+        help="Word extraction profile: positional skips text-flow ordering, "
+             "fonts adds font sizes for heading detection, dedupe also drops "
+             "overprinted chars, tight uses smaller tolerances "
+             f"(default: {DEFAULT_EXTRACTION_PROFILE})"
+    )
+
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        default=EMBED_DPI,
+        help=f"Resolution of image-fallback pages at their embedded width (default: {EMBED_DPI})"
+    )
+
+    parser.add_argument(
+        "--image-format",
+        choices=IMAGE_FORMATS,
+        default="auto",
+        help="auto: JPEG for photo-like pages, PNG for text/line art (default)"
+    )
+
+    parser.add_argument(
+        "--image-budget-mb",
+        type=float,
+        help="Cap on the total size of embedded page images, in MB"
+    )
+
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        help="Embed page images in grayscale"
+    )
+
+    parser.add_argument(
+        "--instrument",
+        choices=INSTRUMENT_MODES,
+        help="Record per-stage timings (time) or timings plus peak "
+             "allocation (memory) in the report; --ocr off only"
+    )
+
+    parser.add_argument(
+        "--raster-stats",
+        action="store_true",
+        help="Add the page raster cache's hits, misses and hit rate to the "
+             "report; --ocr on/auto only"
+    )
+
+    parser.add_argument(
+        "--page-cache",
+        nargs="?",
+        const=DEFAULT_PAGE_CACHE_PATH,
+        help="Reuse per-page analysis from earlier runs (optional SQLite path)"
+    )
+
+    parser.add_argument(
+        "--page-cache-info",
+        action="store_true",
+        help="Print page cache statistics and exit"
+    )
+
+    parser.add_argument(
+        "--page-cache-prune",
+        type=float,
+        metavar="DAYS",
+        help="Drop cached pages unused for DAYS days or built with old "
+             "analysis parameters, then exit"
+    )
+
     args = parser.parse_args()
 
+    if args.page_cache_info or args.page_cache_prune is not None:
+        run_page_cache_command(args)
+        return
+
+    batch_mode = bool(args.input_dir or args.manifest)
+    if batch_mode and (args.input or args.output):
+        parser.error("use either --input/--output or --input-dir/--manifest")
+    if not batch_mode and (not args.input or not args.output):
+        parser.error("--input and --output are required")
+
+    per_file_no_ocr = args.stream or args.page_cache or args.instrument or args.writer != "python-docx"
+    if args.ocr != "off" and per_file_no_ocr:
+        parser.error("--stream, --page-cache, --instrument and --writer only apply with --ocr off")
+    if args.ocr == "off" and args.raster_stats:
+        parser.error("--raster-stats only applies with --ocr on or auto")
+
+    pages = parse_pages(args.pages)
+    image_options = ImageOptions(
+        dpi=args.image_dpi,
+        image_format=args.image_format,
+        grayscale=args.grayscale,
+        budget_bytes=int(args.image_budget_mb * 1024 * 1024) if args.image_budget_mb else None
+    )
+
+    if batch_mode:
+        if per_file_no_ocr or args.report or args.raster_stats:
+            parser.error(
+                "--stream, --page-cache, --instrument, --writer, --report and "
+                "--raster-stats are per-file options"
+            )
+        run_batch_command(args, pages, image_options)
+        return
+
     if not os.path.exists(args.input):
         raise FileNotFoundError(f"Input file not found: {args.input}")
 
@@ -49,14 +285,38 @@ def main():
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
-    pages = parse_pages(args.pages)
+    page_cache = PageCache(args.page_cache) if args.page_cache else None
 
-    pdf_to_word_no_ocr(
-        input_pdf_path=args.input,
-        output_docx_path=args.output,
-        report_path=args.report,
-        pages=pages
-    )
+    try:
+        if args.ocr == "off":
+            pdf_to_word_no_ocr(
+                input_pdf_path=args.input,
+                output_docx_path=args.output,
+                report_path=args.report,
+                pages=pages,
+                workers=args.workers,
+                stream=args.stream,
+                page_cache=page_cache,
+                instrument=args.instrument,
+                image_options=image_options,
+                writer=args.writer,
+                extraction=args.extraction
+            )
+        else:
+            pdf_to_word_ocr(
+                input_pdf_path=args.input,
+                output_docx_path=args.output,
+                report_path=args.report,
+                pages=pages,
+                workers=args.workers,
+                auto=args.ocr == "auto",
+                image_options=image_options,
+                extraction=args.extraction,
+                raster_stats=args.raster_stats
+            )
+    finally:
+        if page_cache:
+            page_cache.close()
 
     print("✅ Conversion finished")
     print(f"📄 Output saved to: {args.output}")
@@ -64,6 +324,9 @@ def main():
     if args.report:
         print(f"🧠 Decision report saved to: {args.report}")
 
+    if page_cache:
+        print(f"🗃️ Page cache: {page_cache.hits} reused, {page_cache.misses} analysed")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+
+CONVERTER_VERSION = "2.0.0"
+
+# off: text layer only, on: OCR every page, auto: OCR only pages whose
+# text layer is not meaningful.
+OCR_MODES = ("off", "on", "auto")
+
+# Output backends: python-docx's in-memory Document, or the incremental
+# writer in docx_stream.py.
+DOCX_WRITERS = ("python-docx", "streaming")
+
+
+# Resolution of embedded page images, measured at their size in the .docx
+# (the full text width), not at the PDF page size.
+EMBED_DPI = 150
+
+IMAGE_FORMATS = ("auto", "png", "jpeg")
+
+
+@dataclass
+class ImageOptions:
+    """How image-fallback pages are embedded (see image_embed.py)."""
+    dpi: int = EMBED_DPI
+    image_format: str = "auto"      # "auto" picks per page: photo -> jpeg, else png
+    grayscale: bool = False
+    budget_bytes: int = None        # total for all page images in one document
+    skip_blank: bool = True         # near-blank pages become an empty placeholder
+
+    def __post_init__(self):
+        if self.image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format: {self.image_format!r}")
+
+
+def parse_ocr_mode(value):
+    """Map a form/CLI value (bool-ish or a mode name) to one of OCR_MODES."""
+    value = str(value).strip().lower()
+    if value in ("true", "1", "yes", "on"):
+        return "on"
+    if value in ("false", "0", "no", "off", ""):
+        return "off"
+    if value == "auto":
+        return "auto"
+    raise ValueError(f"Unknown OCR mode: {value}")
+
+
+# Entry points for the API and CLI. The converter modules pull in
+# pdfplumber, python-docx and Pillow, so they are imported on first call
+# instead of when the app starts.
+
+def pdf_to_word_no_ocr(*args, **kwargs):
+    from .no_ocr import pdf_to_word_no_ocr as convert
+    return convert(*args, **kwargs)
+
+
+def pdf_to_word_ocr(*args, **kwargs):
+    from .ocr import pdf_to_word_ocr as convert
+    return convert(*args, **kwargs)
+
+
+def ocr_available():
+    from .ocr import ocr_available as probe
+    return probe()
@@ -0,0 +1,383 @@
+"""
+Streaming .docx writer.
+
+StreamingDocument supports the part of python-docx's Document API the
+renderers use (add_heading, add_paragraph with a style, add_table +
+cell().text, add_picture, add_page_break, sections[-1] margins), but
+never builds a DOM: body XML is appended to a spool file as elements are
+added, and each picture is written into the zip as soon as it arrives.
+save() then adds the relationships and the content types of the media
+written, and copies the spooled body into word/document.xml. Memory stays flat however long the document is.
+
+Styles, settings, numbering and the section layout come from
+python-docx's default template, so the output looks the same as a
+Document() built the usual way.
+
+add_table_rows() builds a whole table's XML in one pass, and
+repeat_picture() adds another copy of an existing picture without its
+image bytes, for either kind of document.
+"""
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from collections import namedtuple
+from copy import deepcopy
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml import parse_xml
+from PIL import Image
+
+
+DOCUMENT_PART = "word/document.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+IMAGE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Content types of the media extensions _media_part() writes.
+MEDIA_CONTENT_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "bmp": "image/bmp",
+    "tiff": "image/tiff",
+}
+
+EMU_PER_TWIP = 635
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# Same rule python-docx applies to run text.
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_RUN_SPECIAL = re.compile("(\t|\r\n|\n|\r)")
+
+Section = namedtuple("Section", "page_width page_height left_margin right_margin")
+
+# What StreamingDocument.add_picture returns: the media part and the size.
+Picture = namedtuple("Picture", "rel_id filename cx cy")
+
+_Template = namedtuple(
+    "_Template", "parts body_start body_end rels content_types sections style_ids"
+)
+
+
+@lru_cache(maxsize=1)
+def _template():
+    """Parts of python-docx's default document, split around the body."""
+    doc = Document()
+    buf = io.BytesIO()
+    doc.save(buf)
+
+    with zipfile.ZipFile(buf) as z:
+        parts = {name: z.read(name) for name in z.namelist()}
+
+    document = parts.pop(DOCUMENT_PART).decode("utf-8")
+    body_start = document.index("<w:body>") + len("<w:body>")
+    body_end = document.index("<w:sectPr")
+    rels = parts.pop(DOCUMENT_RELS_PART).decode("utf-8")
+    content_types = parts.pop(CONTENT_TYPES_PART).decode("utf-8")
+
+    s = doc.sections[-1]
+    sections = [Section(s.page_width, s.page_height, s.left_margin, s.right_margin)]
+    style_ids = {style.name: style.style_id for style in doc.styles}
+
+    return _Template(
+        parts, document[:body_start], document[body_end:], rels, content_types,
+        sections, style_ids
+    )
+
+
+def _run_xml(text):
+    """<w:r> for text, with tabs and line breaks as python-docx writes them."""
+    if _XML_INVALID.search(text):
+        raise ValueError("All strings must be XML compatible")
+    pieces = []
+    for piece in _RUN_SPECIAL.split(text):
+        if piece == "\t":
+            pieces.append("<w:tab/>")
+        elif piece in ("\r\n", "\n", "\r"):
+            pieces.append("<w:br/>")
+        elif piece:
+            pieces.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f"<w:r>{''.join(pieces)}</w:r>"
+
+
+def _paragraph_xml(text="", style_id=None):
+    ppr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ""
+    run = _run_xml(text) if text else ""
+    if not ppr and not run:
+        return "<w:p/>"
+    return f"<w:p>{ppr}{run}</w:p>"
+
+
+def table_xml(rows, width, declare_ns=False):
+    """
+    <w:tbl> for a grid of cell strings, matching python-docx's add_table():
+    as many columns as the first row (shorter rows are padded), equal
+    column widths over `width` EMU, one paragraph per cell. declare_ns
+    puts the w: namespace on the element so it parses on its own.
+    """
+    cols = len(rows[0]) if rows else 0
+    col_twips = (width // cols) // EMU_PER_TWIP if cols else 0
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr>'
+    ns = f' xmlns:w="{W_NAMESPACE}"' if declare_ns else ""
+
+    out = [
+        f'<w:tbl{ns}><w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+        f'<w:gridCol w:w="{col_twips}"/>' * cols,
+        "</w:tblGrid>",
+    ]
+    for row in rows:
+        out.append("<w:tr>")
+        for j in range(cols):
+            text = row[j] if j < len(row) else ""
+            out.append(f"<w:tc>{tc_pr}{_paragraph_xml(text)}</w:tc>")
+        out.append("</w:tr>")
+    out.append("</w:tbl>")
+    return "".join(out)
+
+
+def add_table_rows(doc, rows):
+    """
+    Append a table holding `rows` (lists of cell strings) to a python-docx
+    Document or a StreamingDocument. Same result as add_table() followed
+    by cell(i, j).text per cell, but built in one pass: python-docx's
+    cell() rebuilds the table's cell grid on every call.
+    """
+    if isinstance(doc, StreamingDocument):
+        doc.add_table_rows(rows)
+        return
+
+    section = doc.sections[-1]
+    width = section.page_width - section.left_margin - section.right_margin
+    tbl = parse_xml(table_xml(rows, width, declare_ns=True))
+
+    body = doc.element.body
+    if body.sectPr is not None:
+        body.sectPr.addprevious(tbl)
+    else:
+        body.append(tbl)
+
+
+def repeat_picture(doc, picture):
+    """
+    Add another full copy of `picture` (what add_picture returned) that
+    points at the same media part, so the image bytes are not needed again.
+    """
+    if isinstance(doc, StreamingDocument):
+        doc.repeat_picture(picture)
+        return picture
+
+    inline = deepcopy(picture._inline)
+    inline.docPr.id = doc.part.next_id
+    doc.add_paragraph().add_run()._r.add_drawing(inline)
+    return picture
+
+
+def _picture_xml(shape_id, rel_id, filename, cx, cy):
+    return (
+        "<w:p><w:r><w:drawing>"
+        '<wp:inline xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+        'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f'<wp:extent cx="{cx}" cy="{cy}"/>'
+        f'<wp:docPr id="{shape_id}" name="Picture {shape_id}"/>'
+        '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f'<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="{filename}"/><pic:cNvPicPr/></pic:nvPicPr>'
+        f'<pic:blipFill><a:blip r:embed="{rel_id}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+        f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"/></pic:spPr></pic:pic>'
+        "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>"
+    )
+
+
+def _native_size(img):
+    """Image size in EMU at its own DPI (72 when unset), as python-docx sizes it."""
+    dpi_x, dpi_y = img.info.get("dpi", (72, 72))
+    dpi_x, dpi_y = dpi_x or 72, dpi_y or 72
+    return round(img.width / dpi_x * 914400), round(img.height / dpi_y * 914400)
+
+
+class _Cell:
+    __slots__ = ("_row", "_col")
+
+    def __init__(self, row, col):
+        self._row = row
+        self._col = col
+
+    @property
+    def text(self):
+        return self._row[self._col]
+
+    @text.setter
+    def text(self, value):
+        self._row[self._col] = value
+
+
+class _Table:
+    """A table being filled in; written out when the next element arrives."""
+
+    def __init__(self, rows, cols):
+        self.rows = [[""] * cols for _ in range(rows)]
+
+    def cell(self, row_idx, col_idx):
+        return _Cell(self.rows[row_idx], col_idx)
+
+
+class StreamingDocument:
+    """
+    Write-only Document look-alike that streams into `path`.
+
+    Call save() (with the same path, or none) to finish the file; an
+    unfinished file is not a valid .docx, so discard() it on failure.
+    """
+
+    def __init__(self, path):
+        template = _template()
+        self.path = path
+        self.sections = template.sections
+        self._template = template
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._body = tempfile.TemporaryFile()
+        self._pending_table = None
+        self._images = {}       # sha1 -> (rel id, filename)
+        self._rels = []         # (rel id, target)
+        self._extensions = set()    # media file extensions written
+        self._shape_id = 0
+        self._next_rel = 1 + max(int(n) for n in re.findall(r'Id="rId(\d+)"', template.rels))
+
+        for name, data in template.parts.items():
+            self._zip.writestr(name, data)
+
+    # -- body elements -----------------------------------------------------
+
+    def _write(self, xml):
+        self._flush_table()
+        self._body.write(xml.encode("utf-8"))
+
+    def _flush_table(self):
+        table, self._pending_table = self._pending_table, None
+        if table is not None:
+            self._write(table_xml(table.rows, self._text_width()))
+
+    def _text_width(self):
+        s = self.sections[-1]
+        return s.page_width - s.left_margin - s.right_margin
+
+    def _style_id(self, style):
+        try:
+            return self._template.style_ids[style]
+        except KeyError:
+            raise KeyError(f"no style with name '{style}'")
+
+    def add_paragraph(self, text="", style=None):
+        self._write(_paragraph_xml(text, self._style_id(style) if style else None))
+
+    def add_heading(self, text="", level=1):
+        if not 0 <= level <= 9:
+            raise ValueError(f"level must be in range 0-9, got {level}")
+        self.add_paragraph(text, "Title" if level == 0 else f"Heading {level}")
+
+    def add_page_break(self):
+        self._write('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    def add_table(self, rows, cols):
+        self._flush_table()
+        self._pending_table = _Table(rows, cols)
+        return self._pending_table
+
+    def add_table_rows(self, rows):
+        self._write(table_xml(rows, self._text_width()))
+
+    def add_picture(self, image, width=None, height=None):
+        if isinstance(image, (str, os.PathLike)):
+            with open(image, "rb") as f:
+                data = f.read()
+        else:
+            data = image.read()
+
+        img = Image.open(io.BytesIO(data))
+        native_cx, native_cy = _native_size(img)
+        if width is None and height is None:
+            cx, cy = native_cx, native_cy
+        elif height is None:
+            cx, cy = width, round(native_cy * width / native_cx)
+        elif width is None:
+            cx, cy = round(native_cx * height / native_cy), height
+        else:
+            cx, cy = width, height
+
+        rel_id, filename = self._media_part(data, img.format)
+        picture = Picture(rel_id, filename, int(cx), int(cy))
+        self.repeat_picture(picture)
+        return picture
+
+    def repeat_picture(self, picture):
+        self._shape_id += 1
+        self._write(_picture_xml(self._shape_id, *picture))
+
+    def _media_part(self, data, fmt):
+        # Identical bytes share one media part, like python-docx.
+        digest = hashlib.sha1(data).hexdigest()
+        if digest not in self._images:
+            ext = "jpeg" if fmt == "JPEG" else (fmt or "png").lower()
+            rel_id = f"rId{self._next_rel}"
+            self._next_rel += 1
+            target = f"media/image{len(self._images) + 1}.{ext}"
+            self._zip.writestr(f"word/{target}", data)
+            self._extensions.add(ext)
+            self._rels.append((rel_id, target))
+            self._images[digest] = (rel_id, f"image.{ext}")
+        return self._images[digest]
+
+    # -- finishing ---------------------------------------------------------
+
+    def save(self, path=None):
+        if path is not None and os.path.abspath(path) != os.path.abspath(self.path):
+            raise ValueError(f"StreamingDocument writes to {self.path}, not {path}")
+        self._flush_table()
+
+        rels = "".join(
+            f'<Relationship Id="{rel_id}" Type="{IMAGE_REL_TYPE}" Target="{target}"/>'
+            for rel_id, target in self._rels
+        )
+        self._zip.writestr(
+            DOCUMENT_RELS_PART,
+            self._template.rels.replace("</Relationships>", rels + "</Relationships>")
+        )
+        self._zip.writestr(CONTENT_TYPES_PART, self._content_types())
+
+        self._body.seek(0)
+        with self._zip.open(DOCUMENT_PART, "w", force_zip64=True) as part:
+            part.write(self._template.body_start.encode("utf-8"))
+            shutil.copyfileobj(self._body, part, SPOOL_CHUNK_SIZE)
+            part.write(self._template.body_end.encode("utf-8"))
+        self._close()
+
+    def _content_types(self):
+        """The template's content types plus a Default for each new media extension."""
+        content_types = self._template.content_types
+        declared = set(re.findall(r'<Default Extension="([^"]+)"', content_types))
+        defaults = "".join(
+            f'<Default Extension="{ext}" '
+            f'ContentType="{MEDIA_CONTENT_TYPES.get(ext, "image/" + ext)}"/>'
+            for ext in sorted(self._extensions - declared)
+        )
+        return content_types.replace("</Types>", defaults + "</Types>")
+
+    def discard(self):
+        """Abandon the document and remove the partial file."""
+        self._close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _close(self):
+        self._body.close()
+        self._zip.close()
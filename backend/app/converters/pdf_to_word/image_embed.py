@@ -0,0 +1,192 @@
+import hashlib
+import io
+
+from PIL import Image
+
+# ImageOptions and its defaults live in the package __init__, so the CLI
+# can build them without importing Pillow; re-exported here for callers.
+from . import EMBED_DPI, IMAGE_FORMATS, ImageOptions
+
+
+MIN_EMBED_DPI = 72
+
+JPEG_QUALITY = 80
+MIN_JPEG_QUALITY = 40
+JPEG_QUALITY_STEP = 15
+DOWNSCALE_STEP = 0.75
+
+# Share of mid-tone pixels above which a page is treated as a photo (JPEG)
+# rather than line art / text (PNG, which keeps edges crisp and compresses
+# flat backgrounds well).
+PHOTO_MIDTONE_RATIO = 0.25
+MIDTONE_RANGE = (40, 216)
+HISTOGRAM_SAMPLE_PX = 256
+
+# A page whose thumbnail has at most this share of pixels darker than
+# BLANK_INK_LEVEL is treated as blank (separator sheets, empty backs).
+BLANK_INK_LEVEL = 200
+BLANK_MAX_INK_RATIO = 0.002
+
+EMU_PER_INCH = 914400
+
+
+def text_width_inches(doc):
+    section = doc.sections[-1]
+    return (section.page_width - section.left_margin - section.right_margin) / EMU_PER_INCH
+
+
+def thumbnail_histogram(img):
+    """256-bin grayscale histogram of a small thumbnail of the image."""
+    sample = img.copy()
+    sample.thumbnail((HISTOGRAM_SAMPLE_PX, HISTOGRAM_SAMPLE_PX))
+    return sample.convert("L").histogram()
+
+
+def is_photo(hist):
+    """Photo vs. line art: share of mid-tone pixels."""
+    lo, hi = MIDTONE_RANGE
+    total = sum(hist)
+    return total > 0 and sum(hist[lo:hi]) / total > PHOTO_MIDTONE_RATIO
+
+
+def is_near_blank(hist):
+    total = sum(hist)
+    return total == 0 or sum(hist[:BLANK_INK_LEVEL]) / total <= BLANK_MAX_INK_RATIO
+
+
+def raster_digest(img):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{img.mode}:{img.width}x{img.height}:".encode())
+    digest.update(img.tobytes())
+    return digest.hexdigest()
+
+
+def encode_image(img, fmt, quality=JPEG_QUALITY):
+    buf = io.BytesIO()
+    if fmt == "jpeg":
+        if img.mode not in ("L", "RGB"):
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=quality, optimize=True)
+    else:
+        img.save(buf, format="PNG")
+    buf.seek(0)
+    return buf
+
+
+class ImageEmbedder:
+    """
+    Turns page rasters into compact images for the .docx.
+
+    Pages are rasterised (or downscaled) to `dpi` at the width they are
+    embedded at, encoded as JPEG or PNG by content, and kept within an
+    optional per-document byte budget shared across the images still
+    expected: an image over its share first loses JPEG quality, then
+    resolution, down to MIN_JPEG_QUALITY / MIN_EMBED_DPI.
+
+    Identical rasters are encoded once: after the caller reports the
+    picture it added with placed(), repeats of that raster get the
+    picture back from encode() instead of bytes, to be re-used with
+    docx_stream.repeat_picture(). Only digests and picture handles are
+    kept, never image bytes. Near-blank pages are not encoded at all
+    (encode() returns no buffer).
+    """
+
+    def __init__(self, doc, options=None, expected_images=None):
+        self.options = options or ImageOptions()
+        self.embed_inches = text_width_inches(doc)
+        self.expected_images = expected_images
+        self.embedded = 0
+        self.bytes_used = 0
+        self._pictures = {}     # raster digest -> (picture, duplicate info)
+        self._pending = None    # (digest, duplicate info) of the last new image
+
+    def raster_resolution(self, page):
+        """pdfplumber resolution that yields `dpi` at the embedded width."""
+        page_inches = float(page.width) / 72
+        return max(1, round(self.options.dpi * self.embed_inches / page_inches))
+
+    def _allowance(self):
+        budget = self.options.budget_bytes
+        if not budget:
+            return None
+        remaining = max(0, budget - self.bytes_used)
+        if self.expected_images is None:
+            return remaining
+        return remaining / max(1, self.expected_images - self.embedded)
+
+    def encode(self, img, page_number=None):
+        """
+        (source, info) for one page image; info goes into the report.
+        source is None for a near-blank page, the picture handle given to
+        placed() for a repeated raster (info then has "duplicate_of"), and
+        otherwise a buffer of the encoded image.
+        """
+        opts = self.options
+        hist = thumbnail_histogram(img)
+
+        if opts.skip_blank and is_near_blank(hist):
+            self.embedded += 1
+            return None, {"format": "blank", "bytes": 0}
+
+        digest = raster_digest(img)
+        if digest in self._pictures:
+            picture, info = self._pictures[digest]
+            self.embedded += 1
+            return picture, dict(info, bytes=0)
+
+        buf, info = self._encode(img, hist)
+        self._pending = (digest, dict(info, duplicate_of=page_number))
+        return buf, info
+
+    def placed(self, picture):
+        """Record the picture added for the last encoded buffer."""
+        if self._pending is not None:
+            digest, info = self._pending
+            self._pictures[digest] = (picture, info)
+            self._pending = None
+
+    def _encode(self, img, hist):
+        opts = self.options
+        if opts.grayscale and img.mode != "L":
+            img = img.convert("L")
+
+        dpi = opts.dpi
+        target_px = round(self.embed_inches * dpi)
+        if img.width > target_px:
+            img = img.resize(
+                (target_px, max(1, round(img.height * target_px / img.width))),
+                Image.LANCZOS
+            )
+
+        fmt = opts.image_format
+        if fmt == "auto":
+            fmt = "jpeg" if is_photo(hist) else "png"
+
+        quality = JPEG_QUALITY
+        allowance = self._allowance()
+        buf = encode_image(img, fmt, quality)
+
+        while allowance is not None and buf.getbuffer().nbytes > allowance:
+            if fmt == "jpeg" and quality > MIN_JPEG_QUALITY:
+                quality = max(MIN_JPEG_QUALITY, quality - JPEG_QUALITY_STEP)
+            elif dpi * DOWNSCALE_STEP >= MIN_EMBED_DPI:
+                dpi = round(dpi * DOWNSCALE_STEP)
+                img = img.resize(
+                    (max(1, round(img.width * DOWNSCALE_STEP)),
+                     max(1, round(img.height * DOWNSCALE_STEP))),
+                    Image.LANCZOS
+                )
+            elif fmt == "png":
+                fmt = "jpeg"
+            else:
+                break   # at the floor: embed what we have
+            buf = encode_image(img, fmt, quality)
+
+        size = buf.getbuffer().nbytes
+        self.embedded += 1
+        self.bytes_used += size
+
+        info = {"format": fmt, "dpi": dpi, "bytes": size}
+        if fmt == "jpeg":
+            info["quality"] = quality
+        return buf, info
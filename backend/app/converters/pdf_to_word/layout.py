@@ -3,6 +3,9 @@ from docx import Document
 import io
 import os
 
+from backend.app.core.analysis.line_index import line_index_for
+from backend.app.core.analysis.word_array import WordArray
+
 LINE_Y_THRESHOLD = 2
 MIN_TEXT_CHARS = 30
 TAB_WIDTH = 40
@@ -10,7 +13,8 @@ COLUMN_GAP_THRESHOLD = 100
 
 
 def is_meaningful_text(words, min_chars=MIN_TEXT_CHARS):
-    total_chars = sum(len(w["text"].strip()) for w in words)
+    texts = words.text if isinstance(words, WordArray) else (w["text"] for w in words)
+    total_chars = sum(len(t.strip()) for t in texts)
     return total_chars >= min_chars
 
 
@@ -95,6 +99,23 @@ def extract_page_images(page):
     return images
 
 
+def render_indexed_column(doc, line_index, indices=None):
+    """render_column for a PageProfile: lines come from the shared line index."""
+    words = line_index.words
+    left_margin = words.min_x0(indices) if indices is not None else words.min_x0()
+
+    for line in line_index.lines(LINE_Y_THRESHOLD, indices):
+        text = line_index.text(line)
+        if not text:
+            continue
+
+        x0 = words.x0[line[0]]
+        indent = int((x0 - left_margin) / TAB_WIDTH)
+        indent = max(0, indent)
+
+        doc.add_paragraph("\t" * indent + text)
+
+
 # ✅ NEW: v2.0 renderer (used by no_ocr.py)
 def render_layout(profile, doc):
     words = profile.words
@@ -102,19 +123,18 @@ def render_layout(profile, doc):
     if not words or not is_meaningful_text(words):
         return
 
+    line_index = line_index_for(profile)
+
     if profile.columns == 2 and len(profile.column_x_ranges) == 2:
         _, right_range = profile.column_x_ranges
-        left_words = [w for w in words if w["x0"] < right_range[0]]
-        right_words = [w for w in words if w["x0"] >= right_range[0]]
-        left_words = sorted(left_words, key=lambda w: (w["top"], w["x0"]))
-        right_words = sorted(right_words, key=lambda w: (w["top"], w["x0"]))
-        columns = [left_words, right_words]
+        x0 = line_index.words.x0
+        left = [i for i in range(len(x0)) if x0[i] < right_range[0]]
+        right = [i for i in range(len(x0)) if x0[i] >= right_range[0]]
+        for col in (left, right):
+            if col:
+                render_indexed_column(doc, line_index, col)
     else:
-        columns = [words]
-
-    for col_words in columns:
-        if col_words:
-            render_column(doc, col_words)
+        render_indexed_column(doc, line_index)
 
 
 import warnings
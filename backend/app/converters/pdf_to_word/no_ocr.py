@@ -1,8 +1,33 @@
 import pdfplumber
 from docx import Document
+from . import CONVERTER_VERSION, DOCX_WRITERS
+from .docx_stream import StreamingDocument, add_table_rows, repeat_picture
+from .image_embed import ImageEmbedder
 from .layout import pdf_to_word_layout, render_layout
-from backend.app.core.analysis.build_profile import build_page_profile
-import io
+from .triage import DRAWING_OBJECTS, has_text_layer, triage_page
+from backend.app.core.analysis.build_profile import analysis_params, build_page_profile
+from backend.app.core.analysis.detect_headings import detect_headings
+from backend.app.core.analysis.line_index import line_index_for
+from backend.app.core.analysis.typography import TypographyIndex
+from backend.app.core.analysis.word_array import WordArray
+from backend.app.core.extraction import (
+    DEFAULT_EXTRACTION_PROFILE,
+    extract_page_words,
+    extraction_options,
+)
+from backend.app.core.instrumentation import (
+    DISABLED_TIMER,
+    StageReport,
+    make_timer,
+    tracing_memory,
+)
+from backend.app.core.page_cache import params_hash
+from backend.app.utils.result_cache import hash_file
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 import os
 
 
@@ -13,211 +38,636 @@ MIN_TEXT_CHARS = 30
 COLUMN_GAP_THRESHOLD = 50
 ROW_Y_THRESHOLD = 10
 
+# Parallel analysis: pages per chunk at most, and chunks submitted ahead
+# of the consumer per worker, so analysed-but-unrendered pages stay
+# bounded however long the document is.
+MAX_CHUNK_PAGES = 16
+CHUNKS_AHEAD_PER_WORKER = 2
+
 
 def add_full_width_image(doc, image_buffer):
     section = doc.sections[-1]
     max_width = section.page_width - section.left_margin - section.right_margin
-    doc.add_picture(image_buffer, width=max_width)
+    return doc.add_picture(image_buffer, width=max_width)
 
 
 def is_meaningful_text(words, min_chars=MIN_TEXT_CHARS):
-    total_chars = sum(len(w["text"].strip()) for w in words)
+    texts = words.text if isinstance(words, WordArray) else (w["text"] for w in words)
+    total_chars = sum(len(t.strip()) for t in texts)
     return total_chars >= min_chars
 
 
-def group_words_into_lines(words):
-    lines = []
-    current = []
-
-    for w in sorted(words, key=lambda x: (x["top"], x["x0"])):
-        if not current:
-            current.append(w)
-            continue
-
-        if abs(w["top"] - current[-1]["top"]) <= LINE_Y_THRESHOLD:
-            current.append(w)
-        else:
-            lines.append(current)
-            current = [w]
-
-    if current:
-        lines.append(current)
-
-    return lines
-
-
 def split_into_columns(words):
-    words = sorted(words, key=lambda w: w["x0"])
+    """
+    Word indices of a WordArray grouped into columns, splitting wherever
+    consecutive x0 positions jump by more than COLUMN_GAP_THRESHOLD.
+    """
+    x0 = words.x0
+    order = sorted(range(len(words)), key=x0.__getitem__)
     columns = []
-    current = [words[0]]
+    current = [order[0]]
 
-    for w in words[1:]:
-        if abs(w["x0"] - current[-1]["x0"]) > COLUMN_GAP_THRESHOLD:
+    for i in order[1:]:
+        if abs(x0[i] - x0[current[-1]]) > COLUMN_GAP_THRESHOLD:
             columns.append(current)
-            current = [w]
+            current = [i]
         else:
-            current.append(w)
+            current.append(i)
 
     columns.append(current)
     return columns
 
 
-def extract_lines(words):
-    lines = group_words_into_lines(words)
+def extract_lines(line_index, indices):
     result = []
-    for line in lines:
-        text = " ".join(w["text"] for w in line).strip()
-        top = line[0]["top"]
+    for line in line_index.lines(LINE_Y_THRESHOLD, indices):
+        text = line_index.text(line)
+        top = line_index.words.top[line[0]]
         if text:
             result.append((top, text))
     return result
 
 
-def pair_form_rows(left_lines, right_lines):
-    pairs = []
-    used = set()
-
-    for l_top, l_text in left_lines:
-        best = None
-        best_diff = None
-
-        for i, (r_top, r_text) in enumerate(right_lines):
-            if i in used:
-                continue
-            diff = abs(l_top - r_top)
-            if diff <= ROW_Y_THRESHOLD and (best_diff is None or diff < best_diff):
-                best = (i, r_text)
-                best_diff = diff
-
-        if best:
-            idx, r_text = best
-            used.add(idx)
-            pairs.append((l_text, r_text))
+class _NearestUnusedLine:
+    """
+    (top, text) lines sorted by top, handing out the nearest line not yet
+    taken. Skip pointers (path-compressed, like union-find) jump over taken
+    lines, so a lookup is a bisection plus near-constant work.
+    """
+
+    def __init__(self, lines):
+        self.order = sorted(range(len(lines)), key=lambda i: lines[i][0])
+        self.tops = [lines[i][0] for i in self.order]
+        self.texts = [lines[i][1] for i in self.order]
+        n = len(self.order)
+        self._next = list(range(n + 1))     # first free position >= i (n: none)
+        self._prev = list(range(n + 1))     # 1 + last free position < i (0: none)
+
+    @staticmethod
+    def _find(links, i):
+        root = i
+        while links[root] != root:
+            root = links[root]
+        while links[i] != root:
+            links[i], i = root, links[i]
+        return root
+
+    def take(self, top, threshold=ROW_Y_THRESHOLD):
+        """
+        Text of the free line nearest to `top` (within threshold), marked
+        as taken; "" if there is none. Ties go to the line that came first
+        in the input.
+        """
+        n = len(self.tops)
+        p = bisect_left(self.tops, top)
+        candidates = []
+
+        below = self._find(self._next, p)
+        if below < n and self.tops[below] - top <= threshold:
+            candidates.append(below)
+
+        above = self._find(self._prev, p) - 1
+        if above >= 0 and top - self.tops[above] <= threshold:
+            # Among free lines sharing that top, the earliest input line.
+            first = bisect_left(self.tops, self.tops[above])
+            candidates.append(self._find(self._next, first))
+
+        if not candidates:
+            return ""
+
+        best = min(candidates, key=lambda i: (abs(top - self.tops[i]), self.order[i]))
+        self._next[best] = best + 1
+        self._prev[best + 1] = best
+        return self.texts[best]
+
+
+def pair_form_rows(label_lines, *value_columns):
+    """
+    Form rows as tuples (label, value, ...): every label line takes, from
+    each value column, the nearest line whose top is within
+    ROW_Y_THRESHOLD of its own and that no earlier label took ("" when
+    there is none). Lines are (top, text); labels keep their order.
+
+    O((L + V) log V) per value column rather than comparing every label
+    with every value line.
+    """
+    columns = [_NearestUnusedLine(lines) for lines in value_columns]
+    return [
+        (text, *(column.take(top) for column in columns))
+        for top, text in label_lines
+    ]
+
+
+def needs_image_fallback(profile):
+    return not profile.words or not is_meaningful_text(profile.words)
+
+
+def render_page_image(page, page_number, embedder, raster_cache=None, timer=DISABLED_TIMER):
+    """
+    What to embed for the whole page (see ImageEmbedder.encode), how the
+    raster was obtained ("cache-hit" or "rendered") and the embedder's
+    encoding info, for the decision report.
+
+    Without a cached raster the page is rendered straight at the
+    resolution the embedder needs; a cached 300 DPI OCR raster is reused
+    and downscaled.
+    """
+    with timer.stage("rasterize"):
+        if raster_cache is not None:
+            hits = raster_cache.hits
+            img = raster_cache.get_image(page, page_number, resolution=300)
+            raster = "cache-hit" if raster_cache.hits > hits else "rendered"
+        else:
+            resolution = embedder.raster_resolution(page)
+            img = page.to_image(resolution=resolution).original
+            raster = "rendered"
+
+    with timer.stage("encode_image"):
+        source, info = embedder.encode(img, page_number)
+    return source, raster, info
+
+
+def render_page_profile(
+    doc,
+    page,
+    profile,
+    decision_log,
+    raster_cache=None,
+    stage_report=None,
+    embedder=None,
+    typography=None
+):
+    """
+    Render one analysed page and append its decision-report entry. With a
+    stage_report, the entry also gets the page's analysis and render
+    stage timings under "stages". embedder (an ImageEmbedder) encodes
+    image-fallback pages; share one per document so its byte budget holds.
+    typography (a TypographyIndex of the document) sets which paragraphs
+    become headings and at which level; without one, only this page's
+    font sizes count.
+    """
+    if embedder is None:
+        embedder = ImageEmbedder(doc)
+    if typography is None:
+        typography = TypographyIndex.from_profiles([profile])
+
+    entry = {
+        "page": profile.page_number,
+        "mode": profile.detected_mode,
+        "reason": profile.reason,
+        "engine": profile.engine
+    }
+    if profile.triage is not None:
+        entry["triage"] = profile.triage
+    decision_log.append(entry)
+
+    if stage_report is None:
+        _render_page(
+            doc, page, profile, entry, raster_cache, DISABLED_TIMER, embedder, typography
+        )
+        return
+
+    timer = stage_report.page_timer()
+    with timer.stage("render"):
+        _render_page(doc, page, profile, entry, raster_cache, timer, embedder, typography)
+    entry["stages"] = stage_report.add_page(
+        profile.page_number, profile.stage_timings, timer.stages
+    )
+
+
+def _render_page(doc, page, profile, entry, raster_cache, timer, embedder, typography):
+    page_mode = profile.detected_mode
+
+    # ---- Image-only fallback ----
+    if needs_image_fallback(profile):
+        source, entry["raster"], entry["image"] = render_page_image(
+            page, profile.page_number, embedder, raster_cache, timer
+        )
+        if source is None:
+            # Near-blank page: an empty paragraph keeps the page.
+            doc.add_paragraph()
+        elif "duplicate_of" in entry["image"]:
+            repeat_picture(doc, source)
         else:
-            pairs.append((l_text, ""))
+            embedder.placed(add_full_width_image(doc, source))
+        doc.add_page_break()
+        return
 
-    return pairs
+    # ---- Table rendering ----
+    if page_mode == "table":
+        add_table_rows(doc, profile.table_cells)
+        doc.add_page_break()
+        return
 
 
-def render_profiles_to_doc(doc, pdf, profiles, decision_log):
-    for profile in profiles:
-        page = pdf.pages[profile.page_number - 1]
-        words = profile.words
-        page_mode = profile.detected_mode
-
-        decision_log.append({
-            "page": profile.page_number,
-            "mode": page_mode,
-            "reason": profile.reason
-        })
-
-        # ---- Image-only fallback ----
-        if not words or not is_meaningful_text(words):
-            img = page.to_image(resolution=300).original
-            buf = io.BytesIO()
-            img.save(buf, format="PNG")
-            buf.seek(0)
-            add_full_width_image(doc, buf)
+    # ---- Layout rendering ----
+    if page_mode == "layout":
+        render_layout(profile, doc)
+        doc.add_page_break()
+        return
+
+    # ---- Form rendering ----
+    if page_mode == "form":
+        line_index = line_index_for(profile)
+        columns = split_into_columns(line_index.words)
+        if len(columns) >= 2:
+            lines = [extract_lines(line_index, column) for column in columns]
+            add_table_rows(doc, pair_form_rows(*lines))
             doc.add_page_break()
-            continue
+            return
 
-        # ---- Table rendering ----
-        if page_mode == "table":
-            table = doc.add_table(
-                rows=len(profile.table_cells),
-                cols=len(profile.table_cells[0])
-            )
+    # ---- Structured semantic rendering ----
 
-            for i, row in enumerate(profile.table_cells):
-                for j, cell in enumerate(row):
-                    table.cell(i, j).text = cell
+    with timer.stage("detect_headings"):
+        headings, paragraphs = detect_headings(
+            getattr(profile, "paragraphs", []), profile.line_sizes, typography
+        )
 
-            doc.add_page_break()
-            continue
+    # Render headings
+    for heading, level in headings:
+        doc.add_heading(heading, level=level)
 
+    # Render lists
+    for lst in getattr(profile, "lists", []):
+        for item in lst:
+            doc.add_paragraph(item, style="List Bullet")
 
-        # ---- Layout rendering ----
-        if page_mode == "layout":
-            render_layout(profile, doc)
-            doc.add_page_break()
-            continue
-
-        # ---- Form rendering ----
-        if page_mode == "form":
-            columns = split_into_columns(words)
-            if len(columns) == 2:
-                left_lines = extract_lines(columns[0])
-                right_lines = extract_lines(columns[1])
-                pairs = pair_form_rows(left_lines, right_lines)
-
-                table = doc.add_table(rows=len(pairs), cols=2)
-                for i, (l, r) in enumerate(pairs):
-                    table.cell(i, 0).text = l
-                    table.cell(i, 1).text = r
-
-                doc.add_page_break()
+    # Render paragraphs
+    for text in paragraphs:
+        if text:
+            doc.add_paragraph(text)
+
+    doc.add_page_break()
+
+
+def render_profiles_to_doc(
+    doc,
+    pdf,
+    profiles,
+    decision_log,
+    raster_cache=None,
+    stage_report=None,
+    image_options=None
+):
+    profiles = list(profiles)
+    embedder = ImageEmbedder(
+        doc, image_options,
+        expected_images=sum(needs_image_fallback(p) for p in profiles)
+    )
+    typography = TypographyIndex.from_profiles(profiles)
+    for profile in profiles:
+        page = pdf.pages[profile.page_number - 1]
+        render_page_profile(
+            doc, page, profile, decision_log, raster_cache, stage_report, embedder,
+            typography
+        )
+
+
+def release_page(profile, page):
+    """
+    Drop everything a rendered page no longer needs: the profile's words
+    and line index, and pdfplumber's cached layout objects for the page.
+    """
+    profile.words = []
+    profile.line_index = None
+    page.close()
+
+
+def page_cache_params(extraction=DEFAULT_EXTRACTION_PROFILE):
+    """Hash of everything that shapes a cached PageProfile."""
+    return params_hash({
+        "converter": CONVERTER_VERSION,
+        "extract_words": extraction_options(extraction),
+        "triage": DRAWING_OBJECTS,
+        "analysis": analysis_params(),
+    })
+
+
+def analyze_page(idx, page, instrument=None, extraction=DEFAULT_EXTRACTION_PROFILE):
+    """
+    Extract and analyse one page, with words extracted as the named
+    extraction profile says (see core/extraction.py). With instrument
+    ("time" or "memory"), per-stage timings are stored on the profile's
+    stage_timings.
+
+    Pages that triage finds empty or image-only skip word extraction and
+    analysis; their empty profile sends them straight to the image
+    fallback.
+    """
+    timer = make_timer(instrument)
+
+    with timer.stage("triage"):
+        triage = triage_page(page)
+
+    if has_text_layer(triage):
+        with timer.stage("extract_words"):
+            words = extract_page_words(page, extraction)
+    else:
+        words = []
+
+    profile = build_page_profile(
+        page_number=idx,
+        words=words,
+        images=[],
+        timer=timer
+    )
+    profile.triage = triage
+    profile.stage_timings = timer.stages
+    return profile
+
+
+def _analyze_page_chunk(
+    input_pdf_path,
+    page_numbers,
+    instrument=None,
+    extraction=DEFAULT_EXTRACTION_PROFILE
+):
+    # Runs inside a worker process: each worker opens its own handle,
+    # pdfplumber objects are not picklable but PageProfiles are.
+    profiles = []
+    with tracing_memory(instrument == "memory"), \
+            pdfplumber.open(input_pdf_path) as pdf:
+        for idx in page_numbers:
+            page = pdf.pages[idx - 1]
+            profiles.append(analyze_page(idx, page, instrument, extraction))
+            page.close()
+    return profiles
+
+
+def iter_profiles_parallel(
+    input_pdf_path,
+    page_numbers,
+    workers,
+    chunk_fn=_analyze_page_chunk,
+    initializer=None,
+    initargs=(),
+    chunk_stats=None
+):
+    """
+    Run PASS 1 over a process pool, yielding profiles in page order.
+
+    Pages are split into contiguous chunks (a few per worker, so one slow
+    chunk does not leave the others idle, and at most MAX_CHUNK_PAGES);
+    each chunk is yielded as soon as it and every chunk before it have
+    finished. At most CHUNKS_AHEAD_PER_WORKER chunks per worker are
+    submitted ahead of the consumer, and the next one only when a chunk
+    is yielded, so a slow consumer (stream mode rendering image pages)
+    holds back analysis instead of buffering it. chunk_fn(path, pages)
+    runs in the worker and must return one profile per page. With
+    chunk_stats, chunk_fn returns (profiles, stats) instead and
+    chunk_stats(stats) is called in the parent for every chunk.
+    """
+    page_numbers = list(page_numbers)
+    if not page_numbers:
+        return
+
+    chunk_count = min(len(page_numbers), workers * 4)
+    chunk_size = min(-(-len(page_numbers) // chunk_count), MAX_CHUNK_PAGES)
+    chunks = (
+        page_numbers[i:i + chunk_size]
+        for i in range(0, len(page_numbers), chunk_size)
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=initializer,
+        initargs=initargs
+    ) as pool:
+        pending = deque(
+            pool.submit(chunk_fn, input_pdf_path, pages)
+            for pages in islice(chunks, workers * CHUNKS_AHEAD_PER_WORKER)
+        )
+        while pending:
+            chunk = pending.popleft().result()
+            pages = next(chunks, None)
+            if pages is not None:
+                pending.append(pool.submit(chunk_fn, input_pdf_path, pages))
+            if chunk_stats is not None:
+                chunk, stats = chunk
+                chunk_stats(stats)
+            yield from chunk
+
+
+def _iter_fresh_profiles(input_pdf_path, page_items, workers, instrument, extraction):
+    if workers and workers > 1 and len(page_items) > 1:
+        yield from iter_profiles_parallel(
+            input_pdf_path,
+            [idx for idx, _ in page_items],
+            workers,
+            chunk_fn=partial(
+                _analyze_page_chunk, instrument=instrument, extraction=extraction
+            )
+        )
+    else:
+        for idx, page in page_items:
+            yield analyze_page(idx, page, instrument, extraction)
+
+
+def iter_page_profiles(
+    input_pdf_path,
+    page_items,
+    workers=None,
+    page_cache=None,
+    instrument=None,
+    extraction=DEFAULT_EXTRACTION_PROFILE
+):
+    """
+    Yield one PageProfile per selected page, in page order.
+
+    With a page_cache, pages already analysed for this document and these
+    analysis parameters are loaded from the cache; only the rest are
+    extracted and analysed (and then stored).
+    """
+    if page_cache is None:
+        yield from _iter_fresh_profiles(
+            input_pdf_path, page_items, workers, instrument, extraction
+        )
+        return
+
+    doc_hash = hash_file(input_pdf_path)
+    params = page_cache_params(extraction)
+    cached = page_cache.cached_pages(doc_hash, params)
+
+    missing = [(idx, page) for idx, page in page_items if idx not in cached]
+    page_cache.misses += len(missing)
+    fresh = _iter_fresh_profiles(
+        input_pdf_path, missing, workers, instrument, extraction
+    )
+
+    for idx, page in page_items:
+        if idx in cached:
+            profile = page_cache.get(doc_hash, idx, params)
+            if profile is not None:
+                # Timings stored with the profile belong to an older run.
+                profile.stage_timings = None
+                yield profile
                 continue
+            profile = analyze_page(idx, page, instrument, extraction)
+        else:
+            profile = next(fresh)
 
-        # ---- Structured semantic rendering ----
+        page_cache.put(doc_hash, params, profile)
+        yield profile
 
-        # Render headings
-        for heading in getattr(profile, "headings", []):
-            doc.add_heading(heading, level=1)
 
-        # Render lists
-        for lst in getattr(profile, "lists", []):
-            for item in lst:
-                doc.add_paragraph(item, style="List Bullet")
+def track_progress(profiles, total, progress):
+    """Pass profiles through, calling progress(done, total) after each page."""
+    if progress is None:
+        yield from profiles
+        return
 
-        # Render paragraphs
-        for text in getattr(profile, "paragraphs", []):
-            if text:
-                doc.add_paragraph(text)
+    progress(0, total)
+    for done, profile in enumerate(profiles, start=1):
+        progress(done, total)
+        yield profile
 
-        doc.add_page_break()
 
 def pdf_to_word_no_ocr(
     input_pdf_path,
     output_docx_path,
     report_path=None,
-    pages=None
+    pages=None,
+    workers=None,
+    stream=False,
+    page_cache=None,
+    progress=None,
+    instrument=None,
+    stage_hook=None,
+    image_options=None,
+    writer="python-docx",
+    extraction=DEFAULT_EXTRACTION_PROFILE
 ):
+    """
+    Convert a text-layer PDF to .docx.
+
+    workers > 1 runs page analysis in a process pool. stream=True renders
+    each page as soon as it is analysed and then releases its words and
+    pdfplumber caches, keeping peak memory flat on very long documents.
+    Its heading levels come from the pages seen so far, so they can
+    differ from the two-pass mode's when a larger heading size or most
+    of the body text only appears later in the document.
+    page_cache (a PageCache) reuses profiles from earlier runs.
+    progress, if given, is called as progress(pages_done, pages_total).
+
+    instrument="time" records wall time per stage per page; "memory" also
+    records peak allocation via tracemalloc (which slows the run down).
+    Timings go into the report, which then becomes {"pages": [...],
+    "totals": {...}}, and to stage_hook(page_number, stages) per page and
+    stage_hook(None, totals) once at the end.
+
+    image_options (an ImageOptions) sets the DPI, format, grayscale and
+    byte budget of image-fallback pages.
+
+    writer="streaming" writes the .docx incrementally (see docx_stream.py)
+    instead of building a python-docx Document and saving it at the end;
+    combined with stream=True memory no longer grows with page count.
+
+    extraction names the word-extraction profile (see core/extraction.py).
+
+    Returns the decision log: one report entry per converted page.
+    """
+    if writer not in DOCX_WRITERS:
+        raise ValueError(f"Unknown writer: {writer!r}")
+    extraction_options(extraction)
 
-    doc = Document()
     output_dir = os.path.dirname(output_docx_path)
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
+    if writer == "streaming":
+        doc = StreamingDocument(output_docx_path)
+    else:
+        doc = Document()
+
+    try:
+        return _convert_no_ocr(
+            doc, input_pdf_path, output_docx_path, report_path, pages, workers,
+            stream, page_cache, progress, instrument, stage_hook, image_options,
+            extraction
+        )
+    except BaseException:
+        if writer == "streaming":
+            doc.discard()
+        raise
+
+
+def _convert_no_ocr(
+    doc,
+    input_pdf_path,
+    output_docx_path,
+    report_path,
+    pages,
+    workers,
+    stream,
+    page_cache,
+    progress,
+    instrument,
+    stage_hook,
+    image_options,
+    extraction
+):
+    # Body of pdf_to_word_no_ocr, rendering into an already created doc.
     decision_log = []
+    stage_report = StageReport(instrument, stage_hook) if instrument else None
 
-    with pdfplumber.open(input_pdf_path) as pdf:
-
-        # -------- COLLECT PAGES --------
-        page_items = [
-            (idx, page)
-            for idx, page in enumerate(pdf.pages, start=1)
-            if pages is None or idx in pages
-        ]
+    with tracing_memory(instrument == "memory"):
+        with pdfplumber.open(input_pdf_path) as pdf:
 
-        # -------- PASS 1: ANALYSIS --------
-        profiles = []
-        for idx, page in page_items:
-            words = page.extract_words(use_text_flow=True)
+            # -------- COLLECT PAGES --------
+            page_items = [
+                (idx, page)
+                for idx, page in enumerate(pdf.pages, start=1)
+                if pages is None or idx in pages
+            ]
 
-            profile = build_page_profile(
-                page_number=idx,
-                words=words,
-                images=[]
+            profiles = iter_page_profiles(
+                input_pdf_path, page_items, workers, page_cache, instrument,
+                extraction
             )
-
-            profiles.append(profile)
-
-        # -------- PASS 2: RENDER --------
-        render_profiles_to_doc(doc, pdf, profiles, decision_log)
+            profiles = track_progress(profiles, len(page_items), progress)
+
+            if stream:
+                # -------- ANALYSE + RENDER, ONE PAGE AT A TIME --------
+                # Which pages need images is unknown up front, so the budget
+                # is shared as if every remaining page might. Likewise the
+                # typography index only covers the pages analysed so far:
+                # a heading size first seen on a later page, larger than the
+                # tiers before it, or a later shift in the body size gives
+                # earlier pages other levels than the two-pass mode would.
+                # A pre-pass for sizes would cost about as much as the
+                # extraction itself (pdfplumber's chars are the bulk of it).
+                embedder = ImageEmbedder(doc, image_options)
+                typography = TypographyIndex()
+                for done, profile in enumerate(typography.indexed(profiles)):
+                    embedder.expected_images = embedder.embedded + len(page_items) - done
+                    page = pdf.pages[profile.page_number - 1]
+                    render_page_profile(
+                        doc, page, profile, decision_log,
+                        stage_report=stage_report, embedder=embedder,
+                        typography=typography
+                    )
+                    release_page(profile, page)
+            else:
+                # -------- PASS 1: ANALYSIS --------
+                profiles = list(profiles)
+
+                # -------- PASS 2: RENDER --------
+                render_profiles_to_doc(
+                    doc, pdf, profiles, decision_log,
+                    stage_report=stage_report, image_options=image_options
+                )
+
+        if stage_report is None:
+            doc.save(output_docx_path)
+            report = decision_log
+        else:
+            with stage_report.document.stage("save"):
+                doc.save(output_docx_path)
+            report = {"pages": decision_log, "totals": stage_report.finish()}
 
     if report_path and decision_log:
         import json
         with open(report_path, "w") as f:
-            json.dump(decision_log, f, indent=2)
+            json.dump(report, f, indent=2)
 
-    doc.save(output_docx_path)
+    return decision_log
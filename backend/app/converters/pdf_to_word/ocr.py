@@ -1,33 +1,64 @@
 import os
-import io
-import traceback
+import logging
+from contextlib import contextmanager
+from functools import partial
 import pdfplumber
 from docx import Document
 
-print("🚨 OCR FILE LOADED 🚨")
+from backend.app.core.analysis.build_profile import build_page_profile
+from backend.app.core.extraction import DEFAULT_EXTRACTION_PROFILE, extract_page_words
+from backend.app.converters.pdf_to_word.no_ocr import (
+    is_meaningful_text,
+    iter_profiles_parallel,
+    needs_image_fallback,
+    render_profiles_to_doc,
+    track_progress,
+)
+from backend.app.converters.pdf_to_word.raster_cache import PageRasterCache
+from backend.app.converters.pdf_to_word.triage import has_text_layer, triage_page
 
-try:
-    import pytesseract
-    HAS_OCR = True
-    
-    # ⚠️ ANTIGRAVITY FIX: Set Windows path for Tesseract executable
-    # Change this path if you installed Tesseract somewhere else
-    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-    
-except ImportError:
-    HAS_OCR = False
+logger = logging.getLogger(__name__)
 
-from backend.app.core.analysis.build_profile import build_page_profile
-from backend.app.converters.pdf_to_word.no_ocr import render_profiles_to_doc
+DEFAULT_OCR_WORKERS = int(os.environ.get("PDF_CONVERTER_OCR_WORKERS", "1"))
+
+# Path of the tesseract executable; unset means `tesseract` on PATH.
+TESSERACT_CMD_ENV = "PDF_CONVERTER_TESSERACT_CMD"
+
+
+def ocr_available():
+    """
+    Whether pytesseract can be imported. Probed on first use, not at
+    import, so text-layer conversions never load it; the outcome is kept
+    in the module globals HAS_OCR and pytesseract.
+    """
+    global HAS_OCR, pytesseract
+    if "HAS_OCR" not in globals():
+        try:
+            import pytesseract
+        except ImportError:
+            HAS_OCR = False
+        else:
+            cmd = os.environ.get(TESSERACT_CMD_ENV)
+            if cmd:
+                pytesseract.pytesseract.tesseract_cmd = cmd
+            HAS_OCR = True
+    return HAS_OCR
+
+
+def __getattr__(name):
+    # `from ...ocr import HAS_OCR` runs the probe on demand.
+    if name == "HAS_OCR":
+        return ocr_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def extract_words_ocr(page_image):
     """
     Use pytesseract to extract words with bounding boxes.
     Returns a list of dictionaries compatible with pdfplumber's extract_words format.
     """
-    if not HAS_OCR:
+    if not ocr_available():
         return []
-        
+
     data = pytesseract.image_to_data(page_image, output_type=pytesseract.Output.DICT)
     words = []
     
@@ -119,17 +150,236 @@ def _sort_and_clean_ocr_output(raw_words):
     grouped = _group_into_lines(cleaned)
     return grouped
 
+def probe_text_layer(idx, page, extraction=DEFAULT_EXTRACTION_PROFILE):
+    """
+    Profile built from the page's own text layer, or None when that text
+    is not meaningful and the page needs OCR.
+    """
+    words = extract_page_words(page, extraction)
+    if not words or not is_meaningful_text(words):
+        return None
+    return build_page_profile(page_number=idx, words=words, images=[])
+
+
+def ocr_page(
+    idx,
+    page,
+    raster_cache=None,
+    text_first=False,
+    extraction=DEFAULT_EXTRACTION_PROFILE
+):
+    """
+    OCR one page into a PageProfile. Any failure yields an empty profile,
+    which the renderer turns into a full-width image page.
+
+    With a raster_cache, the 300 DPI raster is kept only if the page is
+    going to need it again as an image fallback. With text_first, pages
+    that already have a usable text layer skip rasterising and OCR.
+    Triage runs first, so pages without any text layer (scans) skip the
+    text-layer probe, which extracts words with the `extraction` profile.
+    """
+    triage = triage_page(page)
+    profile = _recognise_page(
+        idx, page, raster_cache, text_first and has_text_layer(triage), extraction
+    )
+    profile.triage = triage
+    return profile
+
+
+def _recognise_page(idx, page, raster_cache, text_first, extraction):
+    if text_first:
+        profile = probe_text_layer(idx, page, extraction)
+        if profile is not None:
+            return profile
+
+    if not ocr_available():
+        # Auto mode without pytesseract: no OCR runs, the page is an image.
+        profile = build_page_profile(page_number=idx, words=[], images=[])
+        profile.engine = "image"
+        profile.reason = "ocr unavailable"
+        return profile
+
+    logger.debug("OCR page %d", idx)
+    try:
+        if raster_cache is not None:
+            img = raster_cache.get_image(page, idx, resolution=300)
+        else:
+            img = page.to_image(resolution=300).original
+        raw_ocr_words = extract_words_ocr(img)
+        ocr_words = _sort_and_clean_ocr_output(raw_ocr_words)
+
+        safe_words = []
+        for w in ocr_words:
+            try:
+                safe_words.append({
+                    "text": str(w.get("text", "")),
+                    "x0": float(w.get("x0", 0)),
+                    "x1": float(w.get("x1", 0)),
+                    "top": float(w.get("top", 0)),
+                    "bottom": float(w.get("bottom", 0)),
+                    "size": float(w.get("size", 10)),
+                })
+            except Exception:
+                continue
+
+        profile = build_page_profile(
+            page_number=idx,
+            words=safe_words,
+            images=[]
+        )
+        profile.engine = "ocr"
+
+        if raster_cache is not None and not needs_image_fallback(profile):
+            raster_cache.discard(idx, resolution=300)
+
+        return profile
+
+    except Exception as e:
+        # A page OCR cannot read becomes a full-width image instead of
+        # failing the document: an empty profile triggers the fallback.
+        logger.warning("OCR failed on page %d, embedding it as an image", idx, exc_info=True)
+        profile = build_page_profile(page_number=idx, words=[], images=[])
+        profile.engine = "ocr"
+        profile.reason = f"ocr failed: {type(e).__name__}"
+        return profile
+
+
+_worker_raster_cache = None
+
+
+def _init_ocr_worker(omp_thread_limit, spill_dir=None, raster_max_bytes=None):
+    global _worker_raster_cache
+
+    # Tesseract runs as a child process of the worker and inherits this,
+    # so N workers don't each spin up one OpenMP thread per core.
+    if omp_thread_limit:
+        os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+
+    if spill_dir:
+        _worker_raster_cache = PageRasterCache(raster_max_bytes, spill_dir=spill_dir)
+
+
+@contextmanager
+def _omp_thread_limit(limit):
+    """OMP_THREAD_LIMIT=limit for the duration, then the previous value."""
+    previous = os.environ.get("OMP_THREAD_LIMIT")
+    if limit:
+        os.environ["OMP_THREAD_LIMIT"] = str(limit)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("OMP_THREAD_LIMIT", None)
+        else:
+            os.environ["OMP_THREAD_LIMIT"] = previous
+
+
+def _ocr_page_chunk(
+    input_pdf_path,
+    page_numbers,
+    text_first=False,
+    extraction=DEFAULT_EXTRACTION_PROFILE
+):
+    """
+    OCR pages in a pool worker. Returns (profiles, (raster hits, raster
+    misses)), the counts covering this chunk only.
+    """
+    cache = _worker_raster_cache
+    before = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    profiles = []
+    with pdfplumber.open(input_pdf_path) as pdf:
+        for idx in page_numbers:
+            page = pdf.pages[idx - 1]
+            profiles.append(
+                ocr_page(idx, page, _worker_raster_cache, text_first, extraction)
+            )
+            page.close()
+
+    # Kept rasters must reach the shared spill directory before the parent
+    # renders these pages.
+    if cache is None:
+        return profiles, (0, 0)
+    cache.spill_all()
+    return profiles, (cache.hits - before[0], cache.misses - before[1])
+
+
+def iter_ocr_profiles(
+    input_pdf_path,
+    page_items,
+    workers=1,
+    omp_thread_limit=None,
+    raster_cache=None,
+    text_first=False,
+    extraction=DEFAULT_EXTRACTION_PROFILE
+):
+    """
+    OCR profiles in page order. With workers > 1, the workers' raster
+    cache hits and misses are added to raster_cache's counts.
+    """
+    if workers > 1 and len(page_items) > 1:
+        spill_dir = raster_cache.spill_dir if raster_cache is not None else None
+        max_bytes = raster_cache.max_bytes // workers if raster_cache is not None else None
+
+        def add_worker_stats(stats):
+            if raster_cache is not None:
+                raster_cache.hits += stats[0]
+                raster_cache.misses += stats[1]
+
+        yield from iter_profiles_parallel(
+            input_pdf_path,
+            [idx for idx, _ in page_items],
+            workers,
+            chunk_fn=partial(
+                _ocr_page_chunk, text_first=text_first, extraction=extraction
+            ),
+            initializer=_init_ocr_worker,
+            initargs=(omp_thread_limit or 1, spill_dir, max_bytes),
+            chunk_stats=add_worker_stats
+        )
+        return
+
+    # In-process: set the limit for this run only; the API server shares
+    # this environment.
+    with _omp_thread_limit(omp_thread_limit):
+        for idx, page in page_items:
+            yield ocr_page(idx, page, raster_cache, text_first, extraction)
+
+
 def pdf_to_word_ocr(
     input_pdf_path,
     output_docx_path,
     report_path=None,
-    pages=None
+    pages=None,
+    progress=None,
+    workers=None,
+    omp_thread_limit=None,
+    auto=False,
+    image_options=None,
+    extraction=DEFAULT_EXTRACTION_PROFILE,
+    raster_stats=False
 ):
-    print("🚨 OCR FUNCTION CALLED 🚨")
+    """
+    OCR a PDF to .docx.
+
+    workers > 1 fans page OCR out over a process pool (default from
+    PDF_CONVERTER_OCR_WORKERS). omp_thread_limit caps Tesseract's own
+    threads per page; with several workers it defaults to 1.
+    auto=True only OCRs pages without a meaningful text layer; without
+    pytesseract those pages simply become image pages. extraction names
+    the profile for the text-layer probe of auto mode.
+
+    The report is the decision log. With raster_stats it becomes
+    {"pages": [...], "totals": {"raster_cache": {...}}}, the totals holding
+    the page raster cache's hits, misses and hit_rate across all workers.
 
-    if not HAS_OCR:
+    Returns the decision log: one report entry per converted page.
+    """
+    if not ocr_available() and not auto:
         raise RuntimeError("pytesseract is not installed. Please install it to use OCR mode, or use no-OCR mode instead.")
 
+    if workers is None:
+        workers = DEFAULT_OCR_WORKERS
+
     doc = Document()
     output_dir = os.path.dirname(output_docx_path)
     if output_dir:
@@ -144,49 +394,30 @@ def pdf_to_word_ocr(
             if pages is None or idx in pages
         ]
 
-        profiles = []
-        for idx, page in page_items:
-            print(f"🚨 PROCESSING PAGE {idx} 🚨")
-            try:
-                img = page.to_image(resolution=300).original
-                raw_ocr_words = extract_words_ocr(img)
-                ocr_words = _sort_and_clean_ocr_output(raw_ocr_words)
-
-                safe_words = []
-                for w in ocr_words:
-                    try:
-                        safe_words.append({
-                            "text": str(w.get("text", "")),
-                            "x0": float(w.get("x0", 0)),
-                            "x1": float(w.get("x1", 0)),
-                            "top": float(w.get("top", 0)),
-                            "bottom": float(w.get("bottom", 0)),
-                            "size": float(w.get("size", 10)),
-                        })
-                    except Exception:
-                        continue
-
-                profile = build_page_profile(
-                    page_number=idx,
-                    words=safe_words,
-                    images=[]
-                )
-                profiles.append(profile)
-
-            except Exception as e:
-                # ⚠️ ANTIGRAVITY FIX: Catch the error and use image fallback instead of crashing!
-                print(f"[OCR CRASH CAUGHT] Page {idx}: {e}")
-                traceback.print_exc()
-                
-                # Create an empty profile to trigger the full-width image fallback
-                profile = build_page_profile(page_number=idx, words=[], images=[])
-                profiles.append(profile)
-
-        render_profiles_to_doc(doc, pdf, profiles, decision_log)
+        raster_cache = PageRasterCache()
+        try:
+            profiles = iter_ocr_profiles(
+                input_pdf_path, page_items, workers, omp_thread_limit,
+                raster_cache, text_first=auto, extraction=extraction
+            )
+            profiles = list(track_progress(profiles, len(page_items), progress))
+
+            render_profiles_to_doc(
+                doc, pdf, profiles, decision_log, raster_cache,
+                image_options=image_options
+            )
+            cache_stats = raster_cache.stats()
+        finally:
+            raster_cache.close()
+
+    doc.save(output_docx_path)
 
     if report_path and decision_log:
         import json
+        report = decision_log
+        if raster_stats:
+            report = {"pages": decision_log, "totals": {"raster_cache": cache_stats}}
         with open(report_path, "w") as f:
-            json.dump(decision_log, f, indent=2)
+            json.dump(report, f, indent=2)
 
-    doc.save(output_docx_path)
\ No newline at end of file
+    return decision_log
@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+
+from PIL import Image
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _image_bytes(img):
+    return img.width * img.height * len(img.getbands())
+
+
+class PageRasterCache:
+    """
+    Per-conversion cache of rendered page images, keyed by
+    (page number, resolution).
+
+    Images live in memory until `max_bytes` is exceeded; the least recently
+    used ones are then spilled to PNG files in `spill_dir`. The spill
+    directory doubles as the hand-off between OCR worker processes and the
+    renderer, so a page is rasterised at most once per resolution.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, spill_dir=None):
+        self.max_bytes = max_bytes
+        self._owns_dir = spill_dir is None
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix="page-rasters-")
+        self._images = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _spill_path(self, page_number, resolution):
+        return os.path.join(self.spill_dir, f"p{page_number}-r{resolution}.png")
+
+    def get_image(self, page, page_number, resolution=300):
+        key = (page_number, resolution)
+
+        if key in self._images:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return self._images[key]
+
+        path = self._spill_path(page_number, resolution)
+        if os.path.exists(path):
+            self.hits += 1
+            with Image.open(path) as img:
+                img.load()
+                return img.copy()
+
+        self.misses += 1
+        img = page.to_image(resolution=resolution).original
+        self._store(key, img)
+        return img
+
+    def discard(self, page_number, resolution=300):
+        """Forget a raster nobody will ask for again (memory and disk)."""
+        img = self._images.pop((page_number, resolution), None)
+        if img is not None:
+            self._bytes -= _image_bytes(img)
+
+        path = self._spill_path(page_number, resolution)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _store(self, key, img):
+        self._images[key] = img
+        self._bytes += _image_bytes(img)
+
+        while self._bytes > self.max_bytes and self._images:
+            old_key, old_img = self._images.popitem(last=False)
+            self._bytes -= _image_bytes(old_img)
+            old_img.save(self._spill_path(*old_key), format="PNG")
+
+    def spill_all(self):
+        while self._images:
+            key, img = self._images.popitem(last=False)
+            img.save(self._spill_path(*key), format="PNG")
+        self._bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        self._images.clear()
+        self._bytes = 0
+        if self._owns_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
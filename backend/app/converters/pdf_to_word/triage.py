@@ -0,0 +1,62 @@
+"""
+Page triage from pdfplumber's raw objects, before any word extraction.
+
+Counting chars, images and vector objects only needs the page's parsed
+object lists, which extract_words would build anyway (pdfplumber caches
+them on the page), so triaging a text page costs next to nothing while
+image-only and empty pages skip word extraction and analysis entirely.
+"""
+
+# Vector objects that draw something even without text or images.
+DRAWING_OBJECTS = ("rect", "line", "curve")
+
+# Pages of these kinds have no text layer to analyse.
+NO_TEXT_KINDS = ("empty", "image-only")
+
+
+def image_coverage(page):
+    """Share of the page area covered by images (overlaps add up; capped at 1)."""
+    x0, top, x1, bottom = page.bbox
+    area = (x1 - x0) * (bottom - top)
+    if area <= 0:
+        return 0.0
+
+    covered = 0.0
+    for img in page.images:
+        w = min(img["x1"], x1) - max(img["x0"], x0)
+        h = min(img["bottom"], bottom) - max(img["top"], top)
+        if w > 0 and h > 0:
+            covered += w * h
+    return min(1.0, covered / area)
+
+
+def triage_page(page):
+    """
+    Classify a page as "empty", "image-only", "text" or "mixed".
+
+    Returns a dict for the decision report: the kind, visible (non-space)
+    char count, image count, image coverage and per-type object counts.
+    Pages with no visible chars are image-only when they draw anything
+    (images or vector graphics) and empty otherwise.
+    """
+    objects = page.objects
+    chars = sum(1 for c in objects.get("char", ()) if not c["text"].isspace())
+    images = len(objects.get("image", ()))
+    drawings = sum(len(objects.get(kind, ())) for kind in DRAWING_OBJECTS)
+
+    if not chars:
+        kind = "image-only" if images or drawings else "empty"
+    else:
+        kind = "mixed" if images else "text"
+
+    return {
+        "kind": kind,
+        "chars": chars,
+        "images": images,
+        "image_coverage": round(image_coverage(page), 3) if images else 0.0,
+        "objects": {name: len(objs) for name, objs in sorted(objects.items())},
+    }
+
+
+def has_text_layer(triage):
+    return triage["kind"] not in NO_TEXT_KINDS
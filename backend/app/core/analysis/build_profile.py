@@ -1,52 +1,87 @@
+import sys
+
 from .page_profile import PageProfile
 from .detect_columns import detect_columns
 from .paragraph_merge import merge_lines_into_paragraphs
 from .detect_lists import detect_lists
 from .detect_headings import detect_headings
 from .detect_tables import detect_tables
+from .line_index import LineIndex
+from .typography import line_sizes, page_font_sizes
+from .word_array import WordArray
+from backend.app.core.instrumentation import DISABLED_TIMER
 
 
-def build_page_profile(page_number, words, images):
-    profile = PageProfile(page_number=page_number)
-    profile.words = words
-    profile.images = images
+# Detectors whose module-level tunables shape a PageProfile.
+_TUNED_DETECTORS = (
+    detect_columns,
+    merge_lines_into_paragraphs,
+    detect_lists,
+    detect_headings,
+    detect_tables,
+    page_font_sizes,
+)
 
-    profile.columns, profile.column_x_ranges = detect_columns(words)
 
-    if words:
-        profile.text_density = len(words)
+def analysis_params():
+    """
+    Snapshot of every module-level tunable used by page analysis, keyed by
+    "<module>.<NAME>". Used to invalidate cached profiles when tuning changes.
+    """
+    params = {}
+    for func in _TUNED_DETECTORS:
+        module = sys.modules[func.__module__]
+        for name, value in vars(module).items():
+            if name.isupper():
+                params[f"{module.__name__}.{name}"] = repr(value)
+    return params
+
 
-        sizes = [w["size"] for w in words if "size" in w]
-        profile.avg_font_size = sum(sizes) / len(sizes) if sizes else 0.0
+def bucket_lines(line_index):
+    """(top, text) lines of a LineIndex, bucketed to the nearest 10pt of top."""
+    text = line_index.words.text
+    return [
+        (top, " ".join(text[i] for i in line))
+        for top, line in line_index.buckets()
+    ]
 
-        from collections import defaultdict
 
-        line_map = defaultdict(list)
 
-        for w in words:
-            if "top" in w and "text" in w:
-                line_map[round(w["top"] / 10) * 10].append(w["text"])
+def build_page_profile(page_number, words, images, timer=DISABLED_TIMER):
+    """
+    Analyse one page. `timer` (see core/instrumentation.py) records each
+    detector as a named stage when instrumentation is enabled.
 
-        lines = [
-            (top, " ".join(texts))
-            for top, texts in sorted(line_map.items())
-        ]
+    Headings are not split off here: they depend on the font sizes of the
+    whole document, so detect_headings runs at render time against a
+    TypographyIndex built from every page's `font_sizes`.
+    """
+    words = WordArray.from_words(words)
 
-        profile.paragraphs = merge_lines_into_paragraphs(lines)
+    profile = PageProfile(page_number=page_number)
+    profile.words = words
+    with timer.stage("line_index"):
+        profile.line_index = LineIndex(words)
+    profile.images = images
+
+    with timer.stage("detect_columns"):
+        profile.columns, profile.column_x_ranges = detect_columns(words)
+
+    if words:
+        profile.text_density = len(words)
 
-        profile.lists, profile.paragraphs = detect_lists(profile.paragraphs)
+        with timer.stage("font_sizes"):
+            profile.font_sizes = page_font_sizes(words)
+            if profile.font_sizes:
+                profile.line_sizes = line_sizes(profile.line_index)
 
-        word_sizes = {}
-        for w in words:
-            if "text" in w and "size" in w:
-                word_sizes.setdefault(w["text"], []).append(w["size"])
+        with timer.stage("merge_paragraphs"):
+            profile.paragraphs = merge_lines_into_paragraphs(bucket_lines(profile.line_index))
 
-        profile.headings, profile.paragraphs = detect_headings(
-            profile.paragraphs,
-            profile.avg_font_size,
-            word_sizes
-        )
+        with timer.stage("detect_lists"):
+            profile.lists, profile.paragraphs = detect_lists(profile.paragraphs)
 
-    detect_tables(profile)
+    with timer.stage("detect_tables"):
+        detect_tables(profile)
     profile.decide_mode()
     return profile
@@ -1,3 +1,11 @@
+from .word_array import WordArray
+
+# --- Tunables ---
+GAP_THRESHOLD = 35      # minimum gap (pts) to consider a column separator
+MIN_WORDS_PER_COL = 8   # each column must have at least this many words
+MIN_COL_WIDTH = 60      # right column must span at least this many pts
+
+
 def detect_columns(words):
     """
     Detect whether a page has a multi-column layout using gap-based analysis.
@@ -18,16 +26,15 @@ def detect_columns(words):
     if not words:
         return 1, []
 
-    # --- Tunables ---
-    GAP_THRESHOLD = 35      # minimum gap (pts) to consider a column separator
-    MIN_WORDS_PER_COL = 8   # each column must have at least this many words
-    MIN_COL_WIDTH = 60      # right column must span at least this many pts
-
-    x_positions = sorted(w["x0"] for w in words)
+    words = WordArray.from_words(words)
+    x0 = words.x0
+    x_positions = sorted(x0)
 
     if len(x_positions) < 2:
         return 1, [(x_positions[0], x_positions[0])]
 
+    single_column = (1, [(x_positions[0], words.max_x1())])
+
     # --- Find the largest gap that exceeds the threshold ---
     best_gap = 0
     best_boundary = None
@@ -40,30 +47,28 @@ def detect_columns(words):
 
     if best_gap < GAP_THRESHOLD or best_boundary is None:
         # No significant gap found — single column
-        return 1, [(min(x_positions), max(w["x1"] for w in words))]
+        return single_column
 
     # --- Split words into left / right clusters ---
-    left_words = [w for w in words if w["x0"] < best_boundary]
-    right_words = [w for w in words if w["x0"] >= best_boundary]
+    left = [i for i in range(len(words)) if x0[i] < best_boundary]
+    right = [i for i in range(len(words)) if x0[i] >= best_boundary]
 
     # --- Validate cluster sizes ---
-    if len(left_words) < MIN_WORDS_PER_COL or len(right_words) < MIN_WORDS_PER_COL:
-        return 1, [(min(x_positions), max(w["x1"] for w in words))]
+    if len(left) < MIN_WORDS_PER_COL or len(right) < MIN_WORDS_PER_COL:
+        return single_column
 
     # --- Guard against indentation false-positives ---
     # If the "right column" is very narrow, it's probably indented text,
     # not a real second column.
-    right_x0s = [w["x0"] for w in right_words]
-    right_x1s = [w["x1"] for w in right_words]
-    right_width = max(right_x1s) - min(right_x0s)
+    right_x_min = words.min_x0(right)
+    right_x_max = words.max_x1(right)
+    right_width = right_x_max - right_x_min
 
     if right_width < MIN_COL_WIDTH:
-        return 1, [(min(x_positions), max(w["x1"] for w in words))]
+        return single_column
 
     # --- Build x-range boundaries ---
-    left_x_min = min(w["x0"] for w in left_words)
-    left_x_max = max(w["x1"] for w in left_words)
-    right_x_min = min(right_x0s)
-    right_x_max = max(right_x1s)
+    left_x_min = words.min_x0(left)
+    left_x_max = words.max_x1(left)
 
     return 2, [(left_x_min, left_x_max), (right_x_min, right_x_max)]
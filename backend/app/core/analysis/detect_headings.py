@@ -14,7 +14,12 @@ def looks_like_heading(text):
     return title_case >= max(1, len(words) // 2)
 
 
-def detect_headings(paragraphs, avg_font_size, word_sizes):
+def detect_headings(paragraphs, line_sizes, typography):
+    """
+    Split paragraphs into ([(heading text, level)], remaining paragraphs).
+    line_sizes gives each short line's font size (see typography.py) and
+    typography, a TypographyIndex, the level of that size in the document.
+    """
     headings = []
     remaining = []
 
@@ -27,13 +32,13 @@ def detect_headings(paragraphs, avg_font_size, word_sizes):
             remaining.append(text)
             continue
 
-        sizes = word_sizes.get(text)
-        if not sizes:
+        size = line_sizes.get(text)
+        if size is None:
             remaining.append(text)
             continue
 
-        mean_size = sum(sizes) / len(sizes)
-        if mean_size < avg_font_size * SIZE_SCALE:
+        level = typography.heading_level(size)
+        if level is None:
             remaining.append(text)
             continue
 
@@ -41,6 +46,6 @@ def detect_headings(paragraphs, avg_font_size, word_sizes):
             remaining.append(text)
             continue
 
-        headings.append(text)
+        headings.append((text, level))
 
     return headings, remaining
@@ -1,3 +1,7 @@
+from bisect import bisect_left, insort
+
+from .line_index import line_index_for
+
 MIN_COL_REPEAT = 4
 ROW_Y_THRESHOLD = 8
 COL_X_THRESHOLD = 15
@@ -6,52 +10,79 @@ MIN_COLS = 2
 MIN_MULTI_CELL_ROWS_RATIO = 0.6
 
 
-def detect_tables(profile):
-    words = profile.words
-    if not words:
-        return
+def match_column(columns, x):
+    """
+    Index of the first (leftmost) column within COL_X_THRESHOLD of x.
 
-    # ---- Group words into rows ----
-    rows = []
-    current = []
+    Columns are always more than COL_X_THRESHOLD apart, so at most two can
+    match; checking one extra neighbour each side of the bisect point
+    absorbs float rounding at the window edges, and the exact abs() test
+    keeps results identical to a linear scan.
+    """
+    i = bisect_left(columns, x - COL_X_THRESHOLD)
+    for j in range(max(0, i - 1), min(len(columns), i + 2)):
+        if abs(x - columns[j]) <= COL_X_THRESHOLD:
+            return j
+    return None
 
-    for w in sorted(words, key=lambda x: (x["top"], x["x0"])):
-        if not current:
-            current.append(w)
-            continue
 
-        if abs(w["top"] - current[-1]["top"]) <= ROW_Y_THRESHOLD:
-            current.append(w)
-        else:
-            rows.append(current)
-            current = [w]
+def count_column_anchors(rows):
+    """
+    Cluster word x0 positions (`rows` is a list of per-row x0 lists) into
+    column anchors and count, per anchor, how many rows touch it.
 
-    if current:
-        rows.append(current)
+    A word joins the earliest-created anchor within COL_X_THRESHOLD, or
+    starts a new one. Anchors are kept in a sorted array so each lookup is
+    a bisect plus the same neighbour check as match_column, rather than a
+    scan over every anchor.
 
-    if len(rows) < MIN_ROWS:
-        return
-
-    # ---- Count repeated x positions across rows ----
+    Returns {anchor_x: row_count} in anchor creation order.
+    """
     col_counts = {}
+    anchor_xs = []       # sorted anchor positions
+    anchor_order = {}    # anchor -> creation index
 
     for row in rows:
         seen_in_row = set()
-        for w in row:
-            x = w["x0"]
-
-            matched = False
-            for cx in list(col_counts.keys()):
-                if abs(x - cx) <= COL_X_THRESHOLD:
-                    if cx not in seen_in_row:
-                        col_counts[cx] += 1
-                        seen_in_row.add(cx)
-                    matched = True
-                    break
-
-            if not matched:
+        for x in row:
+
+            matched = None
+            i = bisect_left(anchor_xs, x - COL_X_THRESHOLD)
+            for cx in anchor_xs[i - 1 if i else 0:i + 2]:
+                if abs(x - cx) <= COL_X_THRESHOLD and (
+                    matched is None or anchor_order[cx] < anchor_order[matched]
+                ):
+                    matched = cx
+
+            if matched is None:
+                anchor_order[x] = len(anchor_order)
+                insort(anchor_xs, x)
                 col_counts[x] = 1
                 seen_in_row.add(x)
+            elif matched not in seen_in_row:
+                col_counts[matched] += 1
+                seen_in_row.add(matched)
+
+    return col_counts
+
+
+def detect_tables(profile):
+    words = profile.words
+    if not words:
+        return
+
+    line_index = line_index_for(profile)
+    words = line_index.words
+    x0 = words.x0
+
+    # ---- Group words into rows (lists of word indices) ----
+    rows = line_index.lines(ROW_Y_THRESHOLD)
+
+    if len(rows) < MIN_ROWS:
+        return
+
+    # ---- Count repeated x positions across rows ----
+    col_counts = count_column_anchors([[x0[i] for i in row] for row in rows])
 
     columns = [
         cx for cx, count in col_counts.items()
@@ -70,16 +101,14 @@ def detect_tables(profile):
             return
 
 
+    # ---- Assign every word to a column once ----
+    row_cols = [[match_column(columns, x0[i]) for i in row] for row in rows]
+
     # ---- Check how many rows actually have multiple column hits ----
     multi_cell_rows = 0
 
-    for row in rows:
-        hits = 0
-        for w in row:
-            for cx in columns:
-                if abs(w["x0"] - cx) <= COL_X_THRESHOLD:
-                    hits += 1
-                    break
+    for cols in row_cols:
+        hits = len(cols) - cols.count(None)
         if hits >= 3:
             multi_cell_rows += 1
 
@@ -89,24 +118,15 @@ def detect_tables(profile):
     # ---- Build grid ----
     grid = []
 
-    for row in rows:
+    for row, cols in zip(rows, row_cols):
         cells = [""] * len(columns)
-        for w in row:
-            for i, cx in enumerate(columns):
-                if abs(w["x0"] - cx) <= COL_X_THRESHOLD:
-                    cells[i] += w["text"] + " "
-                    break
+        for i, col in zip(row, cols):
+            if col is not None:
+                cells[col] += words.text[i] + " "
         grid.append([c.strip() for c in cells])
     
     # ---- Reject if row widths vary too much (likely layout) ----
-    row_widths = []
-
-    for row in rows:
-        if not row:
-            continue
-        min_x = min(w["x0"] for w in row)
-        max_x = max(w["x1"] for w in row)
-        row_widths.append(max_x - min_x)
+    row_widths = [words.max_x1(row) - words.min_x0(row) for row in rows]
 
     if not row_widths:
         return
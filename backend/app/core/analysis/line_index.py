@@ -0,0 +1,84 @@
+from collections import defaultdict
+
+from .word_array import WordArray
+
+
+class LineIndex:
+    """
+    One page's words in reading order, sorted once, plus line groupings.
+
+    Detectors and renderers ask for lines at their own y-threshold, either
+    for the whole page or for a subset of word indices (a column). Subsets
+    are filtered from the shared order instead of being re-sorted; the
+    result is the same as sorting the subset by (top, x0) with a stable
+    sort.
+    """
+
+    def __init__(self, words):
+        self.words = WordArray.from_words(words)
+        self.order = self.words.position_order()
+        self._lines = {}
+
+    def lines(self, threshold, indices=None):
+        """
+        Word-index lines: a word joins the current line when its top is
+        within `threshold` of the previous word's top. Whole-page results
+        are cached per threshold.
+        """
+        if indices is None:
+            if threshold not in self._lines:
+                self._lines[threshold] = self._group(self.order, threshold)
+            return self._lines[threshold]
+
+        subset = set(indices)
+        return self._group([i for i in self.order if i in subset], threshold)
+
+    def _group(self, ordered, threshold):
+        top = self.words.top
+        groups = []
+        current = []
+        prev_top = None
+
+        for i in ordered:
+            if current and abs(top[i] - prev_top) > threshold:
+                groups.append(current)
+                current = []
+            current.append(i)
+            prev_top = top[i]
+
+        if current:
+            groups.append(current)
+        return groups
+
+    def buckets(self, step=10):
+        """
+        (bucket top, word indices) lines: words grouped by top rounded to
+        the nearest `step` points, buckets in top order and words in
+        extraction order within each. Cached per step.
+        """
+        key = ("buckets", step)
+        if key not in self._lines:
+            line_map = defaultdict(list)
+            for i, top in enumerate(self.words.top):
+                line_map[round(top / step) * step].append(i)
+            self._lines[key] = sorted(line_map.items())
+        return self._lines[key]
+
+    def text(self, line):
+        return " ".join(self.words.text[i] for i in line).strip()
+
+    def __getstate__(self):
+        # Groupings are cheap to rebuild; keep pickled profiles small.
+        return self.words
+
+    def __setstate__(self, words):
+        self.words = words
+        self.order = words.position_order()
+        self._lines = {}
+
+
+def line_index_for(profile):
+    """The profile's LineIndex, building it for profiles that lack one."""
+    if getattr(profile, "line_index", None) is None:
+        profile.line_index = LineIndex(profile.words)
+    return profile.line_index
@@ -7,11 +7,18 @@ class PageProfile:
     words: list = field(default_factory=list)
     images: list = field(default_factory=list)
 
+    # Shared sort order and line groupings of `words` (see line_index.py).
+    line_index: object = None
+
     columns: int = 1
     column_x_ranges: list = field(default_factory=list)
 
     text_density: float = 0.0
-    avg_font_size: float = 0.0
+
+    # {rounded font size: word count} and {short line text: font size},
+    # the page's share of the document's TypographyIndex (typography.py).
+    font_sizes: dict = field(default_factory=dict)
+    line_sizes: dict = field(default_factory=dict)
 
     has_form_alignment: bool = False
     has_table_grid: bool = False
@@ -19,6 +26,17 @@ class PageProfile:
     detected_mode: str = "semantic"
     reason: str = ""
 
+    # Which engine produced `words`: "text-layer" (pdfplumber), "ocr", or
+    # "image" when OCR was wanted but pytesseract is missing.
+    engine: str = "text-layer"
+
+    # Opt-in analysis stage timings (see core/instrumentation.py).
+    stage_timings: dict = None
+
+    # Object-level page classification done before word extraction
+    # (see converters/pdf_to_word/triage.py).
+    triage: dict = None
+
     def decide_mode(self):
         if self.has_table_grid:
             self.detected_mode = "table"
@@ -0,0 +1,105 @@
+"""
+Document-wide font statistics.
+
+Page analysis records a small font-size histogram per page (`font_sizes`)
+and the size of every short line (`line_sizes`). A TypographyIndex adds
+the page histograms up in one streaming pass over the analysed pages, so
+heading detection compares paragraphs against the body size of the whole
+document instead of the page they sit on, and sizes above body size map
+to heading levels.
+
+An index grown page by page (indexed(), used by stream mode) only knows
+the pages so far, so its levels can differ from the whole document's.
+"""
+from collections import Counter
+
+from .detect_headings import MAX_HEADING_WORDS, SIZE_SCALE
+
+# Sizes are bucketed to this many points, so 11.96pt and 12pt are one size.
+SIZE_STEP = 0.5
+
+# Heading sizes beyond this many tiers share the last level.
+MAX_HEADING_LEVELS = 3
+
+
+def round_size(size):
+    return round(size / SIZE_STEP) * SIZE_STEP
+
+
+def page_font_sizes(words):
+    """{rounded font size: word count} for words that carry a size."""
+    sizes = Counter()
+    for size, count in Counter(words.sizes()).items():
+        sizes[round_size(size)] += count
+    return dict(sizes)
+
+
+def line_sizes(line_index):
+    """
+    {line text: mean font size} for lines of at most MAX_HEADING_WORDS
+    words. Lines are the LineIndex buckets build_profile.bucket_lines
+    uses, so a one-line paragraph finds its size by its text.
+    """
+    text, size = line_index.words.text, line_index.words.size
+    sizes = {}
+    for _, line in line_index.buckets():
+        if len(line) > MAX_HEADING_WORDS:
+            continue
+        known = [size[i] for i in line if size[i] == size[i]]    # NaN: no size
+        if known:
+            sizes[" ".join(text[i] for i in line)] = sum(known) / len(known)
+    return sizes
+
+
+class TypographyIndex:
+    """Font-size histogram of a document, grown page by page."""
+
+    def __init__(self):
+        self.histogram = Counter()
+        self._tiers = None
+
+    def add(self, profile):
+        self.histogram.update(profile.font_sizes or {})
+        self._tiers = None
+
+    def indexed(self, profiles):
+        """Yield `profiles` unchanged, adding each to the index on the way."""
+        for profile in profiles:
+            self.add(profile)
+            yield profile
+
+    @classmethod
+    def from_profiles(cls, profiles):
+        index = cls()
+        for profile in profiles:
+            index.add(profile)
+        return index
+
+    @property
+    def body_size(self):
+        """The most common size (by word count); the smaller one on a tie."""
+        if not self.histogram:
+            return None
+        return min(self.histogram, key=lambda size: (-self.histogram[size], size))
+
+    def heading_tiers(self):
+        """Sizes large enough for headings, largest first."""
+        if self._tiers is None:
+            body = self.body_size
+            self._tiers = [] if body is None else sorted(
+                (size for size in self.histogram if size >= body * SIZE_SCALE),
+                reverse=True
+            )
+        return self._tiers
+
+    def heading_level(self, size):
+        """1 for the largest heading tier, and so on; None for non-heading sizes."""
+        size = round_size(size)
+        tiers = self.heading_tiers()
+        if size not in tiers:
+            body = self.body_size
+            if body is None or size < body * SIZE_SCALE:
+                return None
+            # A size the index has not seen: ranked among the known tiers.
+            tiers = sorted(tiers + [size], reverse=True)
+        return min(tiers.index(size) + 1, MAX_HEADING_LEVELS)
@@ -0,0 +1,96 @@
+import math
+from array import array
+
+
+NO_SIZE = math.nan
+
+
+class WordArray:
+    """
+    Columnar storage for one page's words.
+
+    Coordinates live in packed float arrays (8 bytes per value) and the
+    text in a plain list, instead of one ~1 KB dict per word. Analysis
+    code works on the columns and on index lists; code that still expects
+    pdfplumber-style dicts can iterate or index the array and gets a
+    small dict per word, built on demand.
+    """
+
+    __slots__ = ("text", "x0", "x1", "top", "bottom", "size", "_order")
+
+    def __init__(self, text=(), x0=(), x1=(), top=(), bottom=(), size=()):
+        self.text = list(text)
+        self.x0 = array("d", x0)
+        self.x1 = array("d", x1)
+        self.top = array("d", top)
+        self.bottom = array("d", bottom)
+        self.size = array("d", size) if size else array("d", [NO_SIZE] * len(self.text))
+        self._order = None
+
+    @classmethod
+    def from_words(cls, words):
+        if isinstance(words, cls):
+            return words
+        return cls(
+            text=[w["text"] for w in words],
+            x0=[w["x0"] for w in words],
+            x1=[w["x1"] for w in words],
+            top=[w["top"] for w in words],
+            bottom=[w["bottom"] for w in words],
+            size=[w.get("size", NO_SIZE) for w in words],
+        )
+
+    def __len__(self):
+        return len(self.text)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        word = {
+            "text": self.text[i],
+            "x0": self.x0[i],
+            "x1": self.x1[i],
+            "top": self.top[i],
+            "bottom": self.bottom[i],
+        }
+        size = self.size[i]
+        if size == size:    # NaN marks "no size"
+            word["size"] = size
+        return word
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getstate__(self):
+        return (self.text, self.x0, self.x1, self.top, self.bottom, self.size, self._order)
+
+    def __setstate__(self, state):
+        (self.text, self.x0, self.x1, self.top, self.bottom, self.size,
+         self._order) = state
+
+    # ---- Vector-style helpers used by the detectors ----
+
+    def sizes(self):
+        return [s for s in self.size if s == s]
+
+    def position_order(self):
+        """Word indices sorted by (top, x0); computed once per page."""
+        if self._order is None:
+            # The index breaks (top, x0) ties, matching a stable sort.
+            keyed = sorted(zip(self.top, self.x0, range(len(self))))
+            self._order = [i for _, _, i in keyed]
+        return self._order
+
+    def min_x0(self, indices=None):
+        if indices is None:
+            return min(self.x0)
+        x0 = self.x0
+        return min(x0[i] for i in indices)
+
+    def max_x1(self, indices=None):
+        if indices is None:
+            return max(self.x1)
+        x1 = self.x1
+        return max(x1[i] for i in indices)
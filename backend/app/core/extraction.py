@@ -0,0 +1,55 @@
+"""
+Named word-extraction profiles.
+
+A profile is the keyword arguments for pdfplumber's extract_words plus
+one option of our own, "dedupe_chars", which drops duplicate overprinted
+chars (fake bold) before words are built. Profiles trade extraction time
+against what the analysis can see:
+
+  text-flow   content-stream order + word font sizes (default)
+  positional  position order; the detectors re-sort by position anyway
+  fonts       positional + word font sizes
+  dedupe      fonts + duplicate chars removed, for fake-bold PDFs
+  tight       positional with smaller tolerances, for tightly set text
+              whose words run together
+
+Heading detection needs word font sizes (SIZE_ATTRS); the profiles
+without them are faster but never produce headings.
+
+backend/benchmarks/bench_extraction.py times each profile on the
+synthetic corpus, and what requesting sizes costs on top of it.
+"""
+
+# The word attributes heading detection reads (see analysis/typography.py).
+SIZE_ATTRS = ["size"]
+
+DEFAULT_EXTRACTION_PROFILE = "text-flow"
+
+EXTRACTION_PROFILES = {
+    "text-flow": {"use_text_flow": True, "extra_attrs": SIZE_ATTRS},
+    "positional": {"use_text_flow": False},
+    "fonts": {"use_text_flow": False, "extra_attrs": SIZE_ATTRS},
+    "dedupe": {"use_text_flow": False, "extra_attrs": SIZE_ATTRS, "dedupe_chars": True},
+    "tight": {"use_text_flow": False, "x_tolerance": 1.5, "y_tolerance": 2},
+}
+
+
+def extraction_options(profile=DEFAULT_EXTRACTION_PROFILE):
+    """The options of a named profile; ValueError for an unknown name."""
+    try:
+        return EXTRACTION_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown extraction profile: {profile!r}")
+
+
+def extract_page_words(page, profile=DEFAULT_EXTRACTION_PROFILE):
+    """A pdfplumber page's words, extracted as the named profile says."""
+    return extract_words(page, extraction_options(profile))
+
+
+def extract_words(page, options):
+    """A pdfplumber page's words, extracted with explicit profile options."""
+    options = dict(options)
+    if options.pop("dedupe_chars", False):
+        page = page.dedupe_chars()
+    return page.extract_words(**options)
@@ -0,0 +1,155 @@
+"""
+Opt-in per-stage instrumentation: wall time and peak allocation.
+
+A StageTimer records named stages for one page (or for the document as a
+whole); a StageReport collects page timers into per-document totals and
+forwards each page, and finally the totals, to an optional hook.
+
+When instrumentation is off, code uses DISABLED_TIMER, whose stage()
+returns a shared no-op context manager.
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+INSTRUMENT_MODES = ("time", "memory")
+
+_NOOP_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("timer", "name", "start", "start_bytes", "peak")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        timer = self.timer
+        if timer.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # reset_peak() below would hide this from enclosing stages.
+            for outer in timer._stack:
+                outer.peak = max(outer.peak, peak)
+            tracemalloc.reset_peak()
+            self.start_bytes = self.peak = current
+        else:
+            self.start_bytes = None
+        timer._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        timer = self.timer
+        timer._stack.pop()
+
+        peak_bytes = None
+        if self.start_bytes is not None:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            for outer in timer._stack:
+                outer.peak = max(outer.peak, self.peak)
+            peak_bytes = self.peak - self.start_bytes
+
+        timer.add(self.name, elapsed, peak_bytes)
+        return False
+
+
+class StageTimer:
+    """Named stage timings: {name: {"seconds": float, "peak_bytes": int|None}}."""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.stages = {}
+        self._stack = []
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def add(self, name, seconds, peak_bytes=None):
+        # A stage seen twice (e.g. two tables on a page) accumulates time
+        # and keeps the larger peak.
+        entry = self.stages.setdefault(name, {"seconds": 0.0, "peak_bytes": None})
+        entry["seconds"] += seconds
+        if peak_bytes is not None:
+            entry["peak_bytes"] = max(entry["peak_bytes"] or 0, peak_bytes)
+
+
+class _DisabledTimer:
+    stages = None
+
+    def stage(self, name):
+        return _NOOP_STAGE
+
+
+DISABLED_TIMER = _DisabledTimer()
+
+
+def make_timer(instrument):
+    """A StageTimer for instrument mode "time"/"memory", or DISABLED_TIMER."""
+    if not instrument:
+        return DISABLED_TIMER
+    return StageTimer(memory=instrument == "memory")
+
+
+@contextmanager
+def tracing_memory(enabled=True):
+    """Run the block under tracemalloc, stopping it again if we started it."""
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+class StageReport:
+    """
+    Per-document collector. hook(page_number, stages) is called for every
+    page as it is recorded, then once as hook(None, totals) by finish().
+    """
+
+    def __init__(self, instrument="time", hook=None):
+        if instrument not in INSTRUMENT_MODES:
+            raise ValueError(f"Unknown instrument mode: {instrument!r}")
+        self.memory = instrument == "memory"
+        self.hook = hook
+        self.document = StageTimer(self.memory)
+        self.pages = 0
+        self._totals = StageTimer(self.memory)
+        self._start = time.perf_counter()
+
+    def page_timer(self):
+        return StageTimer(self.memory)
+
+    def add_page(self, page_number, *stage_dicts):
+        """Merge the page's stage dicts, fold them into the totals, return them."""
+        merged = StageTimer()
+        for stages in stage_dicts:
+            for name, entry in (stages or {}).items():
+                merged.add(name, entry["seconds"], entry["peak_bytes"])
+                self._totals.add(name, entry["seconds"], entry["peak_bytes"])
+
+        self.pages += 1
+        if self.hook:
+            self.hook(page_number, merged.stages)
+        return merged.stages
+
+    def totals(self):
+        stages = dict(self._totals.stages)
+        for name, entry in self.document.stages.items():
+            stages[name] = dict(entry)
+        return {
+            "pages": self.pages,
+            "wall_seconds": time.perf_counter() - self._start,
+            "stages": stages,
+        }
+
+    def finish(self):
+        totals = self.totals()
+        if self.hook:
+            self.hook(None, totals)
+        return totals
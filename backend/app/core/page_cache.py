@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+
+
+DEFAULT_PAGE_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "storage",
+    "page_cache.sqlite3",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_profiles (
+    doc_hash   TEXT    NOT NULL,
+    page       INTEGER NOT NULL,
+    params     TEXT    NOT NULL,
+    profile    BLOB    NOT NULL,
+    last_used  REAL    NOT NULL,
+    PRIMARY KEY (doc_hash, page, params)
+)
+"""
+
+
+def params_hash(params):
+    raw = json.dumps(params, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class PageCache:
+    """
+    Persistent store of analysed PageProfiles (words included), keyed by
+    (document SHA-256, page number, analysis-parameter hash).
+
+    Profiles are pickled and zlib-compressed into a single SQLite file,
+    so re-running a wider page range only analyses the new pages.
+    """
+
+    def __init__(self, path=DEFAULT_PAGE_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def cached_pages(self, doc_hash, params):
+        rows = self._conn.execute(
+            "SELECT page FROM page_profiles WHERE doc_hash = ? AND params = ?",
+            (doc_hash, params),
+        )
+        return {page for (page,) in rows}
+
+    def get(self, doc_hash, page, params):
+        row = self._conn.execute(
+            "SELECT profile FROM page_profiles "
+            "WHERE doc_hash = ? AND page = ? AND params = ?",
+            (doc_hash, page, params),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._conn.execute(
+            "UPDATE page_profiles SET last_used = ? "
+            "WHERE doc_hash = ? AND page = ? AND params = ?",
+            (time.time(), doc_hash, page, params),
+        )
+        self._conn.commit()
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def put(self, doc_hash, params, profile):
+        blob = zlib.compress(pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO page_profiles "
+            "(doc_hash, page, params, profile, last_used) VALUES (?, ?, ?, ?, ?)",
+            (doc_hash, profile.page_number, params, blob, time.time()),
+        )
+        self._conn.commit()
+
+    def stats(self):
+        entries, documents, size = self._conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT doc_hash), "
+            "COALESCE(SUM(LENGTH(profile)), 0) FROM page_profiles"
+        ).fetchone()
+        param_sets = self._conn.execute(
+            "SELECT params, COUNT(*) FROM page_profiles GROUP BY params"
+        ).fetchall()
+        return {
+            "path": self.path,
+            "entries": entries,
+            "documents": documents,
+            "bytes": size,
+            "param_sets": dict(param_sets),
+        }
+
+    def prune(self, max_age_days=None, keep_params=None):
+        """
+        Remove entries unused for `max_age_days` and/or entries built with
+        analysis parameters other than `keep_params` (one params hash or a
+        list of them). Returns rows removed.
+        """
+        clauses = []
+        args = []
+        if max_age_days is not None:
+            clauses.append("last_used < ?")
+            args.append(time.time() - max_age_days * 86400)
+        if keep_params is not None:
+            if isinstance(keep_params, str):
+                keep_params = [keep_params]
+            clauses.append(f"params NOT IN ({', '.join('?' * len(keep_params))})")
+            args.extend(keep_params)
+
+        if not clauses:
+            return 0
+
+        cur = self._conn.execute(
+            "DELETE FROM page_profiles WHERE " + " OR ".join(clauses), args
+        )
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        return cur.rowcount
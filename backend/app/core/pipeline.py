@@ -1,10 +1,13 @@
-def analyze_document(pages):
+from backend.app.core.analysis.build_profile import build_page_profile
+from backend.app.core.extraction import DEFAULT_EXTRACTION_PROFILE, extract_page_words
+
+
+def analyze_document(pages, extraction=DEFAULT_EXTRACTION_PROFILE):
     profiles = []
 
     for page_number, page in pages:
-        words = page.extract_words(use_text_flow=True)
+        words = extract_page_words(page, extraction)
 
-        from backend.app.core.analysis.build_profile import build_page_profile
         profile = build_page_profile(
             page_number=page_number,
             words=words,
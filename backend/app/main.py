@@ -1,12 +1,29 @@
 import os
 import tempfile
+import time
 import traceback
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from starlette.background import BackgroundTask
 
-from backend.app.converters.pdf_to_word.no_ocr import pdf_to_word_no_ocr
-from backend.app.converters.pdf_to_word.ocr import HAS_OCR, pdf_to_word_ocr
+from backend.app.api import metrics
+from backend.app.api.jobs import router as jobs_router
+from backend.app.api.uploads import (
+    UploadLimitMiddleware,
+    max_upload_bytes_from_env,
+    save_upload,
+)
+from backend.app.converters.pdf_to_word import (
+    CONVERTER_VERSION,
+    ocr_available,
+    parse_ocr_mode,
+    pdf_to_word_no_ocr,
+    pdf_to_word_ocr,
+)
+from backend.app.core.extraction import DEFAULT_EXTRACTION_PROFILE, EXTRACTION_PROFILES
+from backend.app.utils.pages import format_pages, parse_pages
+from backend.app.utils.result_cache import cache_from_env, conversion_key
 
 app = FastAPI(
     title="PDF to Word Converter API",
@@ -14,32 +31,75 @@ app = FastAPI(
     debug=True,
 )
 
+app.include_router(jobs_router)
+app.include_router(metrics.router)
+app.add_middleware(UploadLimitMiddleware)
+
+# Created on first use (see get_conversion_cache), not at import, since it
+# creates the cache directory.
+conversion_cache = None
+
+
+def get_conversion_cache():
+    global conversion_cache
+    if conversion_cache is None:
+        conversion_cache = cache_from_env()
+    return conversion_cache
+
 
 @app.middleware("http")
 async def catch_exceptions(request: Request, call_next):
     try:
-        return await call_next(request)
+        response = await call_next(request)
     except Exception:
+        metrics.http_responses_total.inc(status="5xx")
         print("\n=== GLOBAL ERROR ===")
         traceback.print_exc()
         raise
+    metrics.http_responses_total.inc(status=f"{response.status_code // 100}xx")
+    return response
 
 def cleanup_files(files):
     for f in files:
+        metrics.temp_files.discard(f)
         if os.path.exists(f):
             try:
                 os.remove(f)
             except Exception:
                 pass
 
+@app.get("/cache/stats")
+async def cache_stats():
+    return get_conversion_cache().stats()
+
 @app.post("/convert")
-async def convert_pdf(file: UploadFile = File(...), use_ocr: bool = Form(False)):
+async def convert_pdf(
+    file: UploadFile = File(...),
+    use_ocr: str = Form("false"),
+    pages: str = Form("all"),
+    extraction: str = Form(DEFAULT_EXTRACTION_PROFILE),
+):
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+
+    try:
+        ocr_mode = parse_ocr_mode(use_ocr)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="use_ocr must be true, false or auto.")
         
-    if use_ocr and not HAS_OCR:
+    if ocr_mode == "on" and not ocr_available():
         raise HTTPException(status_code=500, detail="OCR is requested but pytesseract is not installed.")
 
+    try:
+        page_selection = parse_pages(pages)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid page selection: {pages}")
+
+    if extraction not in EXTRACTION_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown extraction profile: {extraction}")
+
+    out_filename = file.filename.rsplit(".", 1)[0] + ".docx"
+
     # Create temporary files for input and output
     fd_in, in_path = tempfile.mkstemp(suffix=".pdf")
     fd_out, out_path = tempfile.mkstemp(suffix=".docx")
@@ -48,21 +108,55 @@ async def convert_pdf(file: UploadFile = File(...), use_ocr: bool = Form(False))
     os.close(fd_out)
     
     try:
-        content = await file.read()
-        with open(in_path, "wb") as f:
-            f.write(content)
+        # Stream to disk, hashing on the way, instead of reading it all.
+        size, content_hash = await save_upload(
+            file, in_path, max_upload_bytes_from_env()
+        )
+        metrics.upload_bytes.observe(size)
+        metrics.temp_files.add(in_path)
+
+        cache_key = conversion_key(
+            content_hash,
+            ocr_mode,
+            format_pages(page_selection),
+            CONVERTER_VERSION,
+            EXTRACTION_PROFILES[extraction],
+        )
+        # Served from a per-request copy: eviction may remove the entry.
+        cached_path = get_conversion_cache().get(cache_key, copy_to=out_path)
+        if cached_path:
+            metrics.record_conversion("convert", ocr_mode, None, status="cached")
+            metrics.temp_files.add(out_path)
+            return FileResponse(
+                cached_path,
+                filename=out_filename,
+                background=BackgroundTask(cleanup_files, [in_path, out_path])
+            )
             
+        started = time.perf_counter()
         try:
-            if use_ocr:
-                pdf_to_word_ocr(in_path, out_path)
+            # Run off the event loop so other requests keep being served.
+            if ocr_mode == "off":
+                decision_log = await run_in_threadpool(
+                    pdf_to_word_no_ocr, in_path, out_path, pages=page_selection,
+                    extraction=extraction
+                )
             else:
-                pdf_to_word_no_ocr(in_path, out_path)
+                decision_log = await run_in_threadpool(
+                    pdf_to_word_ocr, in_path, out_path,
+                    pages=page_selection, auto=ocr_mode == "auto",
+                    extraction=extraction
+                )
         except Exception:
+            metrics.record_conversion("convert", ocr_mode, started, status="error")
             print("\n=== CONVERSION ERROR ===")
             traceback.print_exc()
             raise
-            
-        out_filename = file.filename.rsplit(".", 1)[0] + ".docx"
+
+        metrics.record_conversion("convert", ocr_mode, started, decision_log)
+        metrics.temp_files.add(out_path)
+
+        get_conversion_cache().put(cache_key, out_path)
         
         return FileResponse(
             out_path, 
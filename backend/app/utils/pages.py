@@ -0,0 +1,22 @@
+def parse_pages(pages_str):
+    if pages_str == "all":
+        return None
+
+    pages = set()
+
+    for part in pages_str.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-")
+            pages.update(range(int(start), int(end) + 1))
+        else:
+            pages.add(int(part))
+
+    return pages
+
+
+def format_pages(pages):
+    """Canonical string for a page selection (None means all pages)."""
+    if pages is None:
+        return "all"
+    return ",".join(str(p) for p in sorted(pages))
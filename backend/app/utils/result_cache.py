@@ -0,0 +1,139 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "storage",
+    "outputs",
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CACHE_SUFFIX = ".docx"
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def conversion_key(content_hash, use_ocr, pages, version, extraction):
+    """
+    Cache key for one conversion: the upload's SHA-256 plus every option
+    that changes the output. extraction is the profile's options rather
+    than its name, so changing a profile invalidates its entries.
+    """
+    raw = (
+        f"{content_hash}|ocr={use_ocr}|pages={pages}|v={version}"
+        f"|extraction={extraction}"
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ConversionCache:
+    """
+    On-disk .docx cache with size-based LRU eviction.
+
+    Entries are plain files named by key. A hit bumps the file's mtime,
+    so eviction simply removes the oldest mtimes until the directory fits
+    in `max_bytes` again.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key, copy_to=None):
+        """
+        Path of the cached .docx, or None. With copy_to, the entry is
+        copied there under the lock and copy_to is returned, so a
+        concurrent eviction cannot remove the file while it is served.
+        """
+        path = self._path(key)
+        with self._lock:
+            try:
+                os.utime(path)
+                if copy_to is not None:
+                    shutil.copyfile(path, copy_to)
+                    path = copy_to
+            except FileNotFoundError:
+                # Missing, or evicted by another process mid-copy.
+                self.misses += 1
+                return None
+            self.hits += 1
+            return path
+
+    def put(self, key, docx_path):
+        path = self._path(key)
+        # Copy next to the target, then rename: readers never see a
+        # half-written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(docx_path, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._evict()
+        return path
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def cache_from_env():
+    return ConversionCache(
+        directory=os.environ.get("PDF_CONVERTER_CACHE_DIR", DEFAULT_CACHE_DIR),
+        max_bytes=int(
+            os.environ.get("PDF_CONVERTER_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+        ),
+    )
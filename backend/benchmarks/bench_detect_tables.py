@@ -0,0 +1,164 @@
+"""
+Micro-benchmark: detect_tables on synthetic dense grids.
+
+Compares the bisect-based column clustering against the previous
+O(words x columns) scan (kept here as `legacy_detect_tables`) and checks
+that both produce identical results before timing them.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_detect_tables
+"""
+import argparse
+import random
+import time
+
+from backend.app.core.analysis import detect_tables as dt
+from backend.app.core.analysis.page_profile import PageProfile
+
+
+def legacy_detect_tables(profile):
+    """detect_tables as it was before the bisect rewrite (reference only)."""
+    words = profile.words
+    if not words:
+        return
+
+    rows = []
+    current = []
+    for w in sorted(words, key=lambda x: (x["top"], x["x0"])):
+        if not current:
+            current.append(w)
+            continue
+        if abs(w["top"] - current[-1]["top"]) <= dt.ROW_Y_THRESHOLD:
+            current.append(w)
+        else:
+            rows.append(current)
+            current = [w]
+    if current:
+        rows.append(current)
+
+    if len(rows) < dt.MIN_ROWS:
+        return
+
+    col_counts = {}
+    for row in rows:
+        seen_in_row = set()
+        for w in row:
+            x = w["x0"]
+            matched = False
+            for cx in list(col_counts.keys()):
+                if abs(x - cx) <= dt.COL_X_THRESHOLD:
+                    if cx not in seen_in_row:
+                        col_counts[cx] += 1
+                        seen_in_row.add(cx)
+                    matched = True
+                    break
+            if not matched:
+                col_counts[x] = 1
+                seen_in_row.add(x)
+
+    columns = [cx for cx, count in col_counts.items() if count >= dt.MIN_COL_REPEAT]
+    if len(columns) < 3:
+        return
+    columns.sort()
+
+    multi_cell_rows = 0
+    for row in rows:
+        hits = 0
+        for w in row:
+            for cx in columns:
+                if abs(w["x0"] - cx) <= dt.COL_X_THRESHOLD:
+                    hits += 1
+                    break
+        if hits >= 3:
+            multi_cell_rows += 1
+    if multi_cell_rows / len(rows) < dt.MIN_MULTI_CELL_ROWS_RATIO:
+        return
+
+    grid = []
+    for row in rows:
+        cells = [""] * len(columns)
+        for w in row:
+            for i, cx in enumerate(columns):
+                if abs(w["x0"] - cx) <= dt.COL_X_THRESHOLD:
+                    cells[i] += w["text"] + " "
+                    break
+        grid.append([c.strip() for c in cells])
+
+    row_widths = []
+    for row in rows:
+        if not row:
+            continue
+        row_widths.append(max(w["x1"] for w in row) - min(w["x0"] for w in row))
+    if not row_widths:
+        return
+    avg_width = sum(row_widths) / len(row_widths)
+    if max(row_widths) - min(row_widths) > avg_width * 0.6:
+        return
+
+    profile.has_table_grid = True
+    profile.table_cells = grid
+
+
+def dense_grid(rows, cols, jitter, seed, pitch=22):
+    """
+    Statement-like grid: `cols` anchored columns with jittered x0s.
+    A large pitch mimics OCR output, whose coordinates are 300 DPI pixels,
+    so many more distinct anchors fit across the page.
+    """
+    rng = random.Random(seed)
+    words = []
+    for r in range(rows):
+        for c in range(cols):
+            x0 = 30 + c * pitch + rng.uniform(-jitter, jitter)
+            top = 40 + r * 11 + rng.uniform(-1, 1)
+            words.append({
+                "text": f"r{r}c{c}",
+                "x0": x0,
+                "x1": x0 + 18,
+                "top": top,
+                "bottom": top + 8,
+            })
+    return words
+
+
+def run_once(func, words):
+    profile = PageProfile(page_number=1, words=words)
+    start = time.perf_counter()
+    func(profile)
+    elapsed = time.perf_counter() - start
+    return elapsed, (profile.has_table_grid, getattr(profile, "table_cells", None))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # (label, rows, cols, pitch, jitter)
+    cases = [
+        ("pdf 60x8", 60, 8, 22, 6),
+        ("pdf 150x20", 150, 20, 22, 6),
+        ("ocr 60x8", 60, 8, 300, 40),
+        ("ocr 150x20", 150, 20, 120, 40),
+        ("ocr 300x40", 300, 40, 60, 25),
+    ]
+    print(f"{'case':<12} {'words':>7} {'legacy ms':>10} {'bisect ms':>10} {'speedup':>8}")
+
+    for label, rows, cols, pitch, jitter in cases:
+        for seed in range(3):
+            words = dense_grid(rows, cols, jitter, seed, pitch)
+            _, expected = run_once(legacy_detect_tables, words)
+            _, actual = run_once(dt.detect_tables, words)
+            assert expected == actual, f"result mismatch on {label} seed={seed}"
+
+        words = dense_grid(rows, cols, jitter, 0, pitch)
+        legacy = min(run_once(legacy_detect_tables, words)[0] for _ in range(args.repeat))
+        fast = min(run_once(dt.detect_tables, words)[0] for _ in range(args.repeat))
+        print(
+            f"{label:<12} {len(words):>7} {legacy * 1000:>10.1f} "
+            f"{fast * 1000:>10.1f} {legacy / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Micro-benchmark: python-docx Document vs. StreamingDocument as the output
+backend.
+
+Renders the same synthetic pages (heading, list, paragraphs, a small
+table and, every few pages, a distinct page image) into each writer and
+reports wall time, the time spent in save() and how much the peak RSS
+grew. Each run happens in its own worker process; RSS rather than
+tracemalloc, because lxml allocates outside Python's allocator.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_docx_writer --pages 500 2000
+"""
+import argparse
+import io
+import os
+import random
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from docx import Document
+from PIL import Image
+
+from backend.app.converters.pdf_to_word.docx_stream import StreamingDocument
+from backend.app.converters.pdf_to_word.no_ocr import add_full_width_image
+
+
+def page_image(rng, size=(480, 620)):
+    # Flat paper with a band of noise (a photo), ~50 KB as PNG.
+    img = Image.new("L", size, 235)
+    band = Image.frombytes("L", (size[0], 100), rng.randbytes(size[0] * 100))
+    img.paste(band, (0, rng.randint(0, size[1] - 100)))
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def render_pages(doc, pages, image_every, seed=0):
+    rng = random.Random(seed)
+    for n in range(pages):
+        if image_every and n % image_every == 0:
+            add_full_width_image(doc, io.BytesIO(page_image(rng)))
+        else:
+            doc.add_heading(f"Section {n}", level=1)
+            for i in range(3):
+                doc.add_paragraph(f"Bullet {i} of page {n}", style="List Bullet")
+            for i in range(6):
+                doc.add_paragraph(f"Paragraph {i} on page {n}. " * 12)
+            table = doc.add_table(rows=4, cols=3)
+            for i in range(4):
+                for j in range(3):
+                    table.cell(i, j).text = f"r{i}c{j}"
+        doc.add_page_break()
+
+
+def _max_rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024    # KiB on Linux
+
+
+def run(writer, pages, image_every, path):
+    rss_before = _max_rss()
+    started = time.perf_counter()
+    doc = StreamingDocument(path) if writer == "streaming" else Document()
+    render_pages(doc, pages, image_every)
+    saving = time.perf_counter()
+    doc.save(path)
+    done = time.perf_counter()
+    return done - started, done - saving, _max_rss() - rss_before, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--image-every", type=int, default=5,
+                        help="Every Nth page is a page image (0: none)")
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'writer':<12} {'total s':>8} {'save s':>7} {'RSS +MB':>8} {'file MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            for writer in ("python-docx", "streaming"):
+                path = os.path.join(tmp, f"{writer}-{pages}.docx")
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    total, save, peak, size = pool.submit(
+                        run, writer, pages, args.image_every, path
+                    ).result()
+                print(
+                    f"{pages:>6} {writer:<12} {total:>8.2f} {save:>7.2f} "
+                    f"{peak / 2**20:>8.1f} {size / 2**20:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark: word extraction under each extraction profile.
+
+For every corpus document, times extract_page_words per profile (best of
+--repeat runs) and reports how many words came out, how many carry a
+font size, and how many headings analysis then finds, so each profile's
+speed can be weighed against what it lets the detectors see. For profiles
+that request word sizes, the same extraction is also timed without them:
+"size cost" is what heading detection adds to extraction time.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_extraction --pages 20
+"""
+import argparse
+import json
+import os
+import time
+
+import pdfplumber
+
+from backend.app.core.analysis.build_profile import build_page_profile
+from backend.app.core.analysis.detect_headings import detect_headings
+from backend.app.core.analysis.typography import TypographyIndex
+from backend.app.core.extraction import (
+    EXTRACTION_PROFILES,
+    extract_words,
+    extraction_options,
+)
+from backend.benchmarks.corpus import generate_corpus
+
+
+def extract_document(path, options):
+    """(seconds, words per page) for one extraction pass over `path`."""
+    with pdfplumber.open(path) as pdf:
+        pages = []
+        started = time.perf_counter()
+        for page in pdf.pages:
+            pages.append(extract_words(page, options))
+            page.close()
+        return time.perf_counter() - started, pages
+
+
+def best_of(path, options, repeat):
+    """(best seconds, words per page) over `repeat` extraction passes."""
+    seconds = None
+    for _ in range(repeat):
+        elapsed, pages = extract_document(path, options)
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    return seconds, pages
+
+
+def bench_profile(path, profile, repeat):
+    options = extraction_options(profile)
+    seconds, pages = best_of(path, options, repeat)
+
+    unsized_s = None
+    if "extra_attrs" in options:
+        unsized = {k: v for k, v in options.items() if k != "extra_attrs"}
+        unsized_s, _ = best_of(path, unsized, repeat)
+
+    profiles = [
+        build_page_profile(idx, words, [])
+        for idx, words in enumerate(pages, start=1)
+    ]
+    typography = TypographyIndex.from_profiles(profiles)
+    # Pages without words never get a paragraphs attribute.
+    headings = sum(
+        len(detect_headings(
+            getattr(profile, "paragraphs", []), profile.line_sizes, typography
+        )[0])
+        for profile in profiles
+    )
+    return {
+        "profile": profile,
+        "extract_s": seconds,
+        "unsized_extract_s": unsized_s,
+        "words": sum(len(words) for words in pages),
+        "sized_words": sum(1 for words in pages for w in words if "size" in w),
+        "headings": headings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", default="bench_corpus",
+                        help="Directory for generated PDFs (reused between runs)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10])
+    parser.add_argument("--kinds", nargs="+", default=None)
+    parser.add_argument("--profiles", nargs="+", choices=list(EXTRACTION_PROFILES),
+                        default=list(EXTRACTION_PROFILES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="Also write the results as JSON here")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'document':<22} {'profile':<11} {'extract ms':>11} {'vs first':>9} "
+        f"{'size cost':>10} {'words':>7} {'sized':>7} {'headings':>9}"
+    )
+    for path in generate_corpus(args.corpus, args.pages, args.kinds):
+        name = os.path.basename(path)
+        baseline = None
+        for profile in args.profiles:
+            row = bench_profile(path, profile, args.repeat)
+            row["document"] = name
+            results.append(row)
+
+            baseline = baseline or row["extract_s"]
+            size_cost = (
+                f"{row['extract_s'] / row['unsized_extract_s'] - 1:>+10.0%}"
+                if row["unsized_extract_s"] else f"{'-':>10}"
+            )
+            print(
+                f"{name:<22} {profile:<11} {row['extract_s'] * 1000:>11.1f} "
+                f"{row['extract_s'] / baseline:>8.2f}x {size_cost} {row['words']:>7} "
+                f"{row['sized_words']:>7} {row['headings']:>9}"
+            )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark: pair_form_rows on synthetic label/value columns.
+
+Compares the sort-and-sweep pairing against the previous O(labels x
+values) scan (kept here as `legacy_pair_form_rows`) and checks that both
+produce identical rows before timing them.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_form_pairing
+"""
+import argparse
+import random
+import time
+
+from backend.app.converters.pdf_to_word import no_ocr
+
+
+def legacy_pair_form_rows(left_lines, right_lines):
+    """pair_form_rows as it was before the sweep rewrite (reference only)."""
+    pairs = []
+    used = set()
+
+    for l_top, l_text in left_lines:
+        best = None
+        best_diff = None
+
+        for i, (r_top, r_text) in enumerate(right_lines):
+            if i in used:
+                continue
+            diff = abs(l_top - r_top)
+            if diff <= no_ocr.ROW_Y_THRESHOLD and (best_diff is None or diff < best_diff):
+                best = (i, r_text)
+                best_diff = diff
+
+        if best:
+            idx, r_text = best
+            used.add(idx)
+            pairs.append((l_text, r_text))
+        else:
+            pairs.append((l_text, ""))
+
+    return pairs
+
+
+def form_columns(rows, seed=0, pitch=14, jitter=6, missing=0.15):
+    """
+    Label and value lines of a form: values sit within `jitter` of their
+    label's top, some are missing, and a few extra values have no label.
+    """
+    rng = random.Random(seed)
+    labels, values = [], []
+    for i in range(rows):
+        top = 40 + i * pitch
+        labels.append((top, f"Field {i}:"))
+        if rng.random() >= missing:
+            values.append((top + rng.uniform(-jitter, jitter), f"value {i}"))
+        if rng.random() < missing / 3:
+            values.append((top + rng.uniform(-pitch, pitch), f"stray {i}"))
+    rng.shuffle(values)
+    return labels, values
+
+
+def run_once(fn, labels, values):
+    started = time.perf_counter()
+    result = fn(labels, values)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'legacy ms':>10} {'sweep ms':>9} {'speedup':>8}")
+    for rows in (40, 200, 1000, 5000):
+        for seed in range(3):
+            labels, values = form_columns(rows, seed)
+            assert legacy_pair_form_rows(labels, values) == no_ocr.pair_form_rows(labels, values), \
+                f"result mismatch at {rows} rows, seed={seed}"
+
+        labels, values = form_columns(rows)
+        legacy = min(run_once(legacy_pair_form_rows, labels, values)[0] for _ in range(args.repeat))
+        fast = min(run_once(no_ocr.pair_form_rows, labels, values)[0] for _ in range(args.repeat))
+        print(f"{rows:>6} {legacy * 1000:>10.1f} {fast * 1000:>9.1f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
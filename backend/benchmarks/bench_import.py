@@ -0,0 +1,111 @@
+"""
+Cold-start benchmark: how long a fresh interpreter takes to import the API
+app and the CLI, and which heavy dependencies that drags in.
+
+Each target runs in a new subprocess (so nothing is already in
+sys.modules); the best and median wall times are reported together with
+the slowest top-level imports from `python -X importtime`.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_import --repeat 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Dependencies that should only load once a conversion actually runs.
+HEAVY_MODULES = ("pdfplumber", "docx", "PIL.Image", "pytesseract")
+
+TARGETS = {
+    "api": "import backend.app.main",
+    "cli": "import backend.app.cli",
+    "converter": "import backend.app.converters.pdf_to_word.no_ocr",
+}
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def _run(code, *flags):
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=root, PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True, check=True, cwd=root, env=env
+    )
+
+
+def time_import(statement):
+    """(seconds, heavy modules loaded) for one fresh-interpreter import."""
+    out = _run(_PROBE.format(statement=statement, heavy=HEAVY_MODULES)).stdout
+    seconds, loaded = json.loads(out.strip().splitlines()[-1])
+    return seconds, loaded
+
+
+def slowest_imports(statement, top=8):
+    """
+    Direct imports of the top-level modules (the target itself, site) by
+    cumulative milliseconds, from -X importtime.
+    """
+    stderr = _run(statement, "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue    # the header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            rows.append((int(cumulative) / 1000, name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--targets", nargs="*", choices=sorted(TARGETS), default=sorted(TARGETS))
+    parser.add_argument("--out", help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.targets:
+        statement = TARGETS[name]
+        runs = [time_import(statement) for _ in range(args.repeat)]
+        times = [seconds for seconds, _ in runs]
+        results[name] = {
+            "statement": statement,
+            "best_seconds": min(times),
+            "median_seconds": statistics.median(times),
+            "heavy_modules": runs[0][1],
+            "slowest_imports": [
+                {"module": module, "ms": ms}
+                for ms, module in slowest_imports(statement)
+            ],
+        }
+
+        r = results[name]
+        print(
+            f"{name:<10} best {r['best_seconds'] * 1000:7.1f} ms   "
+            f"median {r['median_seconds'] * 1000:7.1f} ms   "
+            f"heavy: {', '.join(r['heavy_modules']) or '-'}"
+        )
+        for row in r["slowest_imports"][:4]:
+            print(f"    {row['ms']:8.1f} ms  {row['module']}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
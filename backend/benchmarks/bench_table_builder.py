@@ -0,0 +1,79 @@
+"""
+Micro-benchmark: building tables cell by cell through python-docx versus
+add_table_rows(), which writes the table XML in one pass.
+
+Checks that both produce the same cell text and column widths before
+timing them.
+
+Run from the project root:
+    python -m backend.benchmarks.bench_table_builder
+"""
+import argparse
+import time
+
+from docx import Document
+
+from backend.app.converters.pdf_to_word.docx_stream import add_table_rows
+
+
+def per_cell_table(doc, rows):
+    """The renderers' table path before add_table_rows (reference only)."""
+    table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row):
+            table.cell(i, j).text = text
+
+
+def grid(rows, cols):
+    return [[f"{i * cols + j:,}.00" for j in range(cols)] for i in range(rows)]
+
+
+def run_once(builder, rows):
+    doc = Document()
+    started = time.perf_counter()
+    builder(doc, rows)
+    elapsed = time.perf_counter() - started
+    (table,) = doc.tables
+    result = (
+        [[c.text for c in row.cells] for row in table.rows],
+        [c.width for c in table.columns],
+    )
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--large",
+        action="store_true",
+        help="Add a 150x12 table (the per-cell build takes about a minute)"
+    )
+    args = parser.parse_args()
+
+    # (label, rows, cols); "form" is what pair_form_rows produces.
+    cases = [
+        ("form 40x2", 40, 2),
+        ("table 20x5", 20, 5),
+        ("table 60x8", 60, 8),
+    ]
+    if args.large:
+        cases.append(("table 150x12", 150, 12))
+    print(f"{'case':<14} {'cells':>7} {'per-cell ms':>12} {'bulk ms':>9} {'speedup':>8}")
+
+    for label, rows, cols in cases:
+        cells = grid(rows, cols)
+        _, expected = run_once(per_cell_table, cells)
+        _, actual = run_once(add_table_rows, cells)
+        assert expected == actual, f"result mismatch on {label}"
+
+        slow = min(run_once(per_cell_table, cells)[0] for _ in range(args.repeat))
+        fast = min(run_once(add_table_rows, cells)[0] for _ in range(args.repeat))
+        print(
+            f"{label:<14} {rows * cols:>7} {slow * 1000:>12.1f} "
+            f"{fast * 1000:>9.1f} {slow / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
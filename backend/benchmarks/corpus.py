@@ -0,0 +1,232 @@
+"""
+Synthetic PDF corpus generator.
+
+Writes small, dependency-free PDFs (built-in Helvetica, optional
+grayscale image XObjects) covering the page types the converter
+distinguishes: dense prose, two-column papers, grid tables, label/value
+forms and image-only scans.
+
+Run from the project root:
+    python -m backend.benchmarks.corpus --out bench_corpus --pages 10 200 2000
+"""
+import argparse
+import os
+import random
+import zlib
+from collections import namedtuple
+
+
+PAGE_SIZE = (612, 792)
+
+# A grayscale picture placed with its top-left corner at (x, top), drawn
+# width x height points; `pixels` holds px_width * px_height bytes.
+ImageItem = namedtuple("ImageItem", "x top width height px_width px_height pixels")
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path, pages, page_size=PAGE_SIZE):
+    """
+    Write a minimal PDF.
+
+    `pages` is a list of pages; each page is a list of items, either
+    (x, top, size, text) tuples for text or ImageItem for pictures. `top`
+    is measured from the top edge like pdfplumber does.
+    """
+    width, height = page_size
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add(None)
+    pages_id = add(None)
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for items in pages:
+        ops = []
+        xobjects = []
+        for item in items:
+            if isinstance(item, ImageItem):
+                data = zlib.compress(item.pixels)
+                image_id = add(
+                    (
+                        f"<< /Type /XObject /Subtype /Image "
+                        f"/Width {item.px_width} /Height {item.px_height} "
+                        f"/ColorSpace /DeviceGray /BitsPerComponent 8 "
+                        f"/Filter /FlateDecode /Length {len(data)} >>\nstream\n"
+                    ).encode("latin-1") + data + b"\nendstream"
+                )
+                name = f"Im{len(xobjects) + 1}"
+                xobjects.append((name, image_id))
+                y = height - item.top - item.height
+                ops.append(
+                    f"q {item.width} 0 0 {item.height} {item.x} {y} cm /{name} Do Q"
+                )
+                continue
+
+            x, top, size, text = item
+            y = height - top - size
+            ops.append(f"BT /F1 {size} Tf {x} {y} Td ({_escape(text)}) Tj ET")
+
+        stream = "\n".join(ops).encode("latin-1")
+        content_id = add(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+
+        resources = f"/Font << /F1 {font_id} 0 R >>"
+        if xobjects:
+            refs = " ".join(f"/{name} {oid} 0 R" for name, oid in xobjects)
+            resources += f" /XObject << {refs} >>"
+
+        page_ids.append(add(
+            (
+                f"<< /Type /Page /Parent {pages_id} 0 R "
+                f"/MediaBox [0 0 {width} {height}] "
+                f"/Resources << {resources} >> "
+                f"/Contents {content_id} 0 R >>"
+            ).encode("latin-1")
+        ))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects[catalog_id - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode()
+    objects[pages_id - 1] = (
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += (
+        b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, catalog_id, xref_at)
+    )
+
+    with open(path, "wb") as f:
+        f.write(out)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Page generators
+# ---------------------------------------------------------------------------
+
+_VOCAB = (
+    "the quick brown fox jumps over a lazy dog while seven wizards quietly "
+    "judge boxing matches near an old harbour at dawn and every ledger "
+    "balance is carried forward to the following statement period"
+).split()
+
+
+def _sentence(rng, length):
+    return " ".join(rng.choice(_VOCAB) for _ in range(length))
+
+
+def dense_text_page(rng):
+    items = [(72, 56, 16, _sentence(rng, 4).title())]
+    for line in range(48):
+        items.append((72, 84 + line * 14, 10, _sentence(rng, rng.randint(10, 13))))
+    return items
+
+
+def two_column_page(rng):
+    items = [(72, 50, 16, _sentence(rng, 5).title())]
+    for line in range(46):
+        top = 80 + line * 14
+        items.append((72, top, 9, _sentence(rng, rng.randint(5, 7))))
+        items.append((324, top, 9, _sentence(rng, rng.randint(5, 7))))
+    return items
+
+
+def table_page(rng, rows=40, cols=6):
+    items = [(72, 40, 12, "Account Statement")]
+    for r in range(rows):
+        top = 70 + r * 17
+        items.append((40, top, 8, f"2024-{1 + r % 12:02d}-{1 + r % 28:02d}"))
+        items.append((120, top, 8, _sentence(rng, 2)))
+        for c in range(2, cols):
+            items.append((120 + c * 75, top, 8, f"{rng.uniform(-999, 9999):.2f}"))
+    return items
+
+
+def form_page(rng, fields=24):
+    items = [(72, 50, 14, "Application Form")]
+    for f in range(fields):
+        top = 90 + f * 26
+        items.append((72, top, 10, _sentence(rng, 2).title() + ":"))
+        items.append((320, top, 10, _sentence(rng, rng.randint(1, 3))))
+    return items
+
+
+def image_page(rng, px_width=200, px_height=260):
+    # Light "paper" with darker horizontal streaks, like a scanned letter.
+    rows = []
+    for y in range(px_height):
+        base = 70 if (y // 6) % 3 == 0 and 20 < y < px_height - 20 else 235
+        rows.append(bytes(
+            max(0, min(255, base + rng.randint(-12, 12))) for _ in range(px_width)
+        ))
+    pixels = b"".join(rows)
+    return [ImageItem(36, 36, 540, 720, px_width, px_height, pixels)]
+
+
+PAGE_KINDS = {
+    "dense_text": dense_text_page,
+    "two_column": two_column_page,
+    "table": table_page,
+    "form": form_page,
+    "image_only": image_page,
+}
+
+
+def make_pages(kind, count, seed=0):
+    """`count` pages of one kind, or of every kind in turn for "mixed"."""
+    rng = random.Random(seed)
+    if kind == "mixed":
+        makers = list(PAGE_KINDS.values())
+        return [makers[i % len(makers)](rng) for i in range(count)]
+    return [PAGE_KINDS[kind](rng) for _ in range(count)]
+
+
+def generate_corpus(out_dir, page_counts=(10,), kinds=None, seed=0):
+    """Write `<kind>-<pages>.pdf` for every kind and page count; returns paths."""
+    kinds = kinds or list(PAGE_KINDS) + ["mixed"]
+    os.makedirs(out_dir, exist_ok=True)
+
+    paths = []
+    for kind in kinds:
+        for count in page_counts:
+            path = os.path.join(out_dir, f"{kind}-{count}.pdf")
+            if not os.path.exists(path):
+                write_pdf(path, make_pages(kind, count, seed))
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic PDF corpus")
+    parser.add_argument("--out", default="bench_corpus")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10])
+    parser.add_argument(
+        "--kinds", nargs="+", choices=list(PAGE_KINDS) + ["mixed"], default=None
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for path in generate_corpus(args.out, args.pages, args.kinds, args.seed):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
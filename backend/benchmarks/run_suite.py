@@ -0,0 +1,273 @@
+"""
+Benchmark suite: end-to-end conversion plus per-stage analysis timings.
+
+Generates (or reuses) a synthetic corpus, then for every document times
+pdf_to_word_no_ocr, build_page_profile and each detector on its own, and
+writes the results to JSON. Pass --compare with an earlier results file
+to print per-stage ratios; --max-slowdown turns that into a gate.
+
+Run from the project root:
+    python -m backend.benchmarks.run_suite --pages 10 200 --out bench.json
+    python -m backend.benchmarks.run_suite --compare bench.json --max-slowdown 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pdfplumber
+
+from backend.app.converters.pdf_to_word import CONVERTER_VERSION
+from backend.app.converters.pdf_to_word.no_ocr import pdf_to_word_no_ocr
+from backend.app.core.analysis.build_profile import build_page_profile, bucket_lines
+from backend.app.core.analysis.detect_columns import detect_columns
+from backend.app.core.analysis.detect_headings import detect_headings
+from backend.app.core.analysis.detect_lists import detect_lists
+from backend.app.core.analysis.detect_tables import detect_tables
+from backend.app.core.analysis.line_index import LineIndex
+from backend.app.core.analysis.page_profile import PageProfile
+from backend.app.core.analysis.paragraph_merge import merge_lines_into_paragraphs
+from backend.app.core.analysis.typography import (
+    TypographyIndex,
+    line_sizes,
+    page_font_sizes,
+)
+from backend.app.core.analysis.word_array import WordArray
+from backend.app.core.extraction import (
+    DEFAULT_EXTRACTION_PROFILE,
+    EXTRACTION_PROFILES,
+    extract_page_words,
+)
+from backend.benchmarks.corpus import generate_corpus
+
+
+RESULTS_VERSION = 1
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def extract_pages(path, extraction=DEFAULT_EXTRACTION_PROFILE):
+    """Raw pdfplumber word dicts per page, extracted the way no_ocr does."""
+    with pdfplumber.open(path) as pdf:
+        pages = []
+        for page in pdf.pages:
+            pages.append(extract_page_words(page, extraction))
+            page.close()
+    return pages
+
+
+def _stage_inputs(words):
+    """Per-page inputs for each detector, prepared outside the timed region."""
+    array = WordArray.from_words(words)
+    index = LineIndex(array)
+    paragraphs = merge_lines_into_paragraphs(bucket_lines(index)) if words else []
+    _, after_lists = detect_lists(paragraphs)
+    return {
+        "words": words,
+        "array": array,
+        "lines": bucket_lines(index) if words else [],
+        "paragraphs": paragraphs,
+        "after_lists": after_lists,
+        "line_sizes": line_sizes(index),
+        "typography": TypographyIndex.from_profiles(
+            [PageProfile(page_number=1, font_sizes=page_font_sizes(array))]
+        ),
+    }
+
+
+def _table_profile(s):
+    # A new WordArray each run so the cached (top, x0) order and line
+    # groupings are rebuilt inside the timed region, as in a real run.
+    return PageProfile(page_number=1, words=WordArray.from_words(s["words"]))
+
+
+# name -> (setup, run). `setup` prepares one page's argument outside the
+# timed region; `run` is the timed call.
+STAGES = {
+    "build_page_profile": (
+        lambda s: s["words"], lambda words: build_page_profile(1, words, [])
+    ),
+    "line_index": (
+        lambda s: WordArray.from_words(s["words"]), LineIndex
+    ),
+    "detect_columns": (lambda s: s["array"], detect_columns),
+    "merge_lines_into_paragraphs": (
+        lambda s: s["lines"], merge_lines_into_paragraphs
+    ),
+    "font_sizes": (
+        # A fresh LineIndex so its line buckets are built in the timed region.
+        lambda s: LineIndex(s["array"]),
+        lambda index: (page_font_sizes(index.words), line_sizes(index))
+    ),
+    "detect_lists": (lambda s: s["paragraphs"], detect_lists),
+    "detect_headings": (
+        lambda s: s, lambda s: detect_headings(
+            s["after_lists"], s["line_sizes"], s["typography"]
+        )
+    ),
+    "detect_tables": (_table_profile, detect_tables),
+}
+
+
+def time_stages(pages, repeat):
+    """Best-of-`repeat` total seconds per stage, summed over all pages."""
+    inputs = [_stage_inputs(words) for words in pages]
+    results = {}
+
+    for name, (setup, run) in STAGES.items():
+        best = None
+        for _ in range(repeat):
+            args = [setup(s) for s in inputs]
+            start = time.perf_counter()
+            for arg in args:
+                run(arg)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+
+    return results
+
+
+def bench_document(path, repeat, workers, extraction=DEFAULT_EXTRACTION_PROFILE):
+    name = os.path.basename(path)
+    kind, _, count = name[:-len(".pdf")].rpartition("-")
+
+    start = time.perf_counter()
+    pages = extract_pages(path, extraction)
+    extract_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "out.docx")
+        convert_s = _best_of(
+            repeat,
+            lambda: pdf_to_word_no_ocr(
+                path, out, workers=workers, extraction=extraction
+            )
+        )
+
+    stages = {"extract_words": extract_s}
+    stages.update(time_stages(pages, repeat))
+
+    return {
+        "name": name,
+        "kind": kind,
+        "pages": int(count),
+        "words": sum(len(p) for p in pages),
+        "convert_s": convert_s,
+        "pages_per_s": int(count) / convert_s if convert_s else None,
+        "stages": stages,
+    }
+
+
+def compare(previous, current, max_slowdown=None):
+    """Print current/previous ratios; return the regressions over the limit."""
+    before = {doc["name"]: doc for doc in previous["documents"]}
+    regressions = []
+
+    print(f"{'document':<22} {'stage':<28} {'before ms':>10} {'after ms':>10} {'ratio':>7}")
+    for doc in current["documents"]:
+        old = before.get(doc["name"])
+        if old is None:
+            continue
+
+        rows = [("convert", old["convert_s"], doc["convert_s"])]
+        rows += [
+            (stage, old["stages"].get(stage), seconds)
+            for stage, seconds in doc["stages"].items()
+        ]
+        for stage, was, now in rows:
+            if not was or now is None:
+                continue
+            ratio = now / was
+            flag = ""
+            if max_slowdown is not None and ratio > 1 + max_slowdown:
+                regressions.append((doc["name"], stage, ratio))
+                flag = "  ⚠️"
+            print(
+                f"{doc['name']:<22} {stage:<28} {was * 1000:>10.2f} "
+                f"{now * 1000:>10.2f} {ratio:>6.2f}x{flag}"
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", default="bench_corpus",
+                        help="Directory for generated PDFs (reused between runs)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10])
+    parser.add_argument("--kinds", nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--extraction", choices=sorted(EXTRACTION_PROFILES),
+                        default=DEFAULT_EXTRACTION_PROFILE)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=None,
+                        help="Exit non-zero if any stage is this much slower (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.corpus, args.pages, args.kinds)
+
+    documents = []
+    for path in paths:
+        print(f"⏱️ {os.path.basename(path)}")
+        documents.append(
+            bench_document(path, args.repeat, args.workers, args.extraction)
+        )
+
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "converter_version": CONVERTER_VERSION,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "workers": args.workers,
+            "extraction": args.extraction,
+        },
+        "documents": documents,
+    }
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"📝 Results written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        regressions = compare(previous, results, args.max_slowdown)
+        if regressions:
+            print(f"❌ {len(regressions)} stage(s) slower than allowed")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import pytest
+
+from backend.benchmarks.corpus import write_pdf as write_text_pdf
+
+
+_VOCAB = (
+    "the quick brown fox jumps over a lazy dog while seven wizards "
+    "quietly judge boxing matches near an old harbour at dawn"
+).split()
+
+
+def _sentence(seed, length):
+    return " ".join(_VOCAB[(seed * 7 + i * 3) % len(_VOCAB)] for i in range(length))
+
+
+def sample_pages(count):
+    """Mixed prose / two-column / table pages, cycling with the page index."""
+    pages = []
+    for n in range(1, count + 1):
+        kind = n % 3
+        if kind == 0:
+            items = [
+                (72 + col * 120, 72 + row * 18, 10, f"R{row}C{col} {n}")
+                for row in range(8)
+                for col in range(4)
+            ]
+        elif kind == 1:
+            items = [(72, 60, 18, f"Section Title {n}")]
+            items += [
+                (72, 100 + line * 14, 10, _sentence(n + line, 9 + line % 4))
+                for line in range(20)
+            ]
+        else:
+            items = []
+            for line in range(20):
+                top = 72 + line * 14
+                items.append((72, top, 10, _sentence(n + line, 4 + line % 3)))
+                items.append((340, top, 10, _sentence(n * 2 + line, 4 + line % 2)))
+        pages.append(items)
+    return pages
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    return str(write_text_pdf(tmp_path / "sample.pdf", sample_pages(6)))
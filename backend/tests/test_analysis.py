@@ -0,0 +1,116 @@
+import pytest
+
+from backend.app.core.analysis.detect_tables import count_column_anchors, detect_tables
+from backend.app.core.analysis.page_profile import PageProfile
+from backend.benchmarks.bench_detect_tables import dense_grid, legacy_detect_tables
+
+
+def test_column_anchor_prefers_earliest_created():
+    # x=10 is within reach of both anchors (0 and 20); the older one wins.
+    assert count_column_anchors([[20], [0], [10]]) == {20: 2, 0: 1}
+
+
+@pytest.mark.parametrize("pitch, jitter", [(22, 6), (60, 25), (120, 40)])
+def test_detect_tables_matches_linear_scan(pitch, jitter):
+    for seed in range(3):
+        words = dense_grid(40, 10, jitter, seed, pitch)
+        expected = PageProfile(page_number=1, words=words)
+        actual = PageProfile(page_number=1, words=words)
+
+        legacy_detect_tables(expected)
+        detect_tables(actual)
+
+        assert actual.has_table_grid == expected.has_table_grid
+        assert getattr(actual, "table_cells", None) == getattr(expected, "table_cells", None)
+
+
+def test_word_array_round_trip_and_lines():
+    import pickle
+    from backend.app.core.analysis.word_array import WordArray
+
+    words = [
+        {"text": "b", "x0": 50.0, "x1": 60.0, "top": 10.5, "bottom": 18.0, "size": 9.0},
+        {"text": "a", "x0": 10.0, "x1": 20.0, "top": 10.0, "bottom": 18.0},
+        {"text": "c", "x0": 10.0, "x1": 20.0, "top": 30.0, "bottom": 38.0},
+    ]
+    wa = WordArray.from_words(words)
+
+    assert list(wa) == words
+    assert wa.sizes() == [9.0]
+    assert wa.position_order() == [1, 0, 2]
+    assert (wa.min_x0([0, 1]), wa.max_x1()) == (10.0, 60.0)
+
+    restored = pickle.loads(pickle.dumps(wa))
+    assert list(restored) == words
+
+
+def test_line_index_shares_one_sort_across_thresholds_and_subsets():
+    from backend.app.core.analysis.line_index import LineIndex
+
+    words = [
+        {"text": "right", "x0": 300.0, "x1": 340.0, "top": 11.0, "bottom": 19.0},
+        {"text": "left", "x0": 10.0, "x1": 40.0, "top": 10.0, "bottom": 18.0},
+        {"text": "next", "x0": 10.0, "x1": 40.0, "top": 14.0, "bottom": 22.0},
+    ]
+    index = LineIndex(words)
+
+    assert index.lines(2) == [[1, 0], [2]]
+    assert index.lines(8) == [[1, 0, 2]]
+    assert index.lines(2, indices=[2, 1]) == [[1], [2]]
+    assert index.buckets() == [(10, [0, 1, 2])]
+    assert index.buckets(step=5) == [(10, [0, 1]), (15, [2])]
+    assert index.text([1, 0]) == "left right"
+
+
+@pytest.mark.parametrize("pitch, jitter", [(14, 6), (8, 10), (4, 12)])
+def test_pair_form_rows_matches_nested_scan(pitch, jitter):
+    from backend.app.converters.pdf_to_word.no_ocr import pair_form_rows
+    from backend.benchmarks.bench_form_pairing import form_columns, legacy_pair_form_rows
+
+    for seed in range(5):
+        labels, values = form_columns(120, seed, pitch, jitter)
+        # Rounded tops make exact ties between candidates common.
+        values = [(round(top), text) for top, text in values]
+        assert pair_form_rows(labels, values) == legacy_pair_form_rows(labels, values)
+
+
+def test_pair_form_rows_takes_every_value_column():
+    from backend.app.converters.pdf_to_word.no_ocr import pair_form_rows
+
+    labels = [(10, "Name"), (30, "Date"), (50, "Total")]
+    first = [(31, "2024-01-02"), (11, "Ada")]
+    second = [(49, "EUR"), (200, "footer")]
+
+    assert pair_form_rows(labels, first, second) == [
+        ("Name", "Ada", ""),
+        ("Date", "2024-01-02", ""),
+        ("Total", "", "EUR"),
+    ]
+
+
+def test_typography_index_levels_sizes_against_document_body():
+    from backend.app.core.analysis.typography import MAX_HEADING_LEVELS, TypographyIndex
+
+    pages = [{10.0: 400, 24.0: 1, 12.0: 3}, {16.0: 12, 10.0: 2}, {20.0: 2, 18.0: 2}]
+    index = TypographyIndex.from_profiles(
+        PageProfile(page_number=n, font_sizes=sizes) for n, sizes in enumerate(pages, 1)
+    )
+
+    assert index.body_size == 10.0
+    assert index.heading_tiers() == [24.0, 20.0, 18.0, 16.0]
+    assert [index.heading_level(s) for s in (24.1, 20, 16, 12, 10)] == \
+        [1, 2, MAX_HEADING_LEVELS, None, None]
+    # An unseen heading size ranks among the known tiers.
+    assert index.heading_level(30) == 1
+
+
+def test_typography_index_grown_page_by_page_knows_only_pages_so_far():
+    from backend.app.core.analysis.typography import TypographyIndex
+
+    # What stream mode sees: a larger size on page 2 demotes page 1's tier.
+    index = TypographyIndex()
+    profiles = index.indexed([
+        PageProfile(page_number=1, font_sizes={10.0: 400, 16.0: 4}),
+        PageProfile(page_number=2, font_sizes={10.0: 300, 24.0: 2}),
+    ])
+    assert [index.heading_level(16) for _ in profiles] == [1, 2]
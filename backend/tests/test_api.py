@@ -31,3 +31,261 @@ def test_convert_ocr_not_installed_if_requested():
     else:
         # If HAS_OCR is True, it might fail because of invalid PDF content, but status should not be 400
         assert response.status_code != 400
+
+def test_convert_cache_hit_skips_conversion(sample_pdf, tmp_path, monkeypatch):
+    from backend.app import main
+    from backend.app.utils.result_cache import ConversionCache
+
+    monkeypatch.setattr(main, "conversion_cache", ConversionCache(str(tmp_path / "cache")))
+    with open(sample_pdf, "rb") as f:
+        payload = f.read()
+
+    first = client.post(
+        "/convert",
+        files={"file": ("sample.pdf", payload, "application/pdf")},
+        data={"use_ocr": "false", "pages": "1-2"}
+    )
+    assert first.status_code == 200
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit must not reconvert")
+
+    monkeypatch.setattr(main, "pdf_to_word_no_ocr", fail)
+    second = client.post(
+        "/convert",
+        files={"file": ("sample.pdf", payload, "application/pdf")},
+        data={"use_ocr": "false", "pages": "1-2"}
+    )
+    assert second.status_code == 200
+    assert second.content == first.content
+
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+def test_conversion_cache_evicts_least_recently_used(tmp_path):
+    from backend.app.utils.result_cache import ConversionCache
+
+    src = tmp_path / "out.docx"
+    src.write_bytes(b"x" * 100)
+    cache = ConversionCache(str(tmp_path / "cache"), max_bytes=250)
+
+    cache.put("a", str(src))
+    cache.put("b", str(src))
+    os.utime(cache._path("a"), (1, 1))
+    os.utime(cache._path("b"), (2, 2))
+    assert cache.get("a")
+    cache.put("c", str(src))
+
+    assert cache.get("a")
+    assert cache.get("b") is None
+    assert cache.get("c")
+
+def _wait_for_job(job_id, timeout=30):
+    import time
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f"/jobs/{job_id}").json()
+        if status["status"] in ("done", "failed"):
+            return status
+        time.sleep(0.05)
+    raise AssertionError("job did not finish in time")
+
+def test_job_lifecycle(sample_pdf, monkeypatch):
+    from backend.app.api import jobs
+
+    monkeypatch.setattr(jobs, "job_manager", jobs.JobManager(workers=1, queue_depth=2))
+    with open(sample_pdf, "rb") as f:
+        response = client.post(
+            "/jobs",
+            files={"file": ("sample.pdf", f.read(), "application/pdf")},
+            data={"pages": "1-3"}
+        )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    status = _wait_for_job(job_id)
+    assert status["status"] == "done"
+    assert status["pages_done"] == status["pages_total"] == 3
+
+    result = client.get(f"/jobs/{job_id}/result")
+    assert result.status_code == 200
+    assert result.content[:2] == b"PK"
+
+    assert client.get("/jobs/missing").status_code == 404
+
+def test_job_queue_full_returns_429(monkeypatch):
+    import threading
+    from backend.app.api import jobs
+
+    release = threading.Event()
+    monkeypatch.setattr(jobs, "pdf_to_word_no_ocr", lambda *a, **kw: release.wait(10) and [])
+    monkeypatch.setattr(jobs, "job_manager", jobs.JobManager(workers=1, queue_depth=1))
+
+    def submit():
+        return client.post(
+            "/jobs",
+            files={"file": ("a.pdf", b"%PDF-1.4", "application/pdf")},
+        )
+
+    try:
+        first, second, third = submit(), submit(), submit()
+        assert first.status_code == 202
+        assert second.status_code == 202
+        assert third.status_code == 429
+
+        pending = client.get(f"/jobs/{second.json()['id']}/result")
+        assert pending.status_code == 409
+    finally:
+        release.set()
+
+    assert _wait_for_job(first.json()["id"])["status"] == "done"
+
+def test_finished_jobs_expire_without_further_requests(tmp_path, monkeypatch):
+    import time
+    from backend.app.api import jobs
+
+    monkeypatch.setattr(jobs, "JOB_TTL_SECONDS", 0.05)
+    monkeypatch.setattr(jobs, "pdf_to_word_no_ocr", lambda *args, **kwargs: [])
+    manager = jobs.JobManager(workers=1, queue_depth=1)
+
+    out_path = tmp_path / "out.docx"
+    out_path.write_bytes(b"docx")
+    job = jobs.Job(
+        id="idle", filename="out.docx", ocr_mode="off", pages=None,
+        in_path=str(tmp_path / "in.pdf"), out_path=str(out_path),
+    )
+    manager.submit(job)
+
+    deadline = time.time() + 5
+    while out_path.exists() and time.time() < deadline:
+        time.sleep(0.02)
+
+    assert not out_path.exists()
+    assert "idle" not in manager.jobs
+
+def test_convert_rejects_unknown_ocr_mode():
+    response = client.post(
+        "/convert",
+        files={"file": ("test.pdf", b"%PDF-1.4...", "application/pdf")},
+        data={"use_ocr": "sometimes"}
+    )
+    assert response.status_code == 400
+
+def test_convert_rejects_unknown_extraction_profile():
+    for path in ("/convert", "/jobs"):
+        response = client.post(
+            path,
+            files={"file": ("test.pdf", b"%PDF-1.4...", "application/pdf")},
+            data={"extraction": "fastest"}
+        )
+        assert response.status_code == 400
+
+def test_metrics_track_conversions(sample_pdf, tmp_path, monkeypatch):
+    from backend.app import main
+    from backend.app.api import metrics
+    from backend.app.utils.result_cache import ConversionCache
+
+    monkeypatch.setattr(main, "conversion_cache", ConversionCache(str(tmp_path / "cache")))
+    with open(sample_pdf, "rb") as f:
+        payload = f.read()
+
+    labels = {"endpoint": "convert", "ocr_mode": "off"}
+    ok_before = metrics.conversions_total.value(status="ok", **labels)
+    cached_before = metrics.conversions_total.value(status="cached", **labels)
+    table_before = metrics.pages_total.value(mode="table", engine="text-layer")
+    temp_before = metrics.tempfile_bytes.value()
+
+    # Bytes tracked for each output .docx when its response cleans it up.
+    served = []
+    discard = metrics.temp_files.discard
+
+    def tracking_discard(path):
+        if path.endswith(".docx"):
+            served.append(metrics.temp_files._sizes.get(path, 0))
+        discard(path)
+
+    monkeypatch.setattr(metrics.temp_files, "discard", tracking_discard)
+
+    for _ in range(2):
+        response = client.post(
+            "/convert",
+            files={"file": ("sample.pdf", payload, "application/pdf")},
+            data={"use_ocr": "false", "pages": "1-3"}
+        )
+        assert response.status_code == 200
+
+    assert metrics.conversions_total.value(status="ok", **labels) == ok_before + 1
+    assert metrics.conversions_total.value(status="cached", **labels) == cached_before + 1
+    assert metrics.pages_total.value(mode="table", engine="text-layer") > table_before
+    assert metrics.tempfile_bytes.value() == temp_before
+    # The cached response's copy counts while in flight, like a fresh output.
+    assert len(served) == 2 and all(size > 0 for size in served)
+
+    scrape = client.get("/metrics")
+    assert scrape.status_code == 200
+    assert scrape.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE pdf_converter_conversion_seconds histogram" in scrape.text
+    assert 'pdf_converter_conversion_seconds_bucket{ocr_mode="off",le="+Inf"}' in scrape.text
+    assert "pdf_converter_upload_bytes_sum" in scrape.text
+
+def test_convert_rejects_oversized_upload(monkeypatch):
+    monkeypatch.setenv("PDF_CONVERTER_MAX_UPLOAD_BYTES", "1000")
+
+    for path in ("/convert", "/jobs"):
+        response = client.post(
+            path,
+            files={"file": ("big.pdf", b"%PDF-1.4" + b"0" * 5000, "application/pdf")},
+        )
+        assert response.status_code == 413
+
+def test_upload_limit_middleware_rejects_before_reading_body():
+    from fastapi import FastAPI, Request
+    from backend.app.api.uploads import MULTIPART_OVERHEAD_BYTES, UploadLimitMiddleware
+
+    small = FastAPI()
+    small.add_middleware(UploadLimitMiddleware, max_bytes=100)
+
+    @small.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    small_client = TestClient(small)
+    too_big = b"x" * (100 + MULTIPART_OVERHEAD_BYTES + 1)
+
+    assert small_client.post("/echo", content=b"x" * 50).json() == {"size": 50}
+    assert small_client.post("/echo", content=too_big).status_code == 413
+
+    def chunks():
+        for _ in range(len(too_big) // 1024 + 1):
+            yield b"x" * 1024
+
+    assert small_client.post("/echo", content=chunks()).status_code == 413
+
+def test_conversion_cache_hit_copy_survives_eviction(tmp_path):
+    from backend.app.utils.result_cache import ConversionCache
+
+    src = tmp_path / "out.docx"
+    src.write_bytes(b"x" * 100)
+    cache = ConversionCache(str(tmp_path / "cache"))
+    cache.put("a", str(src))
+
+    served = tmp_path / "served.docx"
+    assert cache.get("a", copy_to=str(served)) == str(served)
+    os.remove(cache._path("a"))
+
+    assert served.read_bytes() == b"x" * 100
+    assert cache.get("a", copy_to=str(served)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_api_import_does_not_create_cache_dir(tmp_path):
+    import subprocess
+    import sys
+
+    cache_dir = tmp_path / "cache"
+    subprocess.run(
+        [sys.executable, "-c", "import backend.app.main"],
+        check=True, env={**os.environ, "PDF_CONVERTER_CACHE_DIR": str(cache_dir)}
+    )
+    assert not cache_dir.exists()
@@ -0,0 +1,87 @@
+import json
+import os
+import shutil
+
+from backend.app import batch
+from backend.app.batch import (
+    convert_document,
+    inputs_from_dir,
+    output_path_for,
+    read_manifest,
+    run_batch,
+)
+
+
+def test_batch_converts_logs_failures_and_resumes(sample_pdf, tmp_path):
+    src = tmp_path / "in"
+    (src / "nested").mkdir(parents=True)
+    shutil.copy(sample_pdf, src / "a.pdf")
+    shutil.copy(sample_pdf, src / "nested" / "b.pdf")
+    (src / "broken.pdf").write_bytes(b"not a pdf")
+
+    out = tmp_path / "out"
+    entries = [
+        (path, output_path_for(path, str(out), str(src)))
+        for path in inputs_from_dir(str(src))
+    ]
+    error_log = str(tmp_path / "errors.jsonl")
+
+    summary = run_batch(entries, jobs=2, pages={1, 2}, error_log=error_log)
+
+    assert summary["documents"] == {"total": 3, "converted": 2, "skipped": 0, "failed": 1}
+    assert summary["pages"] == 4
+    assert os.path.exists(out / "a.docx")
+    assert os.path.exists(out / "nested" / "b.docx")
+    assert not any(name.endswith(".part") for _, _, files in os.walk(out) for name in files)
+
+    errors = [json.loads(line) for line in open(error_log)]
+    assert [e["input"] for e in errors] == [str(src / "broken.pdf")]
+
+    again = run_batch(entries, pages={1, 2})
+    assert again["documents"]["skipped"] == 2
+    assert again["documents"]["converted"] == 0
+
+    os.utime(src / "a.pdf")     # newer input -> reconverted
+    os.utime(out / "a.docx", (0, 0))
+    third = run_batch(entries, pages={1, 2})
+    assert third["documents"]["converted"] == 1
+
+
+def test_manifest_paths_are_relative_to_manifest(tmp_path):
+    manifest = tmp_path / "list.txt"
+    manifest.write_text("# nightly\nscans/one.pdf\n\nscans/two.pdf\tout/second.docx\n")
+
+    assert read_manifest(str(manifest)) == [
+        (str(tmp_path / "scans/one.pdf"), None),
+        (str(tmp_path / "scans/two.pdf"), str(tmp_path / "out/second.docx")),
+    ]
+
+
+def crash_on_marked_input(task):
+    # Module level, so worker processes can unpickle it.
+    if "crash" in os.path.basename(task["input"]):
+        os._exit(1)
+    return convert_document(task)
+
+
+def test_worker_that_dies_fails_only_its_document(sample_pdf, tmp_path, monkeypatch):
+    src = tmp_path / "in"
+    src.mkdir()
+    for name in ["a.pdf", "b.pdf", "crash.pdf", "c.pdf", "d.pdf"]:
+        shutil.copy(sample_pdf, src / name)
+
+    out = tmp_path / "out"
+    entries = [
+        (path, output_path_for(path, str(out), str(src)))
+        for path in inputs_from_dir(str(src))
+    ]
+    error_log = str(tmp_path / "errors.jsonl")
+    monkeypatch.setattr(batch, "convert_document", crash_on_marked_input)
+
+    summary = run_batch(entries, jobs=2, pages={1}, error_log=error_log)
+
+    assert summary["documents"] == {"total": 5, "converted": 4, "skipped": 0, "failed": 1}
+    assert sorted(os.listdir(out)) == ["a.docx", "b.docx", "c.docx", "d.docx"]
+    errors = [json.loads(line) for line in open(error_log)]
+    assert [e["input"] for e in errors] == [str(src / "crash.pdf")]
+    assert errors[0]["error"].startswith("BrokenProcessPool")
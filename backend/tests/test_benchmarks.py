@@ -0,0 +1,52 @@
+import pdfplumber
+
+from backend.benchmarks.bench_import import TARGETS, time_import
+from backend.benchmarks.corpus import PAGE_KINDS, generate_corpus
+from backend.benchmarks.run_suite import STAGES, compare, extract_pages, time_stages
+
+
+def test_corpus_covers_every_page_kind(tmp_path):
+    (path,) = generate_corpus(str(tmp_path), page_counts=(5,), kinds=["mixed"])
+
+    with pdfplumber.open(path) as pdf:
+        assert len(pdf.pages) == len(PAGE_KINDS)
+        counts = [
+            (len(page.extract_words()), len(page.images)) for page in pdf.pages
+        ]
+
+    kinds = dict(zip(PAGE_KINDS, counts))
+    assert kinds["image_only"] == (0, 1)
+    assert all(words > 0 and images == 0
+               for kind, (words, images) in kinds.items() if kind != "image_only")
+
+
+def test_time_stages_reports_every_stage(tmp_path):
+    (path,) = generate_corpus(str(tmp_path), page_counts=(2,), kinds=["table"])
+
+    timings = time_stages(extract_pages(path), repeat=1)
+
+    assert set(timings) == set(STAGES)
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_compare_flags_slow_stages():
+    def results(convert, tables):
+        return {"documents": [{
+            "name": "table-10.pdf",
+            "convert_s": convert,
+            "stages": {"detect_tables": tables},
+        }]}
+
+    regressions = compare(results(1.0, 0.10), results(1.05, 0.20), max_slowdown=0.2)
+
+    assert [(stage, round(ratio, 2)) for _, stage, ratio in regressions] == [
+        ("detect_tables", 2.0)
+    ]
+
+
+def test_api_and_cli_start_without_converter_dependencies():
+    _, loaded = time_import(TARGETS["api"])
+    assert loaded == []
+
+    _, loaded = time_import(TARGETS["cli"])
+    assert loaded == []
@@ -18,3 +18,575 @@ def test_ocr_fallback_logic():
         with pytest.raises(RuntimeError) as excinfo:
             pdf_to_word_ocr("any.pdf", "any.docx")
         assert "pytesseract is not installed" in str(excinfo.value)
+
+def _document_xml(docx_path):
+    import zipfile
+    with zipfile.ZipFile(docx_path) as z:
+        return z.read("word/document.xml")
+
+def test_parallel_analysis_matches_serial(sample_pdf, tmp_path):
+    import json
+    serial_docx = tmp_path / "serial.docx"
+    parallel_docx = tmp_path / "parallel.docx"
+    serial_report = tmp_path / "serial.json"
+    parallel_report = tmp_path / "parallel.json"
+
+    pdf_to_word_no_ocr(sample_pdf, str(serial_docx), str(serial_report))
+    pdf_to_word_no_ocr(
+        sample_pdf, str(parallel_docx), str(parallel_report), workers=2
+    )
+
+    assert _document_xml(serial_docx) == _document_xml(parallel_docx)
+    assert json.loads(serial_report.read_text()) == json.loads(parallel_report.read_text())
+
+def _empty_profiles(path, page_numbers):
+    # Module level, so worker processes can unpickle it.
+    from backend.app.core.analysis.build_profile import build_page_profile
+    return [build_page_profile(idx, [], []) for idx in page_numbers]
+
+def test_parallel_analysis_only_runs_a_few_chunks_ahead(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+    from backend.app.converters.pdf_to_word import no_ocr
+
+    submitted = []
+    original = ProcessPoolExecutor.submit
+
+    def submit(self, fn, path, pages):
+        submitted.append(pages)
+        return original(self, fn, path, pages)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "submit", submit)
+    profiles = no_ocr.iter_profiles_parallel(
+        "unused.pdf", range(1, 201), workers=2, chunk_fn=_empty_profiles
+    )
+
+    assert next(profiles).page_number == 1
+    ahead = 2 * no_ocr.CHUNKS_AHEAD_PER_WORKER
+    assert len(submitted) == ahead + 1
+    assert max(len(pages) for pages in submitted) <= no_ocr.MAX_CHUNK_PAGES
+    assert [p.page_number for p in profiles] == list(range(2, 201))
+
+def _late_headings_pdf(path):
+    from backend.benchmarks.corpus import make_pages, write_pdf
+
+    # Body text only on page 1; both heading sizes first appear on page 2.
+    body = [
+        [(72, 84 + line * 14, 10, text) for line, (_, _, _, text) in enumerate(page[1:])]
+        for page in make_pages("dense_text", 3, seed=3)
+    ]
+    return str(write_pdf(path, [
+        body[0],
+        [(72, 40, 18, "Annual Report"), (72, 60, 14, "First Quarter")] + body[1],
+        [(72, 60, 14, "Second Quarter")] + body[2],
+    ]))
+
+@pytest.mark.parametrize("document", ["sample", "late-headings"])
+def test_stream_mode_matches_two_pass(sample_pdf, tmp_path, document):
+    import json
+    from docx import Document
+    if document == "late-headings":
+        sample_pdf = _late_headings_pdf(tmp_path / "late.pdf")
+    batch_docx = tmp_path / "batch.docx"
+    stream_docx = tmp_path / "stream.docx"
+    batch_report = tmp_path / "batch.json"
+    stream_report = tmp_path / "stream.json"
+
+    pdf_to_word_no_ocr(sample_pdf, str(batch_docx), str(batch_report))
+    pdf_to_word_no_ocr(
+        sample_pdf, str(stream_docx), str(stream_report), stream=True
+    )
+
+    assert _document_xml(batch_docx) == _document_xml(stream_docx)
+    assert json.loads(batch_report.read_text()) == json.loads(stream_report.read_text())
+    if document == "late-headings":
+        assert [
+            (p.text, p.style.name) for p in Document(str(stream_docx)).paragraphs
+            if p.style.name.startswith("Heading")
+        ] == [
+            ("Annual Report", "Heading 1"),
+            ("First Quarter", "Heading 2"),
+            ("Second Quarter", "Heading 2"),
+        ]
+
+def test_page_cache_only_analyses_new_pages(sample_pdf, tmp_path, monkeypatch):
+    from backend.app.converters.pdf_to_word import no_ocr
+    from backend.app.core.page_cache import PageCache
+
+    cache = PageCache(str(tmp_path / "pages.sqlite3"))
+    fresh_docx = tmp_path / "fresh.docx"
+    cached_docx = tmp_path / "cached.docx"
+
+    pdf_to_word_no_ocr(sample_pdf, str(fresh_docx), pages={1, 2, 3, 4})
+
+    pdf_to_word_no_ocr(sample_pdf, str(tmp_path / "warm.docx"), pages={1, 2}, page_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    analysed = []
+    original = no_ocr.analyze_page
+    monkeypatch.setattr(
+        no_ocr, "analyze_page",
+        lambda idx, page, *args: analysed.append(idx) or original(idx, page, *args)
+    )
+    pdf_to_word_no_ocr(sample_pdf, str(cached_docx), pages={1, 2, 3, 4}, page_cache=cache)
+
+    assert analysed == [3, 4]
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert _document_xml(fresh_docx) == _document_xml(cached_docx)
+    assert cache.stats()["entries"] == 4
+    cache.close()
+
+def test_extraction_profiles_cache_separately_and_survive_prune(sample_pdf, tmp_path):
+    from backend.app.converters.pdf_to_word.no_ocr import page_cache_params
+    from backend.app.core.extraction import EXTRACTION_PROFILES
+    from backend.app.core.page_cache import PageCache
+
+    cache = PageCache(str(tmp_path / "pages.sqlite3"))
+    default_docx = tmp_path / "default.docx"
+    fonts_docx = tmp_path / "fonts.docx"
+
+    pdf_to_word_no_ocr(sample_pdf, str(default_docx), pages={1, 2}, page_cache=cache)
+    pdf_to_word_no_ocr(
+        sample_pdf, str(fonts_docx), pages={1, 2}, page_cache=cache,
+        extraction="fonts"
+    )
+
+    # Same text either way; the fonts run must not reuse text-flow pages.
+    assert _document_xml(default_docx) == _document_xml(fonts_docx)
+    assert (cache.hits, cache.misses) == (0, 4)
+    assert len(cache.stats()["param_sets"]) == 2
+
+    keep = [page_cache_params(name) for name in EXTRACTION_PROFILES]
+    assert cache.prune(keep_params=keep) == 0
+    assert cache.prune(keep_params=page_cache_params("fonts")) == 2
+    cache.close()
+
+    with pytest.raises(ValueError):
+        pdf_to_word_no_ocr(sample_pdf, str(tmp_path / "x.docx"), extraction="fastest")
+
+def _fake_ocr_words(page_image):
+    return [
+        {"text": f"word{i}", "left": 50 + (i % 6) * 90, "top": 40 + (i // 6) * 30,
+         "width": 60, "height": 12}
+        for i in range(60)
+    ]
+
+def _fake_image_to_data(page_image, output_type=None):
+    words = _fake_ocr_words(page_image)
+    return {key: [w[key] for w in words] for key in ("text", "left", "top", "width", "height")}
+
+def test_parallel_ocr_matches_serial(sample_pdf, tmp_path, monkeypatch):
+    import types
+    from backend.app.converters.pdf_to_word import ocr
+
+    fake_tesseract = types.SimpleNamespace(
+        image_to_data=_fake_image_to_data,
+        Output=types.SimpleNamespace(DICT="dict"),
+    )
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "pytesseract", fake_tesseract, raising=False)
+
+    serial_docx = tmp_path / "serial.docx"
+    parallel_docx = tmp_path / "parallel.docx"
+    ocr.pdf_to_word_ocr(sample_pdf, str(serial_docx), pages={1, 2, 3}, workers=1)
+    ocr.pdf_to_word_ocr(sample_pdf, str(parallel_docx), pages={1, 2, 3}, workers=2)
+
+    assert b"word59" in _document_xml(serial_docx)
+    assert _document_xml(serial_docx) == _document_xml(parallel_docx)
+
+def test_serial_ocr_restores_omp_thread_limit(sample_pdf, tmp_path, monkeypatch):
+    from backend.app.converters.pdf_to_word import ocr
+
+    seen = []
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(
+        ocr, "extract_words_ocr",
+        lambda img: seen.append(os.environ.get("OMP_THREAD_LIMIT")) or []
+    )
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "8")
+
+    ocr.pdf_to_word_ocr(
+        sample_pdf, str(tmp_path / "out.docx"), pages={1}, workers=1, omp_thread_limit=2
+    )
+
+    assert seen == ["2"]
+    assert os.environ["OMP_THREAD_LIMIT"] == "8"
+
+def test_parallel_ocr_crash_falls_back_to_image(sample_pdf, tmp_path, monkeypatch):
+    from backend.app.converters.pdf_to_word import ocr
+
+    def crash(page_image):
+        raise RuntimeError("tesseract died")
+
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "extract_words_ocr", crash)
+
+    out = tmp_path / "fallback.docx"
+    ocr.pdf_to_word_ocr(sample_pdf, str(out), pages={1, 2}, workers=2)
+
+    assert _document_xml(out).count(b"<pic:pic") == 2
+
+def test_ocr_crash_is_logged_and_reported(sample_pdf, tmp_path, monkeypatch, caplog, capsys):
+    from backend.app.converters.pdf_to_word import ocr
+
+    def crash(page_image):
+        raise RuntimeError("tesseract died")
+
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "extract_words_ocr", crash)
+
+    with caplog.at_level("WARNING", logger=ocr.__name__):
+        log = ocr.pdf_to_word_ocr(sample_pdf, str(tmp_path / "out.docx"), pages={1}, workers=1)
+
+    assert [r.exc_info[1].args for r in caplog.records] == [("tesseract died",)]
+    assert log[0]["reason"] == "ocr failed: RuntimeError"
+    assert capsys.readouterr().out == ""
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ocr_fallback_reuses_ocr_raster(sample_pdf, tmp_path, monkeypatch, workers):
+    import json
+    from backend.app.converters.pdf_to_word import ocr
+
+    rendered = []
+    original = ocr.PageRasterCache.get_image
+
+    def counting_get_image(self, page, page_number, resolution=300):
+        misses = self.misses
+        img = original(self, page, page_number, resolution)
+        if self.misses > misses:
+            rendered.append(page_number)
+        return img
+
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "extract_words_ocr", lambda img: [])
+    monkeypatch.setattr(ocr.PageRasterCache, "get_image", counting_get_image)
+
+    plain = tmp_path / "plain.json"
+    ocr.pdf_to_word_ocr(
+        sample_pdf, str(tmp_path / "plain.docx"), str(plain), pages={1, 2}, workers=workers
+    )
+    # Without raster_stats the report stays a list of page entries.
+    assert [e["raster"] for e in json.loads(plain.read_text())] == ["cache-hit", "cache-hit"]
+    rendered.clear()
+
+    report = tmp_path / "report.json"
+    ocr.pdf_to_word_ocr(
+        sample_pdf, str(tmp_path / "out.docx"), str(report),
+        pages={1, 2}, workers=workers, raster_stats=True
+    )
+
+    data = json.loads(report.read_text())
+    assert [e["raster"] for e in data["pages"]] == ["cache-hit", "cache-hit"]
+    # Each page is rasterised once for OCR and reused for its image page,
+    # whether the OCR ran in this process or in workers.
+    assert data["totals"]["raster_cache"] == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+    if workers == 1:
+        assert rendered == [1, 2]
+
+def test_ocr_report_not_written_when_save_fails(sample_pdf, tmp_path, monkeypatch):
+    import docx.document
+    from backend.app.converters.pdf_to_word import ocr
+
+    def fail(self, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "extract_words_ocr", lambda img: [])
+    monkeypatch.setattr(docx.document.Document, "save", fail)
+
+    report = tmp_path / "report.json"
+    with pytest.raises(OSError):
+        ocr.pdf_to_word_ocr(sample_pdf, str(tmp_path / "out.docx"), str(report), pages={1})
+    assert not report.exists()
+
+def test_auto_ocr_only_ocrs_pages_without_text_layer(tmp_path, monkeypatch):
+    import json
+    from conftest import sample_pages, write_text_pdf
+    from backend.app.converters.pdf_to_word import ocr
+
+    pdf_path = write_text_pdf(tmp_path / "mixed.pdf", [sample_pages(1)[0], []])
+    ocr_calls = []
+
+    def fake_ocr(page_image):
+        ocr_calls.append(page_image.size)
+        return [
+            {"text": f"scanned{i}", "x0": 50, "x1": 200, "top": 40 + i * 30,
+             "bottom": 52 + i * 30, "size": 12}
+            for i in range(10)
+        ]
+
+    monkeypatch.setattr(ocr, "HAS_OCR", True)
+    monkeypatch.setattr(ocr, "extract_words_ocr", fake_ocr)
+
+    report = tmp_path / "report.json"
+    out = tmp_path / "out.docx"
+    ocr.pdf_to_word_ocr(str(pdf_path), str(out), str(report), auto=True)
+
+    entries = json.loads(report.read_text())
+    assert [e["engine"] for e in entries] == ["text-layer", "ocr"]
+    assert len(ocr_calls) == 1
+    assert b"scanned9" in _document_xml(out)
+
+def test_auto_ocr_without_pytesseract_reports_image_pages(tmp_path, monkeypatch):
+    from conftest import sample_pages, write_text_pdf
+    from backend.app.converters.pdf_to_word import ocr
+
+    pdf_path = write_text_pdf(tmp_path / "mixed.pdf", [sample_pages(1)[0], []])
+    monkeypatch.setattr(ocr, "HAS_OCR", False)
+
+    log = ocr.pdf_to_word_ocr(str(pdf_path), str(tmp_path / "out.docx"), auto=True)
+
+    assert [(e["engine"], e["reason"]) for e in log][1] == ("image", "ocr unavailable")
+    assert log[0]["engine"] == "text-layer"
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_instrumented_report_has_stage_timings(sample_pdf, tmp_path, workers):
+    import json
+
+    plain_docx = tmp_path / "plain.docx"
+    timed_docx = tmp_path / "timed.docx"
+    report = tmp_path / "report.json"
+    hook_calls = []
+
+    pdf_to_word_no_ocr(sample_pdf, str(plain_docx), pages={1, 2, 3})
+    pdf_to_word_no_ocr(
+        sample_pdf, str(timed_docx), str(report), pages={1, 2, 3},
+        workers=workers, instrument="memory",
+        stage_hook=lambda page, stages: hook_calls.append((page, stages))
+    )
+
+    assert _document_xml(plain_docx) == _document_xml(timed_docx)
+
+    data = json.loads(report.read_text())
+    for entry in data["pages"]:
+        assert {"extract_words", "detect_columns", "detect_tables", "render"} <= set(entry["stages"])
+        assert all(s["seconds"] >= 0 and s["peak_bytes"] >= 0 for s in entry["stages"].values())
+
+    totals = data["totals"]
+    assert totals["pages"] == 3
+    assert "save" in totals["stages"]
+    assert [page for page, _ in hook_calls] == [1, 2, 3, None]
+
+def test_image_pages_follow_budget_and_options(tmp_path):
+    import io
+    import zipfile
+    from PIL import Image
+    from backend.app.converters.pdf_to_word.image_embed import ImageOptions
+    from backend.benchmarks.corpus import make_pages, write_pdf
+
+    scan = str(write_pdf(tmp_path / "scan.pdf", make_pages("image_only", 4)))
+
+    plain = pdf_to_word_no_ocr(scan, str(tmp_path / "plain.docx"))
+    assert all(e["image"]["dpi"] == 150 for e in plain)
+    budget = sum(e["image"]["bytes"] for e in plain) // 3
+
+    budgeted = pdf_to_word_no_ocr(
+        scan, str(tmp_path / "budget.docx"),
+        image_options=ImageOptions(budget_bytes=budget)
+    )
+    assert sum(e["image"]["bytes"] for e in budgeted) <= budget
+    assert os.path.getsize(tmp_path / "budget.docx") < os.path.getsize(tmp_path / "plain.docx")
+
+    gray = pdf_to_word_no_ocr(
+        scan, str(tmp_path / "gray.docx"),
+        image_options=ImageOptions(image_format="png", grayscale=True)
+    )
+    assert {e["image"]["format"] for e in gray} == {"png"}
+    with zipfile.ZipFile(tmp_path / "gray.docx") as z:
+        media = [n for n in z.namelist() if n.startswith("word/media/")]
+        assert media
+        assert all(Image.open(io.BytesIO(z.read(n))).mode == "L" for n in media)
+
+def test_headings_use_document_font_sizes(tmp_path):
+    from docx import Document
+    from backend.benchmarks.corpus import make_pages, write_pdf
+
+    # A 16pt title over 10pt body text.
+    prose = make_pages("dense_text", 1)[0]
+    titles = ["Quarterly Results", "Regional Summary", "Outlook And Risks", "Board Members"]
+    pdf_path = write_pdf(tmp_path / "headings.pdf", [
+        prose,
+        # Mostly headings: on its own, this page's body size would be 14pt.
+        [(72, 60 + i * 60, 14, title) for i, title in enumerate(titles)]
+        + [(72, 320, 10, "figures are unaudited and subject to change")],
+    ])
+
+    def headings(extraction):
+        out = tmp_path / f"{extraction}.docx"
+        pdf_to_word_no_ocr(str(pdf_path), str(out), extraction=extraction)
+        return [
+            (p.text, p.style.name) for p in Document(str(out)).paragraphs
+            if p.style.name.startswith("Heading")
+        ]
+
+    expected = [(prose[0][3], "Heading 1")] + [(t, "Heading 2") for t in titles]
+    assert headings("text-flow") == expected     # the default profile
+    assert headings("fonts") == expected
+
+    # Without font sizes nothing can be told apart from body text.
+    assert headings("positional") == []
+
+@pytest.mark.parametrize("writer", ["python-docx", "streaming"])
+def test_repeated_and_blank_scans_share_or_skip_images(tmp_path, monkeypatch, writer):
+    import io
+    import re
+    import zipfile
+    from docx import Document
+    from backend.app.converters.pdf_to_word.image_embed import ImageEmbedder
+    from backend.benchmarks.corpus import ImageItem, make_pages, write_pdf
+
+    letterhead = make_pages("image_only", 1)[0]
+    blank = [ImageItem(36, 36, 540, 720, 100, 130, b"\xff" * (100 * 130))]
+    scan = write_pdf(
+        tmp_path / "batch.pdf",
+        [letterhead, blank, letterhead, make_pages("image_only", 1, seed=7)[0], letterhead]
+    )
+
+    embedders = []
+    original = ImageEmbedder.__init__
+
+    def init(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        embedders.append(self)
+
+    monkeypatch.setattr(ImageEmbedder, "__init__", init)
+    out = tmp_path / "batch.docx"
+    log = pdf_to_word_no_ocr(str(scan), str(out), writer=writer)
+
+    # Repeats re-use the placed picture; no encoded bytes are kept around.
+    (embedder,) = embedders
+    assert len(embedder._pictures) == 2
+    assert not any(
+        isinstance(picture, (bytes, io.BytesIO))
+        for picture, _ in embedder._pictures.values()
+    )
+
+    images = [e["image"] for e in log]
+    assert images[1] == {"format": "blank", "bytes": 0}
+    assert images[2]["duplicate_of"] == 1 and images[2]["bytes"] == 0
+    assert images[4]["duplicate_of"] == 1
+    assert images[3]["bytes"] > 0 and "duplicate_of" not in images[3]
+
+    with zipfile.ZipFile(out) as z:
+        media = [n for n in z.namelist() if n.startswith("word/media/")]
+    assert len(media) == 2
+    assert _document_xml(out).count(b"<pic:pic") == 4
+    shape_ids = re.findall(rb'<wp:docPr id="(\d+)"', _document_xml(out))
+    assert len(set(shape_ids)) == 4
+    assert len(Document(str(out)).inline_shapes) == 4
+
+def test_triage_sends_pages_without_text_straight_to_images(tmp_path):
+    from backend.benchmarks.corpus import make_pages, write_pdf
+
+    scan = make_pages("image_only", 1)[0]
+    text = make_pages("dense_text", 1)[0]
+    pdf_path = write_pdf(tmp_path / "triage.pdf", [text, scan, [], text + scan])
+
+    log = pdf_to_word_no_ocr(str(pdf_path), str(tmp_path / "out.docx"), instrument="time")
+
+    triage = [e["triage"] for e in log]
+    assert [t["kind"] for t in triage] == ["text", "image-only", "empty", "mixed"]
+    assert triage[1]["chars"] == 0 and triage[1]["images"] == 1
+    assert 0.5 < triage[1]["image_coverage"] <= 1
+    assert triage[0]["image_coverage"] == 0.0
+
+    # Only pages with a text layer pay for word extraction and analysis.
+    assert ["extract_words" in e["stages"] for e in log] == [True, False, False, True]
+    assert all("triage" in e["stages"] for e in log)
+    assert [e.get("raster") for e in log] == [None, "rendered", "rendered", None]
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_streaming_writer_matches_python_docx(tmp_path, stream):
+    from docx import Document
+    from backend.benchmarks.corpus import ImageItem, make_pages, write_pdf
+
+    # Black and white bands: line art, which "auto" encodes as PNG.
+    bands = b"".join((b"\x00" if (y // 20) % 2 else b"\xff") * 100 for y in range(130))
+    line_art = [ImageItem(36, 36, 540, 720, 100, 130, bands)]
+    pdf_path = write_pdf(
+        tmp_path / "mixed.pdf",
+        make_pages("mixed", 5) + make_pages("image_only", 1) + [line_art]
+        + make_pages("dense_text", 1)
+    )
+    dom_path = tmp_path / "dom.docx"
+    streamed_path = tmp_path / "streamed.docx"
+
+    dom_log = pdf_to_word_no_ocr(str(pdf_path), str(dom_path), stream=stream)
+    streamed_log = pdf_to_word_no_ocr(
+        str(pdf_path), str(streamed_path), stream=stream, writer="streaming"
+    )
+    assert streamed_log == dom_log
+    assert {"jpeg", "png"} <= {e["image"]["format"] for e in dom_log if "image" in e}
+
+    def summary(path):
+        doc = Document(str(path))
+        return {
+            "paragraphs": [(p.style.name, p.text) for p in doc.paragraphs],
+            "tables": [[[c.text for c in row.cells] for row in t.rows] for t in doc.tables],
+            "pictures": [(s.width, s.height) for s in doc.inline_shapes],
+            "media": sorted(
+                len(r.target_part.blob) for r in doc.part.rels.values()
+                if r.reltype.endswith("/image")
+            ),
+        }
+
+    assert summary(streamed_path) == summary(dom_path)
+    assert _document_xml(streamed_path).count(b'<w:br w:type="page"/>') == 8
+
+def test_streaming_writer_removes_partial_output(sample_pdf, tmp_path, monkeypatch):
+    from backend.app.converters.pdf_to_word import no_ocr
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(no_ocr, "render_page_profile", boom)
+    out = tmp_path / "out.docx"
+    with pytest.raises(RuntimeError):
+        pdf_to_word_no_ocr(sample_pdf, str(out), stream=True, writer="streaming")
+    assert not out.exists()
+
+def test_bulk_table_matches_per_cell_table():
+    from docx import Document
+    from backend.app.converters.pdf_to_word.docx_stream import add_table_rows
+
+    rows = [[f"r{i}c{j} & <x>" for j in range(8)] for i in range(60)]
+    rows[5][3] = ""
+    rows.append(["short", "row"])
+
+    per_cell = Document()
+    table = per_cell.add_table(rows=len(rows), cols=8)
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row):
+            table.cell(i, j).text = text
+
+    bulk = Document()
+    bulk.add_paragraph("before")
+    add_table_rows(bulk, rows)
+
+    def cells(doc):
+        (t,) = doc.tables
+        return [[c.text for c in row.cells] for row in t.rows], [c.width for c in t.columns]
+
+    assert cells(bulk) == cells(per_cell)
+    assert bulk.element.body[-1].tag.endswith("sectPr")
+
+def test_form_page_with_three_columns_renders_as_table():
+    from docx import Document
+    from backend.app.converters.pdf_to_word.no_ocr import render_page_profile
+    from backend.app.core.analysis.page_profile import PageProfile
+    from backend.app.core.analysis.word_array import WordArray
+
+    words = []
+    rows = [("Shipping weight:", "12", "kilograms"), ("Parcel height:", "180", "centimetres")]
+    for i, (label, value, unit) in enumerate(rows):
+        top = 100 + i * 20
+        for x0, text in ((72, label), (250, value), (400, unit)):
+            words.append({"text": text, "x0": x0, "x1": x0 + 40, "top": top + i, "bottom": top + 10})
+
+    profile = PageProfile(page_number=1, words=WordArray.from_words(words))
+    profile.detected_mode = "form"
+
+    doc = Document()
+    render_page_profile(doc, None, profile, [])
+
+    (table,) = doc.tables
+    assert [[c.text for c in row.cells] for row in table.rows] == [list(r) for r in rows]